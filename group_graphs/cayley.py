@@ -0,0 +1,119 @@
+from collections import namedtuple
+try:
+    from .group_graphs import FrozenWord
+    from .rewriting import RewritingSystem
+except ImportError:
+    from group_graphs import FrozenWord
+    from rewriting import RewritingSystem
+
+
+Vertex = namedtuple('Vertex', ['index', 'word', 'distance'])
+Vertex.__doc__ = """ A group element, numbered in order of discovery """
+
+Edge = namedtuple('Edge', ['source', 'target', 'generator'])
+Edge.__doc__ = """ An edge source -> source*generator between vertex indices """
+
+
+class CayleyGraphBuilder:
+    """ Breadth-first enumeration of a Cayley graph from the identity
+        
+        Vertices are FrozenWords in the generators and their inverses. Two
+        words are the same vertex when normalize maps them to the same
+        word; the default (free reduction, as done by extending words)
+        gives the Cayley graph of the free group. A hook that returns a
+        canonical word for each group element (e.g. a rewriting system)
+        gives the Cayley graph of the group it normalizes for.
+        
+        Visited vertices are kept in a hash index keyed by their canonical
+        FrozenWord; a neighbor shares all but its last power with the word
+        it extends, so memory is bounded by max_vertices.
+    """
+    
+    def __init__(self, generators, normalize=None, max_vertices=None):
+        """ generators -- list of generator names
+            normalize -- function FrozenWord -> canonical Word or
+                FrozenWord (default: none)
+            max_vertices -- stop once this many vertices are found
+        """
+        
+        self.generators = list(generators)
+        self.normalize = normalize
+        self.max_vertices = max_vertices
+        self.index = {}
+        self.truncated = False
+    
+    @classmethod
+    def from_presentation(cls, generators, relators, max_rules=500, max_vertices=None):
+        """ Builder for the group <generators | relators>, normalizing
+            with a completed RewritingSystem (kept as .rewriting)
+            
+            If completion stops at max_rules, words equal in the group may
+            still be distinct vertices; check rewriting.confluent.
+        """
+        
+        rewriting = RewritingSystem(generators, relators, max_rules=max_rules)
+        builder = cls(generators, rewriting.normalize, max_vertices)
+        builder.rewriting = rewriting
+        return builder
+    
+    def canonical(self, word):
+        if self.normalize:
+            return FrozenWord.from_word(self.normalize(word))
+        return word
+    
+    def _add_vertex(self, word):
+        index = len(self.index)
+        self.index[word] = index
+        return index
+    
+    def bfs(self, radius=None):
+        """ Generate the vertices within radius of the identity and the
+            edges between them, as Vertex and Edge tuples
+            
+            A vertex is generated before any edge that uses it; each edge
+            v -> vx (x a generator) is generated once, while v is
+            expanded. Stops early, setting truncated, if max_vertices is
+            reached. Without a radius, runs until the graph is exhausted
+            (which requires a finite group and a normalize hook).
+        """
+        
+        self.index = {}
+        self.truncated = False
+        identity = self.canonical(FrozenWord())
+        self._add_vertex(identity)
+        yield Vertex(0, identity, 0)
+        
+        layer = [(0, identity)]
+        distance = 0
+        while layer:
+            expand = radius is None or distance < radius
+            next_layer = []
+            for source, word in layer:
+                for x in self.generators:
+                    for n in (1, -1):
+                        neighbor = self.canonical(word.copy_extend_right(x, n))
+                        target = self.index.get(neighbor)
+                        if target is None:
+                            if not expand:
+                                continue
+                            if self.max_vertices and len(self.index) >= self.max_vertices:
+                                self.truncated = True
+                                return
+                            target = self._add_vertex(neighbor)
+                            next_layer.append((target, neighbor))
+                            yield Vertex(target, neighbor, distance + 1)
+                        if n == 1:
+                            yield Edge(source, target, x)
+            layer = next_layer
+            distance += 1
+    
+    def build(self, radius=None):
+        """ Run bfs; return (list of vertex words, list of Edges) """
+        
+        words, edges = [], []
+        for item in self.bfs(radius):
+            if isinstance(item, Vertex):
+                words.append(item.word)
+            else:
+                edges.append(item)
+        return words, edges
@@ -0,0 +1,306 @@
+import json
+import mmap
+from array import array
+import numpy as np
+try:
+    from .group_graphs import FrozenWord
+    from .cayley import Vertex, Edge
+except ImportError:
+    from group_graphs import FrozenWord
+    from cayley import Vertex, Edge
+
+
+""" File format: MAGIC, the header length as a little-endian uint64, a JSON
+    header, then each array's raw little-endian bytes at an ALIGNMENT-byte
+    boundary; the header records each array's dtype, offset (from the end
+    of the header) and length
+"""
+MAGIC = b'CAYCSR01'
+ALIGNMENT = 64
+
+
+class CSRGraph:
+    """ A Cayley (or coset) graph in compressed sparse row form
+        
+        The edges leaving vertex v are targets[offsets[v]:offsets[v+1]],
+        labelled by generators[labels[...]]. Optionally the word of each
+        vertex is stored the same way, as letters word_letters[
+        word_offsets[v]:word_offsets[v+1]] coded 2i for generators[i] and
+        2i + 1 for its inverse.
+        
+        Arrays loaded with load(path) are read-only views of a memory map,
+        so reopening a graph costs no more than reading its header.
+    """
+    
+    ARRAYS = ('offsets', 'targets', 'labels', 'word_offsets', 'word_letters')
+    
+    def __init__(self, generators, offsets, targets, labels,
+                 word_offsets=None, word_letters=None):
+        self.generators = list(generators)
+        self.offsets = offsets
+        self.targets = targets
+        self.labels = labels
+        self.word_offsets = word_offsets
+        self.word_letters = word_letters
+    
+    def __repr__(self):
+        return f'<CSRGraph: { self.n_vertices } vertices, { self.n_edges } edges>'
+    
+    @property
+    def n_vertices(self):
+        return len(self.offsets) - 1
+    
+    @property
+    def n_edges(self):
+        return len(self.targets)
+    
+    def neighbors(self, v):
+        """ Return (targets, labels) arrays of the edges leaving v """
+        
+        start, end = self.offsets[v], self.offsets[v + 1]
+        return self.targets[start:end], self.labels[start:end]
+    
+    def word(self, v):
+        """ Return the FrozenWord of vertex v (None if words are not stored) """
+        
+        if self.word_offsets is None:
+            return None
+        word = FrozenWord()
+        start, end = self.word_offsets[v], self.word_offsets[v + 1]
+        for letter in self.word_letters[start:end].tolist():
+            word = word.copy_extend_right(
+                self.generators[letter >> 1], -1 if letter & 1 else 1
+            )
+        return word
+    
+    def edges(self):
+        """ Generate the edges as Edge tuples, by source """
+        
+        sources = np.repeat(np.arange(self.n_vertices), np.diff(self.offsets))
+        for source, target, label in zip(
+            sources.tolist(), self.targets.tolist(), self.labels.tolist()
+        ):
+            yield Edge(source, target, self.generators[label])
+    
+    """ Conversion """
+    
+    @staticmethod
+    def _index_dtype(n):
+        return np.int32 if n < 2**31 else np.int64
+    
+    @staticmethod
+    def _label_dtype(n):
+        return np.uint8 if n <= 256 else np.int32
+    
+    @classmethod
+    def from_edge_arrays(cls, generators, n_vertices, sources, targets, labels,
+                         words=None):
+        """ Build from parallel arrays of edge sources, targets and label
+            indices (in any order) and optionally a list of vertex words
+        """
+        
+        sources = np.asarray(sources, dtype=np.int64)
+        order = np.argsort(sources, kind='stable')
+        counts = np.bincount(sources, minlength=n_vertices)
+        offsets = np.zeros(n_vertices + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        graph = cls(
+            generators,
+            offsets,
+            np.asarray(targets)[order].astype(cls._index_dtype(n_vertices)),
+            np.asarray(labels)[order].astype(cls._label_dtype(len(generators))),
+        )
+        if words is not None:
+            graph._set_words(words)
+        return graph
+    
+    def _set_words(self, words):
+        codes = {x: i for i, x in enumerate(self.generators)}
+        lengths = array('q')
+        letters = array('q')
+        for word in words:
+            start = len(letters)
+            letters.extend(
+                2*codes[x] + (0 if n > 0 else 1) for x, n in word.flattened()
+            )
+            lengths.append(len(letters) - start)
+        self.word_offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(np.frombuffer(lengths, dtype=np.int64), out=self.word_offsets[1:])
+        self.word_letters = np.frombuffer(letters, dtype=np.int64).astype(
+            self._label_dtype(2*len(self.generators))
+        )
+    
+    @classmethod
+    def from_cayley(cls, generators, words, edges):
+        """ Build from the (words, edges) returned by CayleyGraphBuilder.build """
+        
+        codes = {x: i for i, x in enumerate(generators)}
+        sources = np.fromiter((e.source for e in edges), np.int64, len(edges))
+        targets = np.fromiter((e.target for e in edges), np.int64, len(edges))
+        labels = np.fromiter(
+            (codes[e.generator] for e in edges), np.int64, len(edges)
+        )
+        return cls.from_edge_arrays(
+            generators, len(words), sources, targets, labels, words
+        )
+    
+    @classmethod
+    def from_builder(cls, builder, radius=None, store_words=True):
+        """ Run builder.bfs(radius), storing edges as they are generated
+            rather than as a list of Edge tuples
+        """
+        
+        codes = {x: i for i, x in enumerate(builder.generators)}
+        sources, targets, labels = array('q'), array('q'), array('q')
+        words = [] if store_words else None
+        n_vertices = 0
+        for item in builder.bfs(radius):
+            if isinstance(item, Vertex):
+                n_vertices += 1
+                if store_words:
+                    words.append(item.word)
+            else:
+                sources.append(item.source)
+                targets.append(item.target)
+                labels.append(codes[item.generator])
+        return cls.from_edge_arrays(
+            builder.generators, n_vertices,
+            np.frombuffer(sources, dtype=np.int64),
+            np.frombuffer(targets, dtype=np.int64),
+            np.frombuffer(labels, dtype=np.int64),
+            words
+        )
+    
+    @classmethod
+    def from_adjacency(cls, generators, adjacency, words=None):
+        """ Build from an (n_vertices, generators) array of targets, as
+            returned by ToddCoxeter.adjacency
+        """
+        
+        adjacency = np.asarray(adjacency)
+        n, k = adjacency.shape
+        graph = cls(
+            generators,
+            np.arange(0, n*k + 1, k, dtype=np.int64),
+            adjacency.ravel().astype(cls._index_dtype(n)),
+            np.tile(np.arange(k), n).astype(cls._label_dtype(k)),
+        )
+        if words is not None:
+            graph._set_words(words)
+        return graph
+    
+    @classmethod
+    def from_todd_coxeter(cls, enumeration, store_words=True):
+        """ Build from a ToddCoxeter enumeration (running it if needed) """
+        
+        words, adjacency = enumeration.build()
+        return cls.from_adjacency(
+            enumeration.generators, adjacency, words if store_words else None
+        )
+    
+    """ Analysis """
+    
+    def distances(self, source=0):
+        """ Return the int64 array of word-metric distances from source
+            (edges followed in both directions; -1 where unreachable)
+        """
+        
+        n = self.n_vertices
+        sources = np.repeat(np.arange(n), np.diff(self.offsets))
+        targets = np.asarray(self.targets, dtype=np.int64)
+        # Reverse edges in CSR form, to step along inverse generators
+        order = np.argsort(targets, kind='stable')
+        reverse_offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(targets, minlength=n), out=reverse_offsets[1:])
+        reverse_targets = sources[order]
+        
+        distance = np.full(n, -1, dtype=np.int64)
+        distance[source] = 0
+        frontier = np.array([source])
+        d = 0
+        while len(frontier):
+            d += 1
+            neighbors = np.concatenate([
+                _gather(self.offsets, targets, frontier),
+                _gather(reverse_offsets, reverse_targets, frontier),
+            ])
+            neighbors = np.unique(neighbors)
+            frontier = neighbors[distance[neighbors] < 0]
+            distance[frontier] = d
+        return distance
+    
+    def growth_series(self, source=0):
+        """ Return the number of vertices at each distance from source """
+        
+        distance = self.distances(source)
+        return np.bincount(distance[distance >= 0])
+    
+    """ Storage """
+    
+    def save(self, path):
+        """ Write the graph in the memory-mappable CSR file format """
+        
+        arrays = {
+            name: np.ascontiguousarray(getattr(self, name)).astype(
+                getattr(self, name).dtype.newbyteorder('<')
+            )
+            for name in self.ARRAYS if getattr(self, name) is not None
+        }
+        header = {'generators': self.generators, 'arrays': {}}
+        # Array offsets are recorded relative to the first aligned byte
+        # after the header, so they do not depend on its length
+        position = 0
+        for name, a in arrays.items():
+            header['arrays'][name] = [a.dtype.str, position, len(a)]
+            position += -(-a.nbytes // ALIGNMENT)*ALIGNMENT
+        text = json.dumps(header).encode()
+        start = -(-(len(MAGIC) + 8 + len(text)) // ALIGNMENT)*ALIGNMENT
+        text = text.ljust(start - len(MAGIC) - 8)
+        with open(path, 'wb') as f:
+            f.write(MAGIC)
+            f.write(len(text).to_bytes(8, 'little'))
+            f.write(text)
+            for name, a in arrays.items():
+                f.seek(start + header['arrays'][name][1])
+                f.write(a.tobytes())
+            f.truncate(start + position)
+    
+    @classmethod
+    def load(cls, path, mmap_mode=True):
+        """ Open a graph saved with save
+            
+            With mmap_mode, arrays are read-only views of a memory map of
+            the file, paged in as they are used; otherwise they are read
+            into memory.
+        """
+        
+        with open(path, 'rb') as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f'{ path } is not a CSR graph file')
+            length = int.from_bytes(f.read(8), 'little')
+            header = json.loads(f.read(length))
+            start = len(MAGIC) + 8 + length
+            if mmap_mode:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                f.seek(0)
+                buffer = f.read()
+        arrays = {
+            name: np.frombuffer(
+                buffer, dtype=np.dtype(dtype), count=count, offset=start + offset
+            )
+            for name, (dtype, offset, count) in header['arrays'].items()
+        }
+        return cls(header['generators'], **arrays)
+
+
+def _gather(offsets, targets, vertices):
+    """ Concatenation of targets[offsets[v]:offsets[v+1]] over vertices """
+    
+    starts, ends = offsets[vertices], offsets[vertices + 1]
+    counts = ends - starts
+    if not counts.sum():
+        return np.zeros(0, dtype=np.int64)
+    # Index of each gathered entry: its row start plus its place in the row
+    steps = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    return targets[np.repeat(starts, counts) + steps]
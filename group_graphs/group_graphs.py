@@ -102,4 +102,139 @@ class Word:
         
         word = self.copy()
         word.extend_right(Power(x, n))
-        return word
\ No newline at end of file
+        return word
+
+class FrozenWord:
+    """ An immutable word, stored as its last power and the word before it
+        
+        Extending on the right makes a new word that shares all but its
+        last power with its parent, in O(1). Words are hashable, with hash
+        and length cached, so they can be used as dict and set keys. Adjacent
+        powers of the same generator are always combined, and zero powers
+        dropped, so equal words have equal structure.
+    """
+    
+    __slots__ = ('prefix', 'x', 'n', '_length', '_hash')
+    
+    def __init__(self, prefix=None, x=None, n=0):
+        """ Use FrozenWord() for the identity; build other words with
+            copy_extend_right, fromList or from_word
+        """
+        
+        set_field = object.__setattr__
+        set_field(self, 'prefix', prefix)
+        set_field(self, 'x', x)
+        set_field(self, 'n', n)
+        if prefix is None:
+            set_field(self, '_length', abs(n))
+            set_field(self, '_hash', hash((x, n)))
+        else:
+            set_field(self, '_length', prefix._length + abs(n))
+            set_field(self, '_hash', hash((prefix._hash, x, n)))
+    
+    def __setattr__(self, name, value):
+        raise AttributeError(f'FrozenWord is immutable; cannot set { name }')
+    
+    def __delattr__(self, name):
+        raise AttributeError(f'FrozenWord is immutable; cannot delete { name }')
+    
+    def __repr__(self):
+        return f'<FrozenWord: { str(self) }>'
+    
+    def __str__(self):
+        return ''.join(f'{ x }{ n }' for x, n in self.power_tuples()) or '1'
+    
+    def __len__(self):
+        return self._length
+    
+    def __hash__(self):
+        return self._hash
+    
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if not isinstance(other, FrozenWord):
+            return NotImplemented
+        while self is not other:
+            if self is None or other is None:
+                return False
+            if (
+                self._hash != other._hash or self.x != other.x
+                or self.n != other.n or self._length != other._length
+            ):
+                return False
+            self, other = self.prefix, other.prefix
+        return True
+    
+    def __lt__(self, other):
+        if len(self) != len(other):
+            return len(self) < len(other)
+        for sp, op in zip(self.powers, other.powers):
+            if sp != op:
+                return sp < op
+        return False
+    
+    def power_tuples(self):
+        """ Return list of (generator, exponent) of the powers, left to right """
+        
+        powers = []
+        word = self
+        while word is not None and word.x is not None:
+            powers.append((word.x, word.n))
+            word = word.prefix
+        powers.reverse()
+        return powers
+    
+    @property
+    def powers(self):
+        """ List of (new) Powers, as in Word.powers """
+        
+        return [Power(x, n) for x, n in self.power_tuples()]
+    
+    def flattened(self):
+        """ Return a representation of the word as a list tuples
+            (generator, exponent) where exponent is 1 or -1
+        """
+        
+        return [t for p in self.powers for t in p.flattened()]
+    
+    @classmethod
+    def fromList(cls, arr):
+        """ Build word from list of (x, n) tuples """
+        
+        word = cls()
+        for x, n in arr:
+            word = word.copy_extend_right(x, n)
+        return word
+    
+    @classmethod
+    def from_word(cls, word):
+        """ Build from a Word (or return a FrozenWord unchanged) """
+        
+        if isinstance(word, FrozenWord):
+            return word
+        return cls.fromList((p.x, p.n) for p in word.powers)
+    
+    def to_word(self):
+        """ Return an equal (mutable) Word """
+        
+        return Word(self.powers)
+    
+    def copy(self):
+        """ Immutable, so a copy is the word itself """
+        
+        return self
+    
+    def copy_extend_right(self, x, n):
+        """ Return the word extended on the right by x^n """
+        
+        if n == 0:
+            return self
+        if self.x is None:
+            return FrozenWord(None, x, n)
+        if self.x != x:
+            return FrozenWord(self, x, n)
+        n += self.n
+        if n == 0:
+            return self.prefix if self.prefix is not None else FrozenWord()
+        return FrozenWord(self.prefix, x, n)
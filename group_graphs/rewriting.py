@@ -0,0 +1,227 @@
+class RewritingSystem:
+    """ A string rewriting system for a group presentation
+        
+        Words are sequences of letters (x, 1) or (x, -1); internally the
+        letters of generator number i are coded 2i and 2i + 1, which is
+        also their order (x < x^-1 < y < y^-1 < ...). Rules lhs -> rhs
+        have lhs greater than rhs in shortlex order, so rewriting
+        terminates. Starting from free cancellation and relator -> 1,
+        complete runs a bounded Knuth-Bendix completion; when it finishes
+        (confluent is True), every group element has exactly one
+        irreducible word, its shortlex normal form.
+        
+        Rule left-hand sides are indexed by an Aho-Corasick automaton, so
+        reducing a word is linear in its length plus the total length of
+        the rewrites.
+    """
+    
+    def __init__(self, generators, relators=(), max_rules=500, complete=True):
+        """ generators -- list of generator names
+            relators -- Words (or FrozenWords) equal to the identity
+            max_rules -- completion stops, unfinished, past this many rules
+            complete -- run completion now
+        """
+        
+        self.generators = list(generators)
+        self._codes = {x: i for i, x in enumerate(self.generators)}
+        self.max_rules = max_rules
+        self.rules = {}
+        self.confluent = False
+        self._automaton = None
+        for letter in range(2*len(self.generators)):
+            self.rules[(letter, letter ^ 1)] = ()
+        for relator in relators:
+            self.add_rule(self.encode(relator), ())
+        if complete:
+            self.complete()
+    
+    def __repr__(self):
+        return f'<RewritingSystem: { len(self.rules) } rules>'
+    
+    def encode(self, word):
+        """ Letter codes of a Word or FrozenWord """
+        
+        codes = self._codes
+        return tuple(
+            2*codes[x] + (0 if n > 0 else 1) for x, n in word.flattened()
+        )
+    
+    def decode(self, letters):
+        """ List of (x, n) powers, adjacent letters combined """
+        
+        powers = []
+        for letter in letters:
+            x, n = self.generators[letter >> 1], -1 if letter & 1 else 1
+            if powers and powers[-1][0] == x:
+                powers[-1] = (x, powers[-1][1] + n)
+            else:
+                powers.append((x, n))
+        return powers
+    
+    @staticmethod
+    def shortlex_greater(u, v):
+        return len(u) > len(v) or (len(u) == len(v) and u > v)
+    
+    """ Reduction """
+    
+    def _build_automaton(self):
+        """ Build the Aho-Corasick automaton of the rule left-hand sides
+            
+            delta[state][letter] is the next state (failure links already
+            followed) and match[state] is a rule (lhs, rhs) whose lhs ends
+            the text read so far, or None.
+        """
+        
+        alphabet = 2*len(self.generators)
+        delta = [[0]*alphabet]
+        match = [None]
+        depth = [0]
+        for lhs, rhs in self.rules.items():
+            state = 0
+            for letter in lhs:
+                if not delta[state][letter]:
+                    delta[state][letter] = len(delta)
+                    delta.append([0]*alphabet)
+                    match.append(None)
+                    depth.append(depth[state] + 1)
+                state = delta[state][letter]
+            match[state] = (lhs, rhs)
+        
+        # Breadth-first: failure links, and missing transitions taken from them
+        fail = [0]*len(delta)
+        queue = []
+        for letter in range(alphabet):
+            child = delta[0][letter]
+            if child:
+                queue.append(child)
+        for state in queue:
+            if match[state] is None:
+                match[state] = match[fail[state]]
+            for letter in range(alphabet):
+                child = delta[state][letter]
+                if child and depth[child] == depth[state] + 1:
+                    fail[child] = delta[fail[state]][letter]
+                    queue.append(child)
+                else:
+                    delta[state][letter] = delta[fail[state]][letter]
+        self._automaton = (delta, match)
+    
+    def reduce(self, letters):
+        """ Return the irreducible word (tuple of letters) reached by
+            rewriting with the rules
+            
+            Letters are read into an output stack, recording the automaton
+            state after each; when a left-hand side is matched it is popped
+            and its right-hand side pushed back onto the input.
+        """
+        
+        if self._automaton is None:
+            self._build_automaton()
+        delta, match = self._automaton
+        pending = list(reversed(letters))
+        output = []
+        states = [0]
+        while pending:
+            letter = pending.pop()
+            state = delta[states[-1]][letter]
+            output.append(letter)
+            states.append(state)
+            rule = match[state]
+            if rule is not None:
+                lhs, rhs = rule
+                del output[len(output) - len(lhs):]
+                del states[len(states) - len(lhs):]
+                pending.extend(reversed(rhs))
+        return tuple(output)
+    
+    def normalize(self, word):
+        """ Return the reduced form of a Word or FrozenWord, of the same type """
+        
+        return type(word).fromList(self.decode(self.reduce(self.encode(word))))
+    
+    def equal(self, word1, word2):
+        """ Whether two words are equal in the group (reliable if confluent) """
+        
+        return self.reduce(self.encode(word1)) == self.reduce(self.encode(word2))
+    
+    """ Completion """
+    
+    def add_rule(self, u, v):
+        """ Add the rule orienting u = v (after reduction); return whether added """
+        
+        u, v = self.reduce(u), self.reduce(v)
+        if u == v:
+            return False
+        if not self.shortlex_greater(u, v):
+            u, v = v, u
+        self.rules[u] = v
+        self._automaton = None
+        return True
+    
+    def _interreduce(self):
+        """ Remove rules whose left-hand side contains another, re-adding
+            the equation they represent, and reduce right-hand sides
+        """
+        
+        changed = True
+        while changed:
+            changed = False
+            for lhs in list(self.rules):
+                if lhs not in self.rules:
+                    continue
+                rhs = self.rules.pop(lhs)
+                self._automaton = None
+                reduced = self.reduce(lhs)
+                if reduced == lhs:
+                    self.rules[lhs] = self.reduce(rhs)
+                else:
+                    changed = True
+                    self.add_rule(reduced, rhs)
+            self._automaton = None
+    
+    @staticmethod
+    def critical_pairs(rule1, rule2):
+        """ Yield pairs of words that both rewrite the overlap of two
+            left-hand sides (a suffix of lhs1 equal to a prefix of lhs2)
+        """
+        
+        (l1, r1), (l2, r2) = rule1, rule2
+        for k in range(1, min(len(l1), len(l2))):
+            if l1[-k:] == l2[:k]:
+                yield r1 + l2[k:], l1[:-k] + r2
+    
+    def complete(self):
+        """ Run Knuth-Bendix completion, stopping past max_rules
+            
+            Return: whether the system is confluent
+        """
+        
+        self._interreduce()
+        checked = set()
+        while True:
+            added = False
+            for l1 in list(self.rules):
+                for l2 in list(self.rules):
+                    if (l1, l2) in checked:
+                        continue
+                    if l1 not in self.rules or l2 not in self.rules:
+                        continue
+                    checked.add((l1, l2))
+                    for u, v in self.critical_pairs(
+                        (l1, self.rules[l1]), (l2, self.rules[l2])
+                    ):
+                        if self.add_rule(u, v):
+                            added = True
+                            if len(self.rules) > self.max_rules:
+                                self._interreduce()
+                                self.confluent = False
+                                return False
+            if not added:
+                break
+            self._interreduce()
+            checked = {
+                (l1, l2) for l1, l2 in checked
+                if l1 in self.rules and l2 in self.rules
+            }
+        self.confluent = True
+        return True
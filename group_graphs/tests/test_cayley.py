@@ -0,0 +1,81 @@
+import pytest
+from ..group_graphs import *
+from ..cayley import *
+
+
+def abelian(word):
+    """ Normal form in the free abelian group: sorted total exponents """
+    
+    totals = {}
+    for x, n in word.flattened():
+        totals[x] = totals.get(x, 0) + n
+    return Word.fromList(sorted(totals.items()))
+
+def cyclic(order):
+    """ Normal form in the cyclic group of given order on generator 'x' """
+    
+    def normalize(word):
+        n = sum(n for _, n in word.flattened()) % order
+        return Word.fromList([('x', n if n <= order//2 else n - order)])
+    return normalize
+
+@pytest.mark.parametrize('radius,expected', [
+    (0, 1), (1, 5), (2, 17), (3, 53), (6, 1457),
+])
+def test_free_group_ball_size(radius, expected):
+    words, edges = CayleyGraphBuilder(['x', 'y']).build(radius)
+    assert len(words) == expected
+    # A tree: every vertex but the identity has one edge to its parent
+    assert len(edges) == expected - 1
+
+@pytest.mark.parametrize('radius', [0, 1, 2, 5, 20])
+def test_abelian_ball_size(radius):
+    words, edges = CayleyGraphBuilder(['x', 'y'], normalize=abelian).build(radius)
+    assert len(words) == 2*radius*radius + 2*radius + 1
+    assert len({str(w) for w in words}) == len(words)
+
+@pytest.mark.parametrize('order', [1, 2, 5, 12])
+def test_finite_group_exhausted(order):
+    builder = CayleyGraphBuilder(['x'], normalize=cyclic(order))
+    words, edges = builder.build()
+    assert len(words) == order
+    assert len(edges) == order
+    assert not builder.truncated
+    for e in edges:
+        assert str(cyclic(order)(words[e.source].copy_extend_right('x', 1))) == \
+            str(words[e.target])
+
+def test_bfs_order_and_distances():
+    items = list(CayleyGraphBuilder(['x', 'y']).bfs(2))
+    seen = set()
+    distance = 0
+    for item in items:
+        if isinstance(item, Vertex):
+            assert item.index == len(seen)
+            assert item.distance >= distance and len(item.word) == item.distance
+            distance = item.distance
+            seen.add(item.index)
+        else:
+            assert item.source in seen and item.target in seen
+    assert items[0] == Vertex(0, items[0].word, 0) and str(items[0].word) == '1'
+
+def test_edges_labeled_by_generator():
+    words, edges = CayleyGraphBuilder(['a', 'b']).build(1)
+    labeled = {(str(words[e.source]), e.generator, str(words[e.target])) for e in edges}
+    assert labeled == {
+        ('1', 'a', 'a1'), ('1', 'b', 'b1'), ('a-1', 'a', '1'), ('b-1', 'b', '1'),
+    }
+
+def test_max_vertices():
+    builder = CayleyGraphBuilder(['x', 'y'], max_vertices=100)
+    words, edges = builder.build(10)
+    assert len(words) == 100
+    assert builder.truncated
+    assert all(e.source < 100 and e.target < 100 for e in edges)
+
+def test_vertices_are_frozen_words():
+    builder = CayleyGraphBuilder(['x', 'y'], normalize=abelian)
+    words, _ = builder.build(2)
+    assert all(isinstance(w, FrozenWord) for w in words)
+    assert builder.index[FrozenWord.fromList([('x', 1), ('y', -1)])] == \
+        words.index(FrozenWord.fromList([('x', 1), ('y', -1)]))
@@ -0,0 +1,83 @@
+import pytest
+import numpy as np
+from ..group_graphs import *
+from ..cayley import *
+from ..todd_coxeter import *
+from ..csr import *
+
+
+def w(*powers):
+    return Word.fromList(powers)
+
+S3 = (['s', 't'], [w(('s', 2)), w(('t', 2)), w(*[('s', 1), ('t', 1)]*3)])
+Z2 = (['x', 'y'], [w(('x', 1), ('y', 1), ('x', -1), ('y', -1))])
+
+
+@pytest.mark.parametrize('radius', [0, 1, 3])
+def test_CSRGraph_from_cayley(radius):
+    builder = CayleyGraphBuilder(['x', 'y'])
+    words, edges = builder.build(radius)
+    graph = CSRGraph.from_cayley(builder.generators, words, edges)
+    assert graph.n_vertices == len(words)
+    assert graph.n_edges == len(edges)
+    assert list(graph.edges()) == sorted(edges, key=lambda e: e.source)
+    assert [graph.word(v) for v in range(graph.n_vertices)] == words
+
+def test_CSRGraph_from_builder_matches_from_cayley():
+    builder = CayleyGraphBuilder.from_presentation(*Z2)
+    graph = CSRGraph.from_builder(builder, radius=4)
+    words, edges = builder.build(radius=4)
+    expected = CSRGraph.from_cayley(builder.generators, words, edges)
+    for name in CSRGraph.ARRAYS:
+        assert np.array_equal(getattr(graph, name), getattr(expected, name))
+
+def test_CSRGraph_from_edge_arrays_unsorted():
+    graph = CSRGraph.from_edge_arrays(['x'], 3, [2, 0, 1, 0], [0, 1, 2, 2], [0, 0, 0, 0])
+    assert graph.offsets.tolist() == [0, 2, 3, 4]
+    assert graph.targets.tolist() == [1, 2, 2, 0]
+    targets, labels = graph.neighbors(0)
+    assert targets.tolist() == [1, 2] and labels.tolist() == [0, 0]
+    assert graph.word(0) is None
+
+def test_CSRGraph_from_todd_coxeter():
+    tc = ToddCoxeter(*S3)
+    graph = CSRGraph.from_todd_coxeter(tc)
+    words, A = tc.build()
+    assert graph.n_vertices == 6 and graph.n_edges == 12
+    assert list(graph.edges()) == list(tc.edges())
+    assert [graph.word(v) for v in range(6)] == words
+
+@pytest.mark.parametrize('radius', [1, 2, 6])
+def test_CSRGraph_growth_series(radius):
+    graph = CSRGraph.from_builder(CayleyGraphBuilder.from_presentation(*Z2), radius)
+    assert graph.growth_series().tolist() == [1] + [4*r for r in range(1, radius + 1)]
+    distance = graph.distances()
+    assert all(distance[v] == len(graph.word(v)) for v in range(graph.n_vertices))
+
+def test_CSRGraph_growth_series_S3():
+    graph = CSRGraph.from_todd_coxeter(ToddCoxeter(*S3))
+    assert graph.growth_series().tolist() == [1, 2, 2, 1]
+
+@pytest.mark.parametrize('mmap_mode', [True, False])
+@pytest.mark.parametrize('store_words', [True, False])
+def test_CSRGraph_save_load(tmp_path, mmap_mode, store_words):
+    graph = CSRGraph.from_todd_coxeter(ToddCoxeter(*S3), store_words)
+    path = tmp_path / 'graph.csr'
+    graph.save(path)
+    loaded = CSRGraph.load(path, mmap_mode)
+    assert loaded.generators == graph.generators
+    for name in CSRGraph.ARRAYS:
+        if store_words or not name.startswith('word'):
+            assert np.array_equal(getattr(loaded, name), getattr(graph, name))
+            assert getattr(loaded, name).dtype == getattr(graph, name).dtype
+    assert (loaded.word_offsets is None) == (not store_words)
+    assert list(loaded.edges()) == list(graph.edges())
+    assert loaded.growth_series().tolist() == [1, 2, 2, 1]
+    if mmap_mode:
+        assert not loaded.targets.flags.writeable
+
+def test_CSRGraph_load_rejects_other_files(tmp_path):
+    path = tmp_path / 'other'
+    path.write_bytes(b'not a graph file')
+    with pytest.raises(ValueError):
+        CSRGraph.load(path)
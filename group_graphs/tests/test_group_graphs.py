@@ -154,4 +154,80 @@ def test_Word_extend_right(word, power, expected):
     ([('x',1), ('y',1), ('z',-3), ('z',3), ('y',7)], 'x1y8'),
 ])
 def test_Word_fromList(powerTuples, expected):
-    assert str(Word.fromList(powerTuples)) == expected
\ No newline at end of file
+    assert str(Word.fromList(powerTuples)) == expected
+
+""" 
+    FrozenWord tests
+"""
+
+WORD_LISTS = [
+    [],
+    [('x',1)],
+    [('x',-1), ('y',3), ('z',-2), ('x',-4), ('z',1)],
+    [('x',1), ('y',1), ('z',1), ('z',-1), ('y',-1), ('x',-1)],
+    [('x',12), ('x',-8), ('x',-9), ('x',5)],
+    [('x',1), ('y',1), ('z',-3), ('z',3), ('y',7)],
+]
+
+@pytest.mark.parametrize('powerTuples', WORD_LISTS)
+def test_FrozenWord_matches_Word(powerTuples):
+    word = Word.fromList(powerTuples)
+    frozen = FrozenWord.fromList(powerTuples)
+    assert str(frozen) == str(word)
+    assert len(frozen) == len(word)
+    assert frozen.flattened() == word.flattened()
+    assert frozen.powers == word.powers
+    assert FrozenWord.from_word(word) == frozen
+    assert str(frozen.to_word()) == str(word)
+
+@pytest.mark.parametrize('powerTuples', WORD_LISTS)
+@pytest.mark.parametrize('x,n', [('x',1), ('x',-1), ('y',2), ('z',-1), ('w',0)])
+def test_FrozenWord_copy_extend_right(powerTuples, x, n):
+    frozen = FrozenWord.fromList(powerTuples)
+    extended = frozen.copy_extend_right(x, n)
+    assert str(extended) == str(Word.fromList(powerTuples).copy_extend_right(x, n))
+    assert str(frozen) == str(Word.fromList(powerTuples))
+    assert extended == FrozenWord.fromList(powerTuples + [(x, n)])
+
+def test_FrozenWord_shares_prefix():
+    w = FrozenWord.fromList([('x',2), ('y',-1)])
+    assert w.copy_extend_right('z', 1).prefix is w
+    assert w.copy_extend_right('y', -1).prefix is w.prefix
+    assert w.copy_extend_right('y', 1) is w.prefix
+    assert w.copy() is w
+
+@pytest.mark.parametrize('list1,list2,expected', [
+    ([], [], True),
+    ([('x',1), ('x',-1)], [], True),
+    ([('x',1), ('y',1)], [('x',1), ('y',1)], True),
+    ([('x',2)], [('x',1), ('x',1)], True),
+    ([('x',1), ('y',1)], [('y',1), ('x',1)], False),
+    ([('x',2)], [('x',-2)], False),
+    ([('x',1)], [('x',1), ('y',1)], False),
+])
+def test_FrozenWord_eq_and_hash(list1, list2, expected):
+    w1, w2 = FrozenWord.fromList(list1), FrozenWord.fromList(list2)
+    assert (w1 == w2) == expected
+    if expected:
+        assert hash(w1) == hash(w2)
+        assert len({w1, w2}) == 1
+
+def test_FrozenWord_lt_matches_Word():
+    words = [Word.fromList(t) for t in WORD_LISTS]
+    for w1 in words:
+        for w2 in words:
+            assert (FrozenWord.from_word(w1) < FrozenWord.from_word(w2)) == (w1 < w2)
+
+def test_FrozenWord_is_immutable():
+    w = FrozenWord.fromList([('x',1)])
+    with pytest.raises(AttributeError):
+        w.extend_right(Power('y', 1))
+    with pytest.raises(AttributeError):
+        w.other = 1
+    for name, value in [('x', 'y'), ('n', 5), ('prefix', FrozenWord())]:
+        with pytest.raises(AttributeError):
+            setattr(w, name, value)
+        with pytest.raises(AttributeError):
+            delattr(w, name)
+    assert w == FrozenWord.fromList([('x',1)])
+    assert hash(w) == hash(FrozenWord.fromList([('x',1)]))
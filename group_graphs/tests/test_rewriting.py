@@ -0,0 +1,92 @@
+import pytest
+from ..group_graphs import *
+from ..rewriting import *
+from ..cayley import *
+
+
+def w(*powers):
+    return Word.fromList(powers)
+
+""" Presentations (generators, relators, group order or None if infinite) """
+PRESENTATIONS = {
+    'Z5': (['x'], [w(('x', 5))], 5),
+    'Z2xZ3': (['a', 'b'], [w(('a', 2)), w(('b', 3)), w(('a', 1), ('b', 1), ('a', -1), ('b', -1))], 6),
+    'S3': (['s', 't'], [w(('s', 2)), w(('t', 2)), w(('s', 1), ('t', 1), ('s', 1), ('t', 1), ('s', 1), ('t', 1))], 6),
+    'D8': (['r', 's'], [w(('r', 4)), w(('s', 2)), w(('s', 1), ('r', 1), ('s', 1), ('r', 1))], 8),
+    'Q8': (['i', 'j'], [w(('i', 4)), w(('i', 2), ('j', -2)), w(('j', -1), ('i', 1), ('j', 1), ('i', 1))], 8),
+    'A4': (['a', 'b'], [w(('a', 2)), w(('b', 3)), w(('a', 1), ('b', 1), ('a', 1), ('b', 1), ('a', 1), ('b', 1))], 12),
+    'S4': (['a', 'b'], [w(('a', 2)), w(('b', 3)), w(('a', 1), ('b', 1), ('a', 1), ('b', 1), ('a', 1), ('b', 1), ('a', 1), ('b', 1))], 24),
+    'Z2': (['x', 'y'], [w(('x', 1), ('y', 1), ('x', -1), ('y', -1))], None),
+}
+
+
+@pytest.mark.parametrize('name', PRESENTATIONS)
+def test_RewritingSystem_completes(name):
+    generators, relators, _ = PRESENTATIONS[name]
+    system = RewritingSystem(generators, relators)
+    assert system.confluent
+    for lhs, rhs in system.rules.items():
+        assert RewritingSystem.shortlex_greater(lhs, rhs)
+        assert system.reduce(rhs) == rhs
+
+@pytest.mark.parametrize('name', PRESENTATIONS)
+def test_RewritingSystem_relators_reduce_to_identity(name):
+    generators, relators, _ = PRESENTATIONS[name]
+    system = RewritingSystem(generators, relators)
+    for relator in relators:
+        assert system.reduce(system.encode(relator)) == ()
+        assert len(system.normalize(relator)) == 0
+
+@pytest.mark.parametrize('word,expected', [
+    (w(), w()),
+    (w(('x', 1), ('y', 1)), w(('x', 1), ('y', 1))),
+    (w(('y', 1), ('x', 1)), w(('x', 1), ('y', 1))),
+    (w(('y', 3), ('x', -2), ('y', -1)), w(('x', -2), ('y', 2))),
+    (w(('x', 1), ('y', 1), ('x', -1)), w(('y', 1))),
+])
+def test_RewritingSystem_normalize_abelian(word, expected):
+    generators, relators, _ = PRESENTATIONS['Z2']
+    system = RewritingSystem(generators, relators)
+    assert str(system.normalize(word)) == str(expected)
+
+def test_RewritingSystem_normalize_keeps_type():
+    system = RewritingSystem(['x'], [w(('x', 3))])
+    assert isinstance(system.normalize(w(('x', 2))), Word)
+    frozen = system.normalize(FrozenWord.fromList([('x', 2)]))
+    assert isinstance(frozen, FrozenWord)
+    assert frozen == FrozenWord.fromList([('x', -1)])
+
+def test_RewritingSystem_equal():
+    generators, relators, _ = PRESENTATIONS['S3']
+    system = RewritingSystem(generators, relators)
+    assert system.equal(w(('s', 1), ('t', 1), ('s', 1)), w(('t', 1), ('s', 1), ('t', 1)))
+    assert not system.equal(w(('s', 1)), w(('t', 1)))
+
+def test_RewritingSystem_max_rules():
+    # Baumslag-Solitar BS(1, 2) has no finite shortlex completion
+    relators = [w(('b', -1), ('a', 1), ('b', 1), ('a', -2))]
+    system = RewritingSystem(['a', 'b'], relators, max_rules=30)
+    assert not system.confluent
+    assert system.reduce(system.encode(relators[0])) == ()
+
+def test_RewritingSystem_reduce_long_word():
+    system = RewritingSystem(['x'], [w(('x', 7))])
+    assert system.reduce((0,)*70001) == (0,)
+    assert system.reduce((1, 0)*50000) == ()
+
+@pytest.mark.parametrize('name', [name for name in PRESENTATIONS if PRESENTATIONS[name][2]])
+def test_CayleyGraphBuilder_from_presentation_finite(name):
+    generators, relators, order = PRESENTATIONS[name]
+    builder = CayleyGraphBuilder.from_presentation(generators, relators)
+    words, edges = builder.build()
+    assert builder.rewriting.confluent
+    assert len(words) == order
+    assert len(edges) == order*len(generators)
+    assert len(set(words)) == order
+
+@pytest.mark.parametrize('radius', [0, 1, 2, 5, 10])
+def test_CayleyGraphBuilder_from_presentation_Z2(radius):
+    generators, relators, _ = PRESENTATIONS['Z2']
+    builder = CayleyGraphBuilder.from_presentation(generators, relators)
+    words, _ = builder.build(radius)
+    assert len(words) == 2*radius**2 + 2*radius + 1
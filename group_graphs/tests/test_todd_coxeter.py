@@ -0,0 +1,99 @@
+import pytest
+from ..group_graphs import *
+from ..rewriting import *
+from ..cayley import *
+from ..todd_coxeter import *
+
+
+def w(*powers):
+    return Word.fromList(powers)
+
+def coxeter_A(n):
+    """ Coxeter presentation of the symmetric group S_(n+1) """
+    
+    generators = [f's{i}' for i in range(n)]
+    relators = [w((s, 2)) for s in generators]
+    for i in range(n):
+        for j in range(i + 1, n):
+            m = 3 if j == i + 1 else 2
+            relators.append(w(*[(generators[i], 1), (generators[j], 1)]*m))
+    return generators, relators
+
+""" Presentations (generators, relators, group order) """
+PRESENTATIONS = {
+    'trivial': (['x'], [w(('x', 1))], 1),
+    'Z7': (['x'], [w(('x', 7))], 7),
+    'Z2xZ3': (['a', 'b'], [w(('a', 2)), w(('b', 3)), w(('a', 1), ('b', 1), ('a', -1), ('b', -1))], 6),
+    'Q8': (['i', 'j'], [w(('i', 4)), w(('i', 2), ('j', -2)), w(('j', -1), ('i', 1), ('j', 1), ('i', 1))], 8),
+    'A5': (['a', 'b'], [w(('a', 2)), w(('b', 3)), w(*[('a', 1), ('b', 1)]*5)], 60),
+    'PSL(2,7)': (['a', 'b'], [w(('a', 2)), w(('b', 3)), w(*[('a', 1), ('b', 1)]*7), w(*[('a', 1), ('b', 1), ('a', -1), ('b', -1)]*4)], 168),
+    'S5': coxeter_A(4) + (120,),
+}
+
+
+@pytest.mark.parametrize('name', PRESENTATIONS)
+def test_ToddCoxeter_order(name):
+    generators, relators, order = PRESENTATIONS[name]
+    assert ToddCoxeter(generators, relators).run() == order
+
+@pytest.mark.parametrize('name', PRESENTATIONS)
+def test_ToddCoxeter_adjacency_is_permutation(name):
+    generators, relators, order = PRESENTATIONS[name]
+    A = ToddCoxeter(generators, relators).adjacency()
+    assert A.shape == (order, len(generators))
+    for column in A.T:
+        assert sorted(column) == list(range(order))
+
+@pytest.mark.parametrize('name', PRESENTATIONS)
+def test_ToddCoxeter_representatives(name):
+    generators, relators, order = PRESENTATIONS[name]
+    words, A = ToddCoxeter(generators, relators).build()
+    rewriting = RewritingSystem(generators, relators)
+    assert rewriting.confluent
+    assert words[0] == FrozenWord()
+    # Representatives are shortlex normal forms, and edges multiply them
+    for c, word in enumerate(words):
+        assert rewriting.normalize(word) == word
+        for i, x in enumerate(generators):
+            assert rewriting.normalize(word.copy_extend_right(x, 1)) == words[A[c, i]]
+
+@pytest.mark.parametrize('name', PRESENTATIONS)
+def test_ToddCoxeter_matches_CayleyGraphBuilder(name):
+    generators, relators, order = PRESENTATIONS[name]
+    words, edges = CayleyGraphBuilder.from_presentation(generators, relators).build()
+    tc = ToddCoxeter(generators, relators)
+    index = {word: c for c, word in enumerate(tc.representatives())}
+    assert set(index) == set(words)
+    expected = {(words[e.source], words[e.target], e.generator) for e in edges}
+    reps = tc.representatives()
+    assert {(reps[e.source], reps[e.target], e.generator) for e in tc.edges()} == expected
+
+@pytest.mark.parametrize('subgroup,index', [
+    ([], 6),
+    ([w(('s', 1))], 3),
+    ([w(('t', 1))], 3),
+    ([w(('s', 1), ('t', 1))], 2),
+    ([w(('s', 1)), w(('t', 1))], 1),
+])
+def test_ToddCoxeter_subgroup_index(subgroup, index):
+    relators = [w(('s', 2)), w(('t', 2)), w(*[('s', 1), ('t', 1)]*3)]
+    assert ToddCoxeter(['s', 't'], relators, subgroup).run() == index
+
+def test_ToddCoxeter_max_cosets():
+    generators, relators = coxeter_A(4)
+    with pytest.raises(RuntimeError):
+        ToddCoxeter(generators, relators, max_cosets=100).run()
+    # Lookahead and compression recover cosets without failing
+    assert ToddCoxeter(generators, relators, max_cosets=130).run() == 120
+
+@pytest.mark.parametrize('name', PRESENTATIONS)
+def test_ToddCoxeter_max_cosets_equal_to_order(name):
+    generators, relators, order = PRESENTATIONS[name]
+    assert ToddCoxeter(generators, relators, max_cosets=order).run() == order
+    if order > 1:
+        with pytest.raises(RuntimeError):
+            ToddCoxeter(generators, relators, max_cosets=order - 1).run()
+
+def test_ToddCoxeter_infinite_group():
+    with pytest.raises(RuntimeError):
+        ToddCoxeter(['x', 'y'], [w(('x', 1), ('y', 1), ('x', -1), ('y', -1))], max_cosets=1000).run()
@@ -0,0 +1,264 @@
+from array import array
+import numpy as np
+try:
+    from .group_graphs import FrozenWord
+    from .cayley import Edge
+except ImportError:
+    from group_graphs import FrozenWord
+    from cayley import Edge
+
+
+class ToddCoxeter:
+    """ Todd-Coxeter coset enumeration (HLT strategy with lookahead)
+        
+        Enumerates the cosets of the subgroup generated by subgroup (by
+        default trivial, giving the Cayley graph of the group) in the
+        group <generators | relators>. Relators and subgroup generators
+        are Words or FrozenWords.
+        
+        The coset table is one flat integer array: columns 2i and 2i + 1
+        of row c are c*x and c*x^-1 for generator number i, -1 where not
+        yet defined. Coincident cosets are merged with a union-find array.
+        When more than max_cosets cosets are defined, a lookahead scans
+        every coset under the relators without defining new ones, and the
+        table is compressed to its live rows; if more than max_cosets are
+        still live, run raises RuntimeError. (The table may briefly hold
+        up to one coset per relator letter and column beyond max_cosets.)
+    """
+    
+    def __init__(self, generators, relators, subgroup=(), max_cosets=2**20):
+        """ generators -- list of generator names
+            relators -- Words equal to the identity
+            subgroup -- Words generating the subgroup (default: trivial)
+            max_cosets -- largest number of live cosets allowed
+        """
+        
+        self.generators = list(generators)
+        codes = {x: i for i, x in enumerate(self.generators)}
+        encode = lambda word: [
+            2*codes[x] + (0 if n > 0 else 1) for x, n in word.flattened()
+        ]
+        self.relators = [encode(r) for r in relators if len(r)]
+        self.subgroup = [encode(h) for h in subgroup if len(h)]
+        self.max_cosets = max_cosets
+        self.width = 2*len(self.generators)
+        self.table = array('l')
+        self.parent = array('l')
+        self.n_live = 0
+        self.complete = False
+    
+    def __repr__(self):
+        return f'<ToddCoxeter: { self.n_live } cosets>'
+    
+    """ Table operations """
+    
+    def _new_coset(self):
+        self.table.extend([-1]*self.width)
+        self.parent.append(len(self.parent))
+        self.n_live += 1
+        return len(self.parent) - 1
+    
+    def _define(self, c, x):
+        d = self._new_coset()
+        self.table[c*self.width + x] = d
+        self.table[d*self.width + (x ^ 1)] = c
+    
+    def _rep(self, c):
+        """ Live coset that c was merged into, compressing the path """
+        
+        parent = self.parent
+        root = c
+        while parent[root] != root:
+            root = parent[root]
+        while parent[c] != root:
+            parent[c], c = root, parent[c]
+        return root
+    
+    def _merge(self, a, b, queue):
+        a, b = self._rep(a), self._rep(b)
+        if a != b:
+            a, b = min(a, b), max(a, b)
+            self.parent[b] = a
+            self.n_live -= 1
+            queue.append(b)
+    
+    def _coincidence(self, a, b):
+        """ Merge cosets a and b and every coincidence that follows """
+        
+        table, W = self.table, self.width
+        queue = []
+        self._merge(a, b, queue)
+        for dead in queue:
+            for x in range(W):
+                d = table[dead*W + x]
+                if d < 0:
+                    continue
+                table[d*W + (x ^ 1)] = -1
+                mu, nu = self._rep(dead), self._rep(d)
+                if table[mu*W + x] >= 0:
+                    self._merge(nu, table[mu*W + x], queue)
+                elif table[nu*W + (x ^ 1)] >= 0:
+                    self._merge(mu, table[nu*W + (x ^ 1)], queue)
+                else:
+                    table[mu*W + x] = nu
+                    table[nu*W + (x ^ 1)] = mu
+    
+    def _scan(self, c, relator, fill):
+        """ Trace relator from coset c forwards and backwards, recording
+            a deduction or coincidence where the traces meet; if fill,
+            define cosets to close the gap
+        """
+        
+        table, W = self.table, self.width
+        f, i = c, 0
+        b, j = c, len(relator) - 1
+        while True:
+            while i <= j and table[f*W + relator[i]] >= 0:
+                f = table[f*W + relator[i]]
+                i += 1
+            if i > j:
+                if f != c:
+                    self._coincidence(f, c)
+                return
+            while j >= i and table[b*W + (relator[j] ^ 1)] >= 0:
+                b = table[b*W + (relator[j] ^ 1)]
+                j -= 1
+            if j < i:
+                self._coincidence(f, b)
+                return
+            if i == j:
+                table[f*W + relator[i]] = b
+                table[b*W + (relator[i] ^ 1)] = f
+                return
+            if not fill:
+                return
+            self._define(f, relator[i])
+    
+    def _lookahead(self):
+        for c in range(len(self.parent)):
+            for relator in self.relators:
+                if self.parent[c] != c:
+                    break
+                self._scan(c, relator, fill=False)
+    
+    def _compress(self):
+        """ Renumber the live cosets 0, 1, ... in order; return the old
+            number -> new number array (-1 for dead cosets)
+        """
+        
+        W = self.width
+        new = array('l', [-1])*len(self.parent)
+        live = [c for c in range(len(self.parent)) if self.parent[c] == c]
+        for i, c in enumerate(live):
+            new[c] = i
+        table = array('l')
+        for c in live:
+            table.extend(
+                new[d] if d >= 0 else -1 for d in self.table[c*W:(c+1)*W]
+            )
+        self.table = table
+        self.parent = array('l', range(len(live)))
+        return new
+    
+    def _standardize(self):
+        """ Renumber cosets in breadth-first order from coset 0, following
+            columns in order; return the parent coset and column of each
+        """
+        
+        W = self.width
+        order, tree = [0], [(-1, -1)]
+        new = array('l', [-1])*len(self.parent)
+        new[0] = 0
+        for c in order:
+            for x in range(W):
+                d = self.table[c*W + x]
+                if new[d] < 0:
+                    new[d] = len(order)
+                    order.append(d)
+                    tree.append((new[c], x))
+        table = array('l')
+        for c in order:
+            table.extend(new[d] for d in self.table[c*W:(c+1)*W])
+        self.table = table
+        self.parent = array('l', range(len(order)))
+        return tree
+    
+    """ Enumeration """
+    
+    def run(self):
+        """ Enumerate the cosets
+            
+            Return: number of cosets
+        """
+        
+        self.table, self.parent, self.n_live = array('l'), array('l'), 0
+        self._new_coset()
+        for h in self.subgroup:
+            self._scan(0, h, fill=True)
+        c = 0
+        while c < len(self.parent):
+            if len(self.parent) > self.max_cosets:
+                self._lookahead()
+                new = self._compress()
+                c = next(
+                    (new[d] for d in range(c, len(new)) if new[d] >= 0),
+                    len(self.parent)
+                )
+                if self.n_live > self.max_cosets:
+                    raise RuntimeError(
+                        f'Coset enumeration exceeded { self.max_cosets } cosets'
+                    )
+                continue
+            for relator in self.relators:
+                if self.parent[c] != c:
+                    break
+                self._scan(c, relator, fill=True)
+            for x in range(self.width):
+                if self.parent[c] != c:
+                    break
+                if self.table[c*self.width + x] < 0:
+                    self._define(c, x)
+            c += 1
+        self._compress()
+        self._tree = self._standardize()
+        self.complete = True
+        return self.n_live
+    
+    def adjacency(self):
+        """ Return int array A of shape (cosets, generators) with A[c, i]
+            the coset c*generators[i]
+            
+            Cosets are numbered breadth-first from the subgroup (coset 0).
+        """
+        
+        if not self.complete:
+            self.run()
+        table = np.frombuffer(self.table, dtype=np.dtype(self.table.typecode))
+        return table.reshape(-1, self.width)[:, ::2].astype(np.int64)
+    
+    def representatives(self):
+        """ Return a FrozenWord for each coset: its shortlex-least word
+            (with letters ordered x < x^-1 < y < y^-1 < ...)
+        """
+        
+        if not self.complete:
+            self.run()
+        words = [FrozenWord()]
+        for parent, x in self._tree[1:]:
+            words.append(words[parent].copy_extend_right(
+                self.generators[x >> 1], -1 if x & 1 else 1
+            ))
+        return words
+    
+    def edges(self):
+        """ Generate the Edges c -> c*x of the coset graph, by source """
+        
+        A = self.adjacency()
+        for source, targets in enumerate(A.tolist()):
+            for x, target in zip(self.generators, targets):
+                yield Edge(source, target, x)
+    
+    def build(self):
+        """ Run; return (list of representative words, adjacency array) """
+        
+        return self.representatives(), self.adjacency()
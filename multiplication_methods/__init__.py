@@ -0,0 +1,2 @@
+from .batch import multiplyMany
+from .dispatch import multiply
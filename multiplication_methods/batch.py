@@ -0,0 +1,121 @@
+"""
+Batch multiplication of many pairs of decimal strings
+
+Pairs are grouped by FFT length and digit packing, and each group is
+transformed as a stack of rows with the NumPy FFT: all operands of the
+same size share one transform plan and one pair of scratch buffers.
+Groups can be spread over a process pool.
+"""
+
+
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+import math
+import numpy as np
+try:
+    from .customnumbers import carryDigits, stringFromDigits
+    from .dft import (
+        DFTmultiply, ROUNDING_TOLERANCE, chooseDigitsPerPoint, digitArray,
+        packDigitArray, paddedLength, unpackDigitArray,
+    )
+except ImportError:
+    from customnumbers import carryDigits, stringFromDigits
+    from dft import (
+        DFTmultiply, ROUNDING_TOLERANCE, chooseDigitsPerPoint, digitArray,
+        packDigitArray, paddedLength, unpackDigitArray,
+    )
+
+
+"""Most float64 entries held by one scratch buffer; larger groups are chunked"""
+MAX_SCRATCH_ENTRIES = 2**22
+
+
+def fftSize(x, y):
+    """Return (padded FFT length, digits per point) used for product of x, y"""
+    
+    k = chooseDigitsPerPoint(len(x), len(y))
+    return paddedLength(math.ceil(len(x)/k), math.ceil(len(y)/k)), k
+
+def multiplyMany(pairs, processes=None):
+    """
+    Multiply many pairs of decimal strings
+    
+    Args:
+    -- pairs: iterable of (x, y) decimal strings (in usual order) of
+       integers, optionally signed
+    -- processes: if greater than 1, groups are multiplied in a pool of
+       this many processes
+    
+    Returns: list of decimal strings (in usual order) of the products,
+    in the order of pairs
+    """
+    
+    results = []
+    signs = []
+    groups = defaultdict(list)
+    for i, (x, y) in enumerate(pairs):
+        signs.append(x.startswith('-') != y.startswith('-'))
+        x = x.lstrip('-').lstrip('0') or '0'
+        y = y.lstrip('-').lstrip('0') or '0'
+        results.append('0')
+        if x != '0' and y != '0':
+            groups[fftSize(x, y)].append((i, x, y))
+    
+    # Split groups into chunks that fit one scratch buffer
+    chunks = []
+    for (N, k), members in groups.items():
+        rows = max(1, MAX_SCRATCH_ENTRIES // N)
+        for start in range(0, len(members), rows):
+            chunks.append((N, k, members[start:start+rows]))
+    
+    if processes and processes > 1 and len(chunks) > 1:
+        with ProcessPoolExecutor(processes) as pool:
+            chunkResults = list(pool.map(multiplyGroup, *zip(*chunks)))
+    else:
+        chunkResults = [multiplyGroup(*chunk) for chunk in chunks]
+    
+    for (_, _, members), products in zip(chunks, chunkResults):
+        for (i, _, _), product in zip(members, products):
+            results[i] = product
+    return [
+        '-' + r if isNegative and r != '0' else r
+        for r, isNegative in zip(results, signs)
+    ]
+
+def multiplyGroup(N, k, members):
+    """Multiply (index, x, y) members sharing FFT length N and packing k
+    
+    Returns: list of decimal product strings, in the order of members
+    """
+    
+    X = np.zeros((len(members), N))
+    Y = np.zeros((len(members), N))
+    for row, (_, x, y) in enumerate(members):
+        x_seq = packDigitArray(digitArray(x), k)
+        y_seq = packDigitArray(digitArray(y), k)
+        X[row, :len(x_seq)] = x_seq
+        Y[row, :len(y_seq)] = y_seq
+    
+    C = np.fft.rfft(X, axis=1)
+    C *= np.fft.rfft(Y, axis=1)
+    del X, Y
+    c = np.fft.irfft(C, N, axis=1)
+    c_seq = np.rint(c)
+    errors = np.abs(c - c_seq).max(axis=1)
+    c_seq = c_seq.astype(np.int64)
+    
+    safe = (errors <= ROUNDING_TOLERANCE) | (k == 1)
+    digits = unpackDigitArray(carryDigits(c_seq[safe], base=10**k), k)
+    text = stringFromDigits(digits[:, ::-1])
+    width = digits.shape[1]
+    
+    products = []
+    safeRow = 0
+    for row, (_, x, y) in enumerate(members):
+        if safe[row]:
+            products.append(text[safeRow*width:(safeRow+1)*width].lstrip('0'))
+            safeRow += 1
+        else:
+            # Rounding unsafe at this packing; DFTmultiply retries smaller ones
+            products.append(DFTmultiply(x, y, backend='numpy', digitsPerPoint=k-1))
+    return products
@@ -0,0 +1,249 @@
+"""
+Benchmark runner for multiplication methods
+
+Times grid, Karatsuba, quarter-square, direct DFT and Cooley-Tukey
+multiplication of random decimal strings over a range of digit lengths.
+Each measurement follows warmup calls, repeats the multiplication and
+records wall-time statistics and the peak memory traced by tracemalloc
+during one further call. Results are written as JSON or CSV, and can be
+compared against a saved JSON baseline to flag regressions.
+
+Usage:
+    python bench.py --json results.json
+    python bench.py --sizes 10 100 1000 --compare results.json
+"""
+
+
+import argparse
+import csv
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+import numpy as np
+try:
+    from .customnumbers import stringFromDigits
+    from .dft import DFTmultiply, DFTdirect, IDFTdirect
+    from .dispatch import gridMultiply, karatsubaMultiply
+    from .quartersquare import QSMultiplier
+except ImportError:
+    from customnumbers import stringFromDigits
+    from dft import DFTmultiply, DFTdirect, IDFTdirect
+    from dispatch import gridMultiply, karatsubaMultiply
+    from quartersquare import QSMultiplier
+
+
+DEFAULT_SIZES = (10, 100, 1000, 10**4, 10**5, 10**6)
+
+"""Relative slowdown of the median time beyond which a result is a regression"""
+DEFAULT_TOLERANCE = 0.25
+
+FIELDS = (
+    'method', 'digits', 'repeats', 'min', 'median', 'mean', 'stdev', 'peakBytes'
+)
+
+
+def quarterSquareMultiply(x, y):
+    return QSMultiplier().multiplyStrings(x, y)
+
+def directDFTMultiply(x, y):
+    return DFTmultiply(x, y, DFTfn=DFTdirect, IDFTfn=IDFTdirect) or '0'
+
+def cooleyTukeyMultiply(x, y):
+    return DFTmultiply(x, y) or '0'
+
+"""Benchmarked methods as (name, function, largest digit length run by default)
+
+Limits keep a default run to minutes; the quadratic methods would take
+hours at 10**6 digits.
+"""
+METHODS = [
+    ('grid', gridMultiply, 10**5),
+    ('karatsuba', karatsubaMultiply, 10**5),
+    ('quarter-square', quarterSquareMultiply, 10**5),
+    ('direct-dft', directDFTMultiply, 10**3),
+    ('cooley-tukey', cooleyTukeyMultiply, 10**6),
+]
+
+
+def randomDigits(n, rng):
+    """Random n-digit decimal string with nonzero leading digit"""
+    
+    digits = rng.integers(0, 10, n)
+    digits[0] = rng.integers(1, 10)
+    return stringFromDigits(digits)
+
+def peakMemory(fn, *args):
+    """Return peak bytes traced by tracemalloc during fn(*args)"""
+    
+    wasTracing = tracemalloc.is_tracing()
+    if not wasTracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    base = tracemalloc.get_traced_memory()[0]
+    fn(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    if not wasTracing:
+        tracemalloc.stop()
+    return peak - base
+
+def measure(name, fn, x, y, repeats=5, warmup=1):
+    """Time repeats calls fn(x, y) after warmup calls; return result dict"""
+    
+    for _ in range(warmup):
+        fn(x, y)
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(x, y)
+        times.append(time.perf_counter() - start)
+    return {
+        'method': name,
+        'digits': len(x),
+        'repeats': repeats,
+        'min': min(times),
+        'median': statistics.median(times),
+        'mean': statistics.mean(times),
+        'stdev': statistics.stdev(times) if repeats > 1 else 0.0,
+        'peakBytes': peakMemory(fn, x, y),
+    }
+
+def runBenchmarks(
+    sizes=DEFAULT_SIZES, methods=None, repeats=5, warmup=1, seed=0,
+    ignoreLimits=False, verbose=False
+):
+    """Benchmark methods at each digit length
+    
+    Args:
+    sizes -- digit lengths of both operands
+    methods -- names of methods to run (default all in METHODS)
+    repeats, warmup -- timed and untimed calls per measurement
+    seed -- seed for the random operands
+    ignoreLimits -- run methods beyond their default digit limit
+    
+    Return: list of result dicts with keys FIELDS
+    """
+    
+    if methods is not None:
+        unknown = set(methods) - {name for name, _, _ in METHODS}
+        if unknown:
+            raise ValueError('Unknown methods: {}'.format(', '.join(sorted(unknown))))
+    rng = np.random.default_rng(seed)
+    results = []
+    for n in sizes:
+        x, y = randomDigits(n, rng), randomDigits(n, rng)
+        for name, fn, limit in METHODS:
+            if methods is not None and name not in methods:
+                continue
+            if n > limit and not ignoreLimits:
+                continue
+            result = measure(name, fn, x, y, repeats, warmup)
+            results.append(result)
+            if verbose:
+                print(formatResult(result), flush=True)
+    return results
+
+def formatResult(result):
+    return '{:>16} {:>9} digits: median {:.6f}s, min {:.6f}s, peak {:.1f} KiB'.format(
+        result['method'], result['digits'], result['median'], result['min'],
+        result['peakBytes']/1024
+    )
+
+def environment():
+    """Describe the machine and library versions the results were measured on"""
+    
+    return {
+        'python': sys.version.split()[0],
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+
+def writeJSON(results, path):
+    with open(path, 'w') as f:
+        json.dump({'environment': environment(), 'results': results}, f, indent=2)
+
+def readJSON(path):
+    """Return the list of results saved by writeJSON"""
+    
+    with open(path) as f:
+        return json.load(f)['results']
+
+def writeCSV(results, path):
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(results)
+
+def compareResults(results, baseline, tolerance=DEFAULT_TOLERANCE):
+    """Compare median times against a baseline run
+    
+    Return: list of dicts (method, digits, baseline, current, ratio,
+    regression) for each (method, digits) present in both; regression is
+    True when ratio = current/baseline exceeds 1 + tolerance.
+    """
+    
+    baselineTimes = {(r['method'], r['digits']): r['median'] for r in baseline}
+    comparisons = []
+    for r in results:
+        key = (r['method'], r['digits'])
+        if key not in baselineTimes:
+            continue
+        ratio = r['median']/baselineTimes[key] if baselineTimes[key] else float('inf')
+        comparisons.append({
+            'method': r['method'],
+            'digits': r['digits'],
+            'baseline': baselineTimes[key],
+            'current': r['median'],
+            'ratio': ratio,
+            'regression': ratio > 1 + tolerance,
+        })
+    return comparisons
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark multiplication methods')
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES))
+    parser.add_argument(
+        '--methods', nargs='+', choices=[name for name, _, _ in METHODS]
+    )
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--warmup', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument(
+        '--ignore-limits', action='store_true',
+        help='run every method at every size'
+    )
+    parser.add_argument('--json', help='write results to this JSON file')
+    parser.add_argument('--csv', help='write results to this CSV file')
+    parser.add_argument('--compare', help='JSON results of a baseline run')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args(argv)
+    
+    results = runBenchmarks(
+        args.sizes, args.methods, args.repeats, args.warmup, args.seed,
+        args.ignore_limits, verbose=True
+    )
+    if args.json:
+        writeJSON(results, args.json)
+    if args.csv:
+        writeCSV(results, args.csv)
+    
+    if args.compare:
+        comparisons = compareResults(results, readJSON(args.compare), args.tolerance)
+        print('----')
+        for c in comparisons:
+            print('{:>16} {:>9} digits: {:.6f}s -> {:.6f}s ({:+.1%}){}'.format(
+                c['method'], c['digits'], c['baseline'], c['current'],
+                c['ratio'] - 1, '  REGRESSION' if c['regression'] else ''
+            ))
+        regressions = sum(c['regression'] for c in comparisons)
+        print('{} of {} measurements regressed'.format(regressions, len(comparisons)))
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
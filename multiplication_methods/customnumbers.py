@@ -1,20 +1,129 @@
-from collections import defaultdict
+from array import array
 import math
+import numpy as np
+
+
+def carryDigits(c, base=10):
+    """Vectorized carry of nonnegative int64 coefficients in ascending order
+    
+    Carries move one position per pass until every carry is 0 or 1; the
+    remaining ripple through runs of (base-1)s is resolved in a single pass by
+    finding, for each position, the nearest lower position that does not
+    propagate a carry. Coefficients are reduced to digits in the given
+    base. The top coefficient must leave room for the final
+    carry (true of DFT output, which is zero-padded). A 2-d array is
+    carried row by row.
+    """
+    
+    c = c.copy()
+    while True:
+        q = c//base
+        if not q.any():
+            return c
+        c -= base*q
+        c[..., 1:] += q[..., :-1]
+        if q.max() <= 1:
+            break
+    
+    # Now every entry is <= base: base generates a carry, base-1 propagates one
+    generates = (c >= base)
+    stops = (c != base-1)
+    index = np.arange(c.shape[-1])
+    lastStop = np.maximum.accumulate(np.where(stops, index, -1), axis=-1)
+    carryIn = np.zeros(c.shape, dtype=bool)
+    fromStop = lastStop[..., :-1]
+    carryIn[..., 1:] = (fromStop >= 0) & np.take_along_axis(
+        generates, np.maximum(fromStop, 0), axis=-1
+    )
+    c += carryIn
+    c[c >= base] -= base
+    return c
+
+
+def digitsFromString(string):
+    """Parse a string of decimal digits into an int8 array, in string order
+    
+    The string (str, bytes or memoryview) is read as a byte buffer, so
+    no per-character Python objects are created.
+    """
+    
+    if isinstance(string, str):
+        string = string.encode('ascii')
+    digits = np.frombuffer(string, dtype=np.uint8) - np.uint8(ord('0'))
+    if len(digits) and digits.max() > 9:
+        raise ValueError('Non-digit characters in string')
+    return digits.astype(np.int8)
+
+def stringFromDigits(digits):
+    """Format a sequence of digits 0-9 as a string, in sequence order"""
+    
+    digits = np.asarray(digits)
+    return (digits.astype(np.uint8) + np.uint8(ord('0'))).tobytes().decode('ascii')
+
+def limbsFromString(string, limbDigits=9):
+    """Parse a decimal string into uint32 limbs of base 10**limbDigits
+    
+    The digits are zero-padded to whole limbs, reshaped into rows of
+    limbDigits and combined by a single matrix product.
+    
+    Return: array of limbs, least significant first
+    """
+    
+    digits = digitsFromString(string)
+    padded = np.zeros(-(-len(digits)//limbDigits)*limbDigits, dtype=np.int64)
+    padded[len(padded)-len(digits):] = digits
+    powers = 10**np.arange(limbDigits-1, -1, -1, dtype=np.int64)
+    return (padded.reshape(-1, limbDigits) @ powers)[::-1].astype(np.uint32)
+
+def stringFromLimbs(limbs, limbDigits=9):
+    """Format limbs of base 10**limbDigits (least significant first) as a
+    decimal string without leading zeros ('0' for no limbs)
+    """
+    
+    limbs = np.asarray(limbs, dtype=np.int64)[::-1]
+    powers = 10**np.arange(limbDigits-1, -1, -1, dtype=np.int64)
+    digits = (limbs[:, None] // powers) % 10
+    return stringFromDigits(digits.ravel()).lstrip('0') or '0'
+
+def intFromLimbs(limbs, limbDigits=9):
+    """Combine limbs of base 10**limbDigits (least significant first) into an int
+    
+    Adjacent limbs are merged pairwise, squaring the base at each level,
+    so the large multiplications are balanced and int's subquadratic
+    multiplication applies. Unlike int(string) this is not quadratic in
+    the number of digits, nor subject to the int/str conversion limit.
+    """
+    
+    values = np.asarray(limbs, dtype=np.int64)
+    base = 10**limbDigits
+    if 2*limbDigits <= 18 and len(values) > 1:
+        # First level in int64: two 9-digit limbs fit in 18 digits
+        if len(values) % 2:
+            values = np.append(values, 0)
+        values = values[0::2] + values[1::2]*base
+        base *= base
+    values = values.tolist()
+    if not values:
+        return 0
+    while len(values) > 1:
+        if len(values) % 2:
+            values.append(0)
+        values = [low + high*base for low, high in zip(values[0::2], values[1::2])]
+        base *= base
+    return values[0]
 
 
 class Rational:
     """
     Class for storing and operating on decimal strings which
     may include a fractional part
+    
+    Stored as a sign, an int8 array of digits (most significant first)
+    and the power of ten of the first digit. The digits and digitPowers
+    views are built on first access and cached.
     """
     
-    """Multiplication table for single digit numbers"""
-    multTable = {
-        str(d_one): {
-            str(d_two): d_one*d_two for d_two in range(10)
-        } 
-        for d_one in range(10)
-    }
+    __slots__ = ('isNegative', 'highestPower', '_digitArray', '_digits', '_digitPowers')
     
     def __init__(self, string):
         """ Does some basic cleaning,
@@ -46,14 +155,35 @@ class Rational:
             raise ValueError(f'Ill-formed string: { string }')
         if '.' in string:
             string = string.rstrip('0').rstrip('.')
-        self.dotIndex = string.find('.')
-        self.highestPower = self.dotIndex-1 if self.dotIndex >= 0 else len(string)-1
-        self.digits = [d for d in string if d != '.']
+        dotIndex = string.find('.')
+        self.highestPower = dotIndex-1 if dotIndex >= 0 else len(string)-1
+        self._digitArray = digitsFromString(string.replace('.', ''))
+        self._digits = None
+        self._digitPowers = None
+        
+    @property
+    def digits(self):
+        """List of digits as one-character strings"""
+        
+        if self._digits is None:
+            self._digits = list(self._digitString())
+        return self._digits
+    
+    @property
+    def dotIndex(self):
+        """Index of the decimal point in str(abs(self)), or -1 if there is none"""
+        
+        if self.highestPower - len(self._digitArray) + 1 < 0 and len(self._digitArray):
+            return self.highestPower + 1
+        return -1
+    
+    def _digitString(self):
+        return stringFromDigits(self._digitArray)
         
     def __str__(self):
-        if not self.digits:
+        if not len(self._digitArray):
             return '0'
-        baseString = ''.join([str(d) for d in self.digits])
+        baseString = self._digitString()
         if self.dotIndex > -1:
             baseString = baseString[:self.dotIndex] + '.' + baseString[self.dotIndex:]
         return f"{ '-' if self.isNegative else '' }{ baseString }"
@@ -63,61 +193,88 @@ class Rational:
     
     @classmethod
     def fromDigits(cls, digits, highestPower, negative=False):
-        """Use list of digits and highest power to construct Rational"""
+        """Use digits (list or integer array) and highest power to construct Rational"""
         
         if highestPower >= len(digits):
             raise ValueError('highestPower >= number of digits')
-        s = ''.join([str(digit) for digit in digits])
-        if highestPower < 0:
-            s = '.' + '0'*(-1-highestPower) + s
-        else:
-            dotIndex = highestPower + 1
-            if dotIndex < len(digits):
-                s = s[:dotIndex] + '.' + s[dotIndex:]
-        if negative:
-            s = '-' + s
-        return cls(s)
+        if len(digits) and isinstance(digits[0], str):
+            digits = digitsFromString(''.join(digits))
+        return cls.fromDigitArray(digits, highestPower, negative)
     
     @property
     def digitPowers(self):
         """List of tuples containing digits and corresponding powers of ten"""
         
-        return [(d, self.highestPower-i) for i, d in enumerate(self.digits)]
+        if self._digitPowers is None:
+            self._digitPowers = [
+                (d, self.highestPower-i) for i, d in enumerate(self.digits)
+            ]
+        return self._digitPowers
     
     def asFloat(self):
         return float(str(self))
     
+    @classmethod
+    def fromDigitArray(cls, digits, highestPower, negative=False):
+        """Construct Rational directly from integer digits, without parsing a string
+        
+        Args:
+        digits -- sequence of ints 0-9, most significant first
+        highestPower -- power of ten of digits[0]; may be any integer
+        negative -- sign of the result
+        
+        Leading and trailing zeros are stripped as by Rational(string).
+        """
+        
+        digits = np.asarray(digits, dtype=np.int64)
+        nonzero = np.flatnonzero(digits)
+        r = cls.__new__(cls)
+        r.isNegative = negative
+        r._digits = None
+        r._digitPowers = None
+        if not len(nonzero):
+            r._digitArray = np.zeros(0, dtype=np.int8)
+            r.highestPower = -1
+            return r
+        
+        # Keep nonzero span, padded with zeros up to power -1 and down to power 0
+        top = highestPower - int(nonzero[0])
+        bottom = highestPower - int(nonzero[-1])
+        kept = np.concatenate([
+            np.zeros(max(0, -1 - top), dtype=np.int64),
+            digits[nonzero[0]:nonzero[-1]+1],
+            np.zeros(max(0, bottom), dtype=np.int64),
+        ])
+        r._digitArray = kept.astype(np.int8)
+        r.highestPower = max(top, -1)
+        return r
+    
     def __mul__(self, other):
-        """Multiply two Rationals by the grid method"""
+        """Multiply two Rationals by the grid method
+        
+        The grid of digit products is summed along its diagonals (powers of
+        ten) as a convolution of the digit arrays.
+        """
 
-        if not self.digits or not other.digits:
+        if not len(self._digitArray) or not len(other._digitArray):
             return Rational('0')
         
-        # 1. Compute products of individual digits, tracking powers of ten
-        productsByPower = defaultdict(int)
-        for selfDigit, selfPower in self.digitPowers:
-            for otherDigit, otherPower in other.digitPowers:
-                productsByPower[selfPower + otherPower] += Rational.multTable[selfDigit][otherDigit]
-        
-        # 2. Loop over components, adding runover to the next digit until
-        #    all components are in the range 0-9
-        lowestPower = min(productsByPower.keys())
-        highestPower = max(productsByPower.keys())
-        currentPower = lowestPower
-        while currentPower <= highestPower:
-            currentProduct = productsByPower[currentPower]
-            if currentProduct > 9:
-                productsByPower[currentPower] = currentProduct % 10
-                productsByPower[currentPower+1] += currentProduct // 10
-                if currentPower == highestPower:
-                    highestPower += 1
-            currentPower += 1
+        # 1. Convolve digit arrays; entry i sums the digit products with
+        #    power self.highestPower + other.highestPower - i
+        products = np.convolve(
+            self._digitArray.astype(np.int64), other._digitArray.astype(np.int64)
+        )
+        
+        # 2. Carry in ascending order, with room for the final carry digits
+        room = len(str(int(products.max())))
+        ascending = np.concatenate([products[::-1], np.zeros(room, dtype=np.int64)])
+        digits = carryDigits(ascending)[::-1]
         
         # 3. Construct and return the product from its digits
-        return Rational.fromDigits(
-            digits = [productsByPower[p] for p in range(highestPower, lowestPower-1, -1)],
-            highestPower = highestPower, 
-            negative = (self.isNegative and not other.isNegative) or (not self.isNegative and other.isNegative)
+        return Rational.fromDigitArray(
+            digits,
+            highestPower = self.highestPower + other.highestPower + room,
+            negative = (self.isNegative != other.isNegative)
         )
         
 
@@ -155,13 +312,8 @@ class Number():
         s = string
         if not preReversed:
             s = s[::-1]
-        s = s.rstrip('-')
-        if s == '0'*len(s) or s == '':
-            s = '0'
-        else:
-            s = s.rstrip('0')
-            
-        self.string = s
+        self.string = s.rstrip('-').rstrip('0') or '0'
+
         self.isNegative = isNegative
         
     def __str__(self):
@@ -170,7 +322,8 @@ class Number():
         return self.string[::-1]
     
     def asInt(self):
-        return int(str(self))
+        value = intFromLimbs(limbsFromString(self.string[::-1]))
+        return -value if self.isNegative else value
     
     def negated(self):
         return Number(self.string, isNegative=(not self.isNegative), preReversed=True)
@@ -341,6 +494,19 @@ class Number():
         
         self.string = '0'*power + self.string
         
+    def exactDivide(self, d):
+        """Divide by a small positive int d, which must divide self exactly"""
+        
+        quotient = []
+        r = 0
+        for digit in reversed(self.string):
+            r = r*10 + int(digit)
+            quotient.append(str(r // d))
+            r %= d
+        if r:
+            raise ValueError('{} is not divisible by {}'.format(str(self), d))
+        return Number(''.join(quotient), isNegative=self.isNegative)
+        
     def multiplySingleDigits(self, other):
         """Multiply two positive single-digit Numbers"""
         
@@ -355,6 +521,234 @@ class Number():
         )
         
         
+class LimbNumber:
+    """
+    For storing and operating on integers represented by an array of
+    base 10**9 limbs (least significant first) and a sign bit.
+    Drop-in alternative to Number: add/subtract work a limb at a time
+    instead of a character at a time.
+    """
+    
+    __slots__ = ('limbs', 'isNegative')
+    
+    BASE = 10**9
+    LIMB_DIGITS = 9
+    
+    def __init__(self, string, isNegative=False, preReversed=False):
+        s = string
+        if preReversed:
+            s = s[::-1]
+        s = s.lstrip('-').lstrip('0')
+        self.limbs = array('I', limbsFromString(s, LimbNumber.LIMB_DIGITS).tobytes())
+        self.isNegative = isNegative
+        
+    @classmethod
+    def fromLimbs(cls, limbs, isNegative=False):
+        """Construct from array('I') of limbs (least significant first)"""
+        
+        number = cls.__new__(cls)
+        while limbs and limbs[-1] == 0:
+            limbs.pop()
+        number.limbs = limbs
+        number.isNegative = isNegative
+        return number
+    
+    def __str__(self):
+        sign = '-' if self.isNegative else ''
+        if not self.limbs:
+            return sign + '0'
+        return sign + stringFromLimbs(self.limbs, LimbNumber.LIMB_DIGITS)
+    
+    def __repr__(self):
+        return f"<LimbNumber: { str(self) }>"
+    
+    @property
+    def string(self):
+        """Reversed decimal string, as stored by Number"""
+        
+        return str(self).lstrip('-')[::-1]
+    
+    def asInt(self):
+        value = intFromLimbs(self.limbs, LimbNumber.LIMB_DIGITS)
+        return -value if self.isNegative else value
+    
+    def negated(self):
+        return LimbNumber.fromLimbs(array('I', self.limbs), not self.isNegative)
+        
+    def __len__(self):
+        if not self.limbs:
+            return 1
+        return LimbNumber.LIMB_DIGITS*(len(self.limbs)-1) + len(str(self.limbs[-1]))
+    
+    @staticmethod
+    def compareLimbs(a, b):
+        """Return -1, 0 or 1 as magnitude a is less than, equal to or greater than b"""
+        
+        if len(a) != len(b):
+            return -1 if len(a) < len(b) else 1
+        for i in range(len(a)-1, -1, -1):
+            if a[i] != b[i]:
+                return -1 if a[i] < b[i] else 1
+        return 0
+    
+    @staticmethod
+    def addLimbs(a, b):
+        """Return magnitude a + b"""
+        
+        if len(a) < len(b):
+            a, b = b, a
+        BASE = LimbNumber.BASE
+        r = array('I', a)
+        r.append(0)
+        carry = 0
+        for i in range(len(b)):
+            s = a[i] + b[i] + carry
+            if s >= BASE:
+                r[i] = s - BASE
+                carry = 1
+            else:
+                r[i] = s
+                carry = 0
+        i = len(b)
+        while carry:
+            s = r[i] + 1
+            if s == BASE:
+                r[i] = 0
+            else:
+                r[i] = s
+                carry = 0
+            i += 1
+        return r
+    
+    @staticmethod
+    def subtractLimbs(a, b):
+        """Return magnitude a - b; assumes a >= b"""
+        
+        BASE = LimbNumber.BASE
+        r = array('I', a)
+        borrow = 0
+        for i in range(len(b)):
+            s = a[i] - b[i] - borrow
+            if s < 0:
+                r[i] = s + BASE
+                borrow = 1
+            else:
+                r[i] = s
+                borrow = 0
+        i = len(b)
+        while borrow:
+            if r[i] == 0:
+                r[i] = BASE - 1
+            else:
+                r[i] -= 1
+                borrow = 0
+            i += 1
+        return r
+    
+    def __add__(self, other):
+        if self.isNegative == other.isNegative:
+            return LimbNumber.fromLimbs(
+                LimbNumber.addLimbs(self.limbs, other.limbs), self.isNegative
+            )
+        # Signs differ: subtract smaller magnitude from larger
+        if LimbNumber.compareLimbs(self.limbs, other.limbs) >= 0:
+            return LimbNumber.fromLimbs(
+                LimbNumber.subtractLimbs(self.limbs, other.limbs), self.isNegative
+            )
+        return LimbNumber.fromLimbs(
+            LimbNumber.subtractLimbs(other.limbs, self.limbs), other.isNegative
+        )
+    
+    def __sub__(self, other):
+        return self + LimbNumber.fromLimbs(other.limbs, not other.isNegative)
+    
+    def __eq__(self, other):
+        if self.isNegative != other.isNegative:
+            return not self.limbs and not other.limbs
+        return self.limbs == other.limbs
+    
+    def __lt__(self, other):
+        """Return self < other"""
+        
+        selfNegative = self.isNegative and bool(self.limbs)
+        otherNegative = other.isNegative and bool(other.limbs)
+        if selfNegative != otherNegative:
+            return selfNegative
+        c = LimbNumber.compareLimbs(self.limbs, other.limbs)
+        return c > 0 if selfNegative else c < 0
+    
+    def decimalDecompose(self, power):
+        """
+        Given power of ten, return LimbNumbers x0, x1 
+        where x1*(10**power) + x0 = self
+        """
+        
+        q, r = divmod(power, LimbNumber.LIMB_DIGITS)
+        low = array('I', self.limbs[:q+1])
+        if len(low) > q:
+            low[q] %= 10**r
+        high = array('I', self.limbs[q:])
+        if r and high:
+            lowFactor = 10**r
+            highFactor = 10**(LimbNumber.LIMB_DIGITS - r)
+            for i in range(len(high)):
+                nextLimb = high[i+1] if i+1 < len(high) else 0
+                high[i] = high[i]//lowFactor + (nextLimb % lowFactor)*highFactor
+        return (
+            LimbNumber.fromLimbs(low, self.isNegative), #x0
+            LimbNumber.fromLimbs(high, self.isNegative), #x1
+        )
+        
+    def multiplyTenPower(self, power):
+        """Multiply self by 10**power. Power must be nonnegative"""
+        
+        if not self.limbs:
+            return
+        q, r = divmod(power, LimbNumber.LIMB_DIGITS)
+        limbs = self.limbs
+        if r:
+            lowFactor = 10**(LimbNumber.LIMB_DIGITS - r)
+            highFactor = 10**r
+            shifted = array('I', bytes(4*(len(limbs)+1)))
+            for i in range(len(limbs)):
+                high, low = divmod(limbs[i], lowFactor)
+                shifted[i] += low*highFactor
+                shifted[i+1] = high
+            limbs = shifted
+            while limbs[-1] == 0:
+                limbs.pop()
+        self.limbs = array('I', bytes(4*q)) + limbs
+        
+    def exactDivide(self, d):
+        """Divide by a small positive int d, which must divide self exactly"""
+        
+        BASE = LimbNumber.BASE
+        quotient = array('I', self.limbs)
+        r = 0
+        for i in range(len(quotient)-1, -1, -1):
+            r = r*BASE + quotient[i]
+            quotient[i] = r // d
+            r %= d
+        if r:
+            raise ValueError('{} is not divisible by {}'.format(str(self), d))
+        return LimbNumber.fromLimbs(quotient, self.isNegative)
+        
+    def multiplySingleDigits(self, other):
+        """Multiply two positive single-digit LimbNumbers"""
+        
+        if len(self) > 1 or len(other) > 1:
+            raise ValueError(
+                'Must be single digits; received {}, {}'.format(str(self), str(other))
+            )
+        
+        a = self.limbs[0] if self.limbs else 0
+        b = other.limbs[0] if other.limbs else 0
+        return LimbNumber.fromLimbs(
+            array('I', [a*b]),
+            isNegative = (self.isNegative != other.isNegative)
+        )
+        
+        
 class Complex:
     """Complex numbers represented as a real and imaginary part"""
     
@@ -401,3 +795,116 @@ class Complex:
         """Swap real and imaginary parts"""
         
         return Complex(self.im, self.re)
+        
+        
+class ComplexArray:
+    """
+    Sequence of complex numbers stored as two contiguous float64 arrays,
+    re and im. Arithmetic is elementwise and vectorized, so no Complex
+    is allocated per element; indexing with an int still yields a Complex.
+    """
+    
+    __slots__ = ('re', 'im')
+    
+    def __init__(self, re, im=None):
+        self.re = np.array(re, dtype=np.float64)
+        if im is None:
+            self.im = np.zeros(len(self.re))
+        else:
+            self.im = np.array(im, dtype=np.float64)
+        if self.re.shape != self.im.shape or self.re.ndim != 1:
+            raise ValueError('re and im must be 1-d arrays of equal length')
+    
+    @classmethod
+    def fromBuffers(cls, re, im):
+        """Wrap float64 arrays without copying"""
+        
+        z = cls.__new__(cls)
+        z.re = re
+        z.im = im
+        return z
+    
+    @classmethod
+    def of(cls, x):
+        """Return x if it is a ComplexArray, else convert a sequence of Complex"""
+        
+        if isinstance(x, ComplexArray):
+            return x
+        return cls([c.re for c in x], [c.im for c in x])
+    
+    @classmethod
+    def zeros(cls, n):
+        return cls.fromBuffers(np.zeros(n), np.zeros(n))
+    
+    def copy(self):
+        return ComplexArray.fromBuffers(self.re.copy(), self.im.copy())
+    
+    def __len__(self):
+        return len(self.re)
+    
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return ComplexArray.fromBuffers(self.re[i], self.im[i])
+        return Complex(float(self.re[i]), float(self.im[i]))
+    
+    def __setitem__(self, i, value):
+        self.re[i] = value.re
+        self.im[i] = value.im
+    
+    def __iter__(self):
+        for a, b in zip(self.re.tolist(), self.im.tolist()):
+            yield Complex(a, b)
+    
+    def __repr__(self):
+        return '<ComplexArray: {}>'.format(list(self))
+    
+    def __eq__(self, other):
+        """Elementwise equality within the tolerance of Complex.__eq__"""
+        
+        tol = 10**-12
+        try:
+            other = ComplexArray.of(other)
+        except (TypeError, AttributeError):
+            return NotImplemented
+        return len(self) == len(other) and bool(
+            np.all(np.abs(self.re - other.re) < tol) and
+            np.all(np.abs(self.im - other.im) < tol)
+        )
+    
+    def _checkLength(self, other):
+        """Raise ValueError for a ComplexArray operand of another length"""
+        
+        if isinstance(other, ComplexArray) and len(other) != len(self):
+            raise ValueError('Lengths differ: {} and {}'.format(len(self), len(other)))
+    
+    def __add__(self, other):
+        self._checkLength(other)
+        return ComplexArray.fromBuffers(self.re + other.re, self.im + other.im)
+    
+    def __sub__(self, other):
+        self._checkLength(other)
+        return ComplexArray.fromBuffers(self.re - other.re, self.im - other.im)
+    
+    def __mul__(self, other):
+        """Elementwise product with a ComplexArray, or product with one Complex"""
+        
+        self._checkLength(other)
+        return ComplexArray.fromBuffers(
+            self.re*other.re - self.im*other.im,
+            self.re*other.im + self.im*other.re
+        )
+    
+    def __rmul__(self, r):
+        return ComplexArray.fromBuffers(r*self.re, r*self.im)
+    
+    def scale(self, r):
+        """Multiply every element by real r in place"""
+        
+        self.re *= r
+        self.im *= r
+        return self
+    
+    def swap(self):
+        """Swap real and imaginary parts (shares buffers with self)"""
+        
+        return ComplexArray.fromBuffers(self.im, self.re)
@@ -1,18 +1,25 @@
 import math
-import matplotlib.pyplot as plt
+from array import array
+from functools import partial
 import numpy as np
-from customnumbers import Complex
+try:
+    from .customnumbers import Complex, ComplexArray, carryDigits, digitsFromString, stringFromDigits
+    from .fft import fftArrays, fftRealPair, fftRealPairArrays, irfft, irfftArrays, getPlan
+except ImportError:
+    from customnumbers import Complex, ComplexArray, carryDigits, digitsFromString, stringFromDigits
+    from fft import fftArrays, fftRealPair, fftRealPairArrays, irfft, irfftArrays, getPlan
 
 def DFTdirect(x):
     """Compute the DFT of series from the definition"""
     
     N = len(x)
+    plan = getPlan(N)
     X = []
     for k in range(N):
         X_k = Complex(0,0)
         for n in range(N):
-            a = 2*math.pi*k*n/N
-            X_k += x[n]*Complex(math.cos(a), -math.sin(a))
+            m = (k*n) % N
+            X_k += x[n]*Complex(plan.cosTable[m], -plan.sinTable[m])
         X.append(X_k)
     return X
     
@@ -20,53 +27,78 @@ def IDFTdirect(X):
     """Compute inverse DFT from the definition"""
     
     N = len(X)
+    plan = getPlan(N)
     x = []
     for n in range(N):
         x_n = Complex(0,0)
         for k in range(N):
-            a = 2*math.pi*k*n/N
-            x_n += X[k]*Complex(math.cos(a), math.sin(a))
+            m = (k*n) % N
+            x_n += X[k]*Complex(plan.cosTable[m], plan.sinTable[m])
         x.append((1/N)*x_n)
     return x
     
+def toBuffers(x):
+    """Split list of Complex into flat buffers of real and imaginary parts"""
+    
+    return array('d', (c.re for c in x)), array('d', (c.im for c in x))
+    
+def fromBuffers(re, im):
+    """Join flat buffers of real and imaginary parts into list of Complex"""
+    
+    return [Complex(a, b) for a, b in zip(re, im)]
+    
 def DFTct(x):
     """Compute DFT by Cooley-Tukey algorithm
     
+    Runs the vectorized iterative FFT in fft.py on a copy of x.
+    Accepts a ComplexArray or a list of Complex; returns a ComplexArray.
     Note: assumes len(x) is a power of 2
     """
     
-    N = len(x)
-    if N == 2:
-        return [x[0] + x[1], x[0] - x[1]]
-        
-    Half_N = int(N/2)
-    X = [0]*N
-    
-    Evens = DFTct([x[2*n]   for n in range(Half_N)])
-    Odds =  DFTct([x[2*n+1] for n in range(Half_N)])
-    
-    for k in range(Half_N):
-        a = 2*math.pi*k/N
-        w = Complex(math.cos(a), -math.sin(a))
-        E_k = Evens[k]
-        O_k = w*Odds[k]
-        X[k] = E_k + O_k
-        X[k + Half_N] = E_k - O_k
+    X = ComplexArray.of(x).copy()
+    fftArrays(X.re, X.im)
     return X
     
 def swap(C):
-    """Vectorize Complex.swap (apply swap to every Complex in list)"""
+    """Vectorize Complex.swap (swap real and imaginary parts of every element)"""
     
-    return [c.swap() for c in C]
+    return ComplexArray.of(C).swap()
     
 def IDFTshortcut(X):
     """Compute inverse DFT using swap function and Cooley-Tukey DFT
     
+    Return: ComplexArray
+    Note: assumes len(X) is a power of 2
+    """
+    
+    return swap(DFTct(swap(X))).scale(1/len(X))
+    
+def DFTrealPair(x, y):
+    """Compute DFTs of two real sequences with one Cooley-Tukey DFT
+    
+    Return: lists of Complex X, Y (full length)
+    Note: assumes len(x) == len(y) is a power of 2
+    """
+    
+    N = len(x)
+    X_re, X_im, Y_re, Y_im = fftRealPair(x, y)
+    X = fromBuffers(X_re, X_im)
+    Y = fromBuffers(Y_re, Y_im)
+    # Remaining bins follow from Hermitian symmetry X_{N-k} = conj(X_k)
+    for k in range(N//2 + 1, N):
+        X.append(Complex(X[N-k].re, -X[N-k].im))
+        Y.append(Complex(Y[N-k].re, -Y[N-k].im))
+    return X, Y
+    
+def IDFTreal(X):
+    """Compute inverse DFT of a Hermitian sequence by half-length DFT
+    
+    Return: list of floats (the inverse is real)
     Note: assumes len(X) is a power of 2
     """
     
-    N_inv = 1/len(X)
-    return [N_inv*c for c in swap(DFTct(swap(X)))]
+    re, im = toBuffers(X[:len(X)//2 + 1])
+    return list(irfft(re, im))
     
 def testDFT(DFTfn, IDFTfn, TOL=10**-6, LEN=2**7):
     """Test that IDFT(DFT(x)) = x, within tolerance"""
@@ -134,67 +166,214 @@ def testDFTmultiply(DFTfn, IDFTfn):
     print('Passed {} out of {} cases.'.format(passed, passed+failed))
     return failed_cases
     
-def DFTmultiply(x, y, DFTfn, IDFTfn, stringsReversed=False):
+"""Digit packing limits
+
+MAX_DIGITS_PER_POINT -- largest number of decimal digits packed per DFT point
+MAX_ROUNDING_ERROR -- largest acceptable a priori bound on coefficient error
+ROUNDING_TOLERANCE -- largest acceptable observed distance of an inverse DFT
+    coefficient from its rounded value when digits are packed
+"""
+MAX_DIGITS_PER_POINT = 4
+MAX_ROUNDING_ERROR = .125
+ROUNDING_TOLERANCE = .25
+
+def paddedLength(L_1, L_2):
+    """Power-of-2 DFT length holding the product of L_1- and L_2-point sequences"""
+    
+    return 2**math.ceil(math.log(L_1 + L_2, 2))
+
+def roundingErrorBound(digitsPerPoint, N_1, N_2):
+    """Estimate worst-case float error of product coefficients
+    
+    Args:
+    digitsPerPoint -- decimal digits packed into each DFT point
+    N_1, N_2 -- number of decimal digits in each operand
+    
+    The largest coefficient is at most min(L_1, L_2)*(base-1)**2, and
+    the error of a radix-2 transform grows with log2 of its length.
+    """
+    
+    k = digitsPerPoint
+    L_1, L_2 = math.ceil(N_1/k), math.ceil(N_2/k)
+    N = paddedLength(L_1, L_2)
+    largestCoefficient = min(L_1, L_2)*(10**k - 1)**2
+    return largestCoefficient * 2**-53 * 4*max(1, math.log(N, 2))
+
+def chooseDigitsPerPoint(N_1, N_2, largest=MAX_DIGITS_PER_POINT):
+    """Largest packing, at most largest digits per point, safe for the operand lengths"""
+    
+    for k in range(largest, 1, -1):
+        if roundingErrorBound(k, N_1, N_2) < MAX_ROUNDING_ERROR:
+            return k
+    return 1
+
+def DFTmultiply(
+    x, y, DFTfn=DFTct, IDFTfn=IDFTshortcut, stringsReversed=False,
+    backend='python', digitsPerPoint='auto'
+):
     """Compute product of two numbers using DFT algorithm
     
     Args: 
     x, y -- decimal strings
     DFTfn, IDFTfn -- functions to compute transform and inverse transform
     stringsReversed -- bool indicating if x, y are reversed (i.e. in ascending order)
+    backend -- 'python', or 'numpy' to run every step on NumPy arrays
+        (DFTfn, IDFTfn are then ignored)
+    digitsPerPoint -- decimal digits k packed into each DFT point, i.e. the
+        sequences are in base 10**k; 'auto' picks k from the operand lengths
     
     Return: decimal string of x*y in usual order (i.e. in descending order)
+    
+    With the default DFTct/IDFTshortcut pair the transforms run on float64
+    NumPy arrays with the vectorized fftArrays; any other pair is called
+    on lists of Complex.
+    Packing is reduced while roundingErrorBound is too large, and if packed
+    coefficients still come back too far from integers to round safely,
+    the product is recomputed with one fewer digit per point.
     """
     
-    # 1. Convert decimal strings to lists of digits, pad with zeros so that length
-    #    is a power of 2
-    N_1 = len(x)
-    N_2 = len(y)
-    p = math.log(N_1 + N_2, 2)
-    N = 2**math.ceil(p)
+    if backend == 'numpy':
+        multiplyFn = numpyDFTmultiply
+    elif backend == 'python':
+        multiplyFn = partial(pythonDFTmultiply, DFTfn=DFTfn, IDFTfn=IDFTfn)
+    else:
+        raise ValueError('Unknown backend: {}'.format(backend))
     
-    if stringsReversed:
-        x_seq = [int(d) for d in x] + [0]*(N - N_1) 
-        y_seq = [int(d) for d in y] + [0]*(N - N_2)
+    if digitsPerPoint == 'auto':
+        k = chooseDigitsPerPoint(len(x), len(y))
     else:
-        x_seq = [int(d) for d in x[::-1]] + [0]*(N - N_1) 
-        y_seq = [int(d) for d in y[::-1]] + [0]*(N - N_2)
+        k = chooseDigitsPerPoint(len(x), len(y), largest=digitsPerPoint)
+    r = multiplyFn(x, y, stringsReversed, k)
+    while r is None:
+        k -= 1
+        r = multiplyFn(x, y, stringsReversed, k)
+    return r
+
+def pythonDFTmultiply(
+    x, y, stringsReversed=False, digitsPerPoint=1, DFTfn=DFTct, IDFTfn=IDFTshortcut
+):
+    """DFTmultiply on Python lists; None if packed rounding is unsafe"""
+    
+    # 1. Convert decimal strings to lists of base 10**k coefficients, pad with
+    #    zeros so that length is a power of 2
+    k = digitsPerPoint
+    if not stringsReversed:
+        x, y = x[::-1], y[::-1]
+    x_seq = packDigits(x, k)
+    y_seq = packDigits(y, k)
+    N_1 = len(x_seq)
+    N_2 = len(y_seq)
+    N = paddedLength(N_1, N_2)
+    x_seq += [0]*(N - N_1)
+    y_seq += [0]*(N - N_2)
     
     # 2. Compute DFT of sequences and multiply them elementwise
-    X = DFTfn([Complex(d, 0) for d in x_seq])
-    Y = DFTfn([Complex(d, 0) for d in y_seq])
-    C = [a*b for a,b in zip(X,Y)]
-    
     # 3. Compute inverse DFT to get coefficients of product polynomial
-    c = IDFTfn(C)
-    c_seq = [round(s.re) for s in c]
+    if DFTfn is DFTct and IDFTfn is IDFTshortcut:
+        c = flatConvolve(x_seq, y_seq).tolist()
+    else:
+        X = ComplexArray.of(DFTfn(ComplexArray(x_seq)))
+        Y = ComplexArray.of(DFTfn(ComplexArray(y_seq)))
+        c = ComplexArray.of(IDFTfn(X*Y)).re.tolist()
+    c_seq = [round(s) for s in c]
+    if k > 1 and max(abs(s - r) for s, r in zip(c, c_seq)) > ROUNDING_TOLERANCE:
+        return None
     
     # 4. Do carry operation and return cleaned decimal string
+    base = 10**k
     carry = 0
     c_seq_carry = []
     for digit in c_seq:
         s = digit + carry
-        new_digit, carry = s % 10, s//10
+        new_digit, carry = s % base, s//base
         c_seq_carry.append(new_digit)
     
-    r = ''.join([str(d) for d in c_seq_carry])
-    r = r.rstrip('0')[::-1]
-    return r
+    return digitString(unpackDigitArray(np.array(c_seq_carry, dtype=np.int64), k))
+
+def packDigits(s, k):
+    """Split reversed decimal string into list of base 10**k coefficients"""
+    
+    return packDigitArray(digitsFromString(s), k).astype(np.int64).tolist()
+
+def flatConvolve(x_seq, y_seq):
+    """Cyclic convolution of two equal-length integer sequences by vectorized FFT
+    
+    Both (real) sequences are transformed by one complex FFT (fftArrays),
+    and the Hermitian product spectrum is inverted by a half-length FFT.
+    Returns the (unrounded) float64 array of coefficients.
+    Note: assumes len(x_seq) is a power of 2
+    """
+    
+    plan = getPlan(len(x_seq))
+    X_re, X_im, Y_re, Y_im = fftRealPairArrays(x_seq, y_seq, plan=plan)
+    return irfftArrays(X_re*Y_re - X_im*Y_im, X_re*Y_im + X_im*Y_re, plan=plan)
+
+def numpyDFTmultiply(x, y, stringsReversed=False, digitsPerPoint=1):
+    """DFTmultiply with digits, spectra and carries held in NumPy arrays
+    
+    Returns None if packed rounding is unsafe.
+    """
+    
+    k = digitsPerPoint
+    x_seq = packDigitArray(digitArray(x, stringsReversed), k)
+    y_seq = packDigitArray(digitArray(y, stringsReversed), k)
+    N = paddedLength(len(x_seq), len(y_seq))
+    
+    C = np.fft.rfft(x_seq, N)*np.fft.rfft(y_seq, N)
+    c = np.fft.irfft(C, N)
+    c_seq = np.rint(c)
+    if k > 1 and np.abs(c - c_seq).max() > ROUNDING_TOLERANCE:
+        return None
+    
+    c_seq = carryDigits(c_seq.astype(np.int64), base=10**k)
+    return digitString(unpackDigitArray(c_seq, k))
+
+def packDigitArray(digits, k):
+    """Combine ascending digit array into float64 array of base 10**k coefficients"""
+    
+    padded = np.zeros(-(-len(digits)//k)*k)
+    padded[:len(digits)] = digits
+    return padded.reshape(-1, k) @ (10.0**np.arange(k))
+
+def unpackDigitArray(c, k):
+    """Split ascending base 10**k coefficients into ascending digit array
+    
+    A 2-d array is split row by row.
+    """
+    
+    digits = (c[..., None] // 10**np.arange(k)) % 10
+    return digits.reshape(c.shape[:-1] + (-1,))
+
+def digitArray(s, stringsReversed=False):
+    """Convert decimal string to int8 array of digits in ascending order"""
+    
+    digits = digitsFromString(s)
+    if not stringsReversed:
+        digits = digits[::-1]
+    return digits
+
+def digitString(digits):
+    """Convert array of digits in ascending order to stripped decimal string"""
+    
+    nonzero = np.flatnonzero(digits)
+    if not len(nonzero):
+        return ''
+    return stringFromDigits(digits[nonzero[-1]::-1])
 
 def plotDFT(x):
     """Plot sequence x and its DFT in the complex plane"""
     
+    import matplotlib.pyplot as plt
+    
     X = DFTdirect(x)
     plt.plot([c.re for c in x], [c.im for c in x], 'ro')
     plt.plot([c.re for c in X], [c.im for c in X], 'bo')
     plt.show()
     
 def randomSeq(n, a, b):
-    """Random Complex seq, length n, with components in range [a, b)"""
+    """Random ComplexArray, length n, with components in range [a, b)"""
     
-    return [
-        Complex(a + np.random.random()*(b-a), a + np.random.random()*(b-a))
-        for _ in range(n)
-    ]
+    return ComplexArray.fromBuffers(np.random.uniform(a, b, n), np.random.uniform(a, b, n))
     
 
     
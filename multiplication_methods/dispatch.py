@@ -0,0 +1,170 @@
+"""
+Size-aware multiplication of decimal strings
+
+multiply(a, b) picks grid, Karatsuba, Toom-3 or FFT multiplication from
+the length of the shorter operand. Each method takes over from the one
+before it at a crossover length; defaults can be replaced by lengths
+measured on the current machine with calibrate, which persists them via
+the tuning module.
+"""
+
+
+import random
+try:
+    from .customnumbers import Rational, LimbNumber
+    from .dft import DFTmultiply
+    from .karatsuba import Karatsuba
+    from .toom import ToomCook3
+    from .tuning import bestTime, getTuning, saveTuning
+except ImportError:
+    from customnumbers import Rational, LimbNumber
+    from dft import DFTmultiply
+    from karatsuba import Karatsuba
+    from toom import ToomCook3
+    from tuning import bestTime, getTuning, saveTuning
+
+
+TUNING_KEY = 'dispatch_crossovers'
+
+"""Shortest operand length (digits) at which each method takes over
+
+A method whose crossover is not below the next method's is never used;
+with the NumPy FFT backend that is usually the case for Toom-3.
+"""
+DEFAULT_CROSSOVERS = {'karatsuba': 8, 'toom3': 128, 'fft': 128}
+
+CALIBRATION_SIZES = (4, 8, 16, 32, 64, 128, 256, 512, 1024, 2048, 4096, 8192)
+
+
+"""Crossovers and multipliers in use, read by reloadTuning on first use"""
+_crossovers = None
+_karatsuba = None
+_toom = None
+
+
+def gridMultiply(x, y):
+    return str(Rational(x)*Rational(y))
+
+def karatsubaMultiply(x, y):
+    if _karatsuba is None:
+        reloadTuning()
+    return _karatsuba.multiply(x, y)
+
+def toomMultiply(x, y):
+    if _toom is None:
+        reloadTuning()
+    return _toom.multiply(x, y)
+
+def fftMultiply(x, y):
+    return DFTmultiply(x, y, backend='numpy') or '0'
+
+"""Methods in order of increasing operand size"""
+METHODS = [
+    ('grid', gridMultiply),
+    ('karatsuba', karatsubaMultiply),
+    ('toom3', toomMultiply),
+    ('fft', fftMultiply),
+]
+
+
+def loadCrossovers(path=None):
+    crossovers = dict(DEFAULT_CROSSOVERS)
+    crossovers.update(getTuning(TUNING_KEY, {}, path))
+    return crossovers
+
+def reloadTuning(path=None):
+    """Read the crossovers and Karatsuba and Toom-3 thresholds from path
+
+    multiply uses the values read by the latest call of this function,
+    which it makes itself on first use (calibrate calls it after saving).
+    """
+
+    global _crossovers, _karatsuba, _toom
+    _crossovers = loadCrossovers(path)
+    _karatsuba = Karatsuba(numberClass=LimbNumber, tuningPath=path)
+    _toom = ToomCook3(numberClass=LimbNumber, tuningPath=path)
+
+def chooseMethod(Lx, Ly, crossovers=None):
+    """Return (name, function) of the method to use for operands of lengths Lx, Ly
+
+    The last method (in METHODS order) whose crossover is at most
+    min(Lx, Ly) is chosen; a crossover of None means never.
+    """
+
+    if crossovers is None:
+        if _crossovers is None:
+            reloadTuning()
+        crossovers = _crossovers
+    n = min(Lx, Ly)
+    chosen = METHODS[0]
+    for name, fn in METHODS[1:]:
+        crossover = crossovers.get(name)
+        if crossover is not None and crossover <= n:
+            chosen = (name, fn)
+    return chosen
+
+def multiply(x, y, crossovers=None):
+    """
+    Multiply decimal strings by the fastest method for their size
+
+    Args:
+    -- x, y: decimal strings (in usual order) of integers, optionally signed
+    -- crossovers: dict of method name -> crossover length; defaults to
+       calibrated values, or DEFAULT_CROSSOVERS if not calibrated
+
+    Returns: decimal string (in usual order) of the product
+    """
+
+    isNegative = x.startswith('-') != y.startswith('-')
+    x = x.lstrip('-').lstrip('0') or '0'
+    y = y.lstrip('-').lstrip('0') or '0'
+    if x == '0' or y == '0':
+        return '0'
+    _, fn = chooseMethod(len(x), len(y), crossovers)
+    product = fn(x, y)
+    return '-' + product if isNegative else product
+
+def calibrate(sizes=CALIBRATION_SIZES, repeats=3, save=True, path=None):
+    """Measure crossover lengths between methods on this machine
+
+    Times every method on random operands of each size (after one warmup
+    call), dropping a method once a later one is ten times faster. A
+    method's crossover is the first size from which it or a later method
+    is fastest at every larger size; None if the last size is won by an
+    earlier method. If save, the crossovers are persisted (to path) and
+    used by multiply from then on.
+
+    Returns: (crossovers, dict of size -> dict of method name -> seconds)
+    """
+
+    names = [name for name, _ in METHODS]
+    active = list(names)
+    times = {}
+    bestLevels = []
+    for n in sizes:
+        x = random.choice('123456789') + ''.join(random.choices('0123456789', k=n-1))
+        y = random.choice('123456789') + ''.join(random.choices('0123456789', k=n-1))
+        times[n] = {}
+        for name, fn in METHODS:
+            if name in active:
+                fn(x, y)
+                times[n][name] = bestTime(fn, x, y, repeats=repeats)
+        best = min(times[n], key=times[n].get)
+        bestLevels.append(names.index(best))
+        active = [
+            name for name in active
+            if names.index(name) > bestLevels[-1] or times[n][name] < 10*times[n][best]
+        ]
+
+    crossovers = {}
+    for i, name in enumerate(names[1:], start=1):
+        crossovers[name] = None
+        for n, bestLevel in reversed(list(zip(sizes, bestLevels))):
+            if bestLevel < i:
+                break
+            crossovers[name] = n
+
+    if save:
+        saveTuning(TUNING_KEY, crossovers, path)
+        reloadTuning(path)
+    return crossovers, times
@@ -0,0 +1,299 @@
+"""
+Iterative, in-place radix-2 FFT operating on flat float buffers
+
+A sequence of N complex numbers is stored as two buffers of length N,
+one holding the real parts and one the imaginary parts. Buffers may be
+lists of floats or array('d'); they are modified in place.
+"""
+
+
+import math
+from array import array
+from collections import OrderedDict
+import numpy as np
+
+
+"""Upper bound on total size of cached plans; least recently used are evicted"""
+MAX_CACHED_PLAN_BYTES = 64*2**20
+
+_planCache = OrderedDict()
+_planCacheBytes = 0
+
+
+def isPowerOfTwo(n):
+    return n > 0 and n & (n-1) == 0
+
+
+class FFTPlan:
+    """Precomputed tables for transforms of length N
+
+    cosTable[m], sinTable[m] hold cos(2*pi*m/N), sin(2*pi*m/N) for m < N,
+    so the root of unity for any (k, n) is found at index (k*n) % N.
+    For power-of-2 N, swaps lists the index pairs exchanged by the
+    bit-reversal permutation.
+    """
+
+    def __init__(self, N):
+        self.N = N
+        self.cosTable = array('d', (math.cos(2*math.pi*m/N) for m in range(N)))
+        self.sinTable = array('d', (math.sin(2*math.pi*m/N) for m in range(N)))
+        self.swaps = array('l')
+        if isPowerOfTwo(N):
+            self.swaps = bitReversalSwaps(N)
+
+    def __repr__(self):
+        return '<FFTPlan: N={}>'.format(self.N)
+
+    @property
+    def nbytes(self):
+        return sum(t.itemsize*len(t) for t in (self.cosTable, self.sinTable, self.swaps))
+
+
+def getPlan(N):
+    """Return the cached FFTPlan for length N, building it if necessary"""
+
+    global _planCacheBytes
+    plan = _planCache.get(N)
+    if plan is not None:
+        _planCache.move_to_end(N)
+        return plan
+
+    plan = FFTPlan(N)
+    _planCache[N] = plan
+    _planCacheBytes += plan.nbytes
+    while _planCacheBytes > MAX_CACHED_PLAN_BYTES and len(_planCache) > 1:
+        _, evicted = _planCache.popitem(last=False)
+        _planCacheBytes -= evicted.nbytes
+    return plan
+
+def clearPlanCache():
+    global _planCacheBytes
+    _planCache.clear()
+    _planCacheBytes = 0
+
+def bitReversalSwaps(N):
+    """Return flat array of index pairs (i, j), i < j, with j = bit-reverse of i"""
+
+    swaps = array('l')
+    j = 0
+    for i in range(1, N):
+        bit = N >> 1
+        while j & bit:
+            j ^= bit
+            bit >>= 1
+        j |= bit
+        if i < j:
+            swaps.append(i)
+            swaps.append(j)
+    return swaps
+
+def bitReverse(re, im, plan=None):
+    """Permute buffers in place into bit-reversed index order"""
+
+    if plan is None:
+        plan = getPlan(len(re))
+    swaps = plan.swaps
+    for s in range(0, len(swaps), 2):
+        i = swaps[s]
+        j = swaps[s+1]
+        re[i], re[j] = re[j], re[i]
+        im[i], im[j] = im[j], im[i]
+
+def fft(re, im, inverse=False, plan=None):
+    """Compute DFT of (re, im) in place
+
+    Uses the same sign convention as dft.DFTdirect, i.e.
+    X_k = sum_n x_n * exp(-2*pi*i*k*n/N). With inverse=True the
+    exponent sign is flipped; no 1/N scaling is applied (see ifft).
+    If no plan is given, the cached plan for len(re) is used.
+
+    Note: assumes len(re) == len(im) is a power of 2
+    """
+
+    N = len(re)
+    if not isPowerOfTwo(N) or len(im) != N:
+        raise ValueError('Buffer length must be a power of 2; received {}'.format(N))
+    if plan is None:
+        plan = getPlan(N)
+    elif plan.N != N:
+        raise ValueError('Plan of length {} used for buffer of length {}'.format(plan.N, N))
+    bitReverse(re, im, plan)
+    cosTable, sinTable = plan.cosTable, plan.sinTable
+    sign = 1.0 if inverse else -1.0
+
+    size = 2
+    while size <= N:
+        half = size >> 1
+        step = N // size
+        for k in range(half):
+            wr = cosTable[k*step]
+            wi = sign*sinTable[k*step]
+            for j in range(k, N, size):
+                l = j + half
+                xr = re[l]
+                xi = im[l]
+                tr = wr*xr - wi*xi
+                ti = wr*xi + wi*xr
+                ur = re[j]
+                ui = im[j]
+                re[j] = ur + tr
+                im[j] = ui + ti
+                re[l] = ur - tr
+                im[l] = ui - ti
+        size <<= 1
+
+def fftArrays(re, im, inverse=False, plan=None):
+    """Compute DFT of contiguous float64 NumPy arrays (re, im) in place
+
+    Same transform as fft, but each stage applies all its butterflies at
+    once: viewing the buffers as rows of length size, the second half of
+    every row is twiddled and added to/subtracted from the first half.
+    """
+
+    N = len(re)
+    if not isPowerOfTwo(N) or len(im) != N:
+        raise ValueError('Buffer length must be a power of 2; received {}'.format(N))
+    if plan is None:
+        plan = getPlan(N)
+    elif plan.N != N:
+        raise ValueError('Plan of length {} used for buffer of length {}'.format(plan.N, N))
+    swaps = np.frombuffer(plan.swaps, dtype='i{}'.format(plan.swaps.itemsize)).reshape(-1, 2)
+    re[swaps[:, 0]], re[swaps[:, 1]] = re[swaps[:, 1]], re[swaps[:, 0]]
+    im[swaps[:, 0]], im[swaps[:, 1]] = im[swaps[:, 1]], im[swaps[:, 0]]
+    cosTable = np.frombuffer(plan.cosTable)
+    sinTable = np.frombuffer(plan.sinTable)
+    sign = 1.0 if inverse else -1.0
+
+    size = 2
+    while size <= N:
+        half = size >> 1
+        wr = cosTable[:N//2:N//size]
+        wi = sign*sinTable[:N//2:N//size]
+        R, I = re.reshape(-1, size), im.reshape(-1, size)
+        xr, xi = R[:, half:], I[:, half:]
+        tr = wr*xr - wi*xi
+        ti = wr*xi + wi*xr
+        R[:, half:] = R[:, :half] - tr
+        I[:, half:] = I[:, :half] - ti
+        R[:, :half] += tr
+        I[:, :half] += ti
+        size <<= 1
+
+def ifft(re, im, plan=None):
+    """Compute inverse DFT of (re, im) in place, including 1/N scaling"""
+
+    fft(re, im, inverse=True, plan=plan)
+    N_inv = 1/len(re)
+    for i in range(len(re)):
+        re[i] *= N_inv
+        im[i] *= N_inv
+
+def fftRealPair(x, y, plan=None):
+    """Compute DFTs of two real sequences with a single complex FFT
+
+    The sequences are packed as z = x + iy. Since x and y are real their
+    DFTs are Hermitian (X_{N-k} = conj(X_k)), and they are recovered as
+    X_k = (Z_k + conj(Z_{N-k}))/2, Y_k = (Z_k - conj(Z_{N-k}))/2i.
+
+    Return: buffers X_re, X_im, Y_re, Y_im holding bins k = 0..N/2
+    Note: assumes len(x) == len(y) is a power of 2
+    """
+
+    N = len(x)
+    re, im = array('d', x), array('d', y)
+    fft(re, im, plan=plan)
+
+    H = N//2 + 1
+    X_re, X_im = array('d', bytes(8*H)), array('d', bytes(8*H))
+    Y_re, Y_im = array('d', bytes(8*H)), array('d', bytes(8*H))
+    for k in range(H):
+        j = (N - k) % N
+        ar, ai = re[k], im[k]
+        br, bi = re[j], -im[j]
+        X_re[k] = (ar + br)/2
+        X_im[k] = (ai + bi)/2
+        Y_re[k] = (ai - bi)/2
+        Y_im[k] = (br - ar)/2
+    return X_re, X_im, Y_re, Y_im
+
+def fftRealPairArrays(x, y, plan=None):
+    """Vectorized fftRealPair: transforms with fftArrays
+
+    Return: float64 arrays X_re, X_im, Y_re, Y_im holding bins k = 0..N/2
+    Note: assumes len(x) == len(y) is a power of 2
+    """
+
+    N = len(x)
+    re, im = np.array(x, dtype=np.float64), np.array(y, dtype=np.float64)
+    fftArrays(re, im, plan=plan)
+
+    H = N//2 + 1
+    j = (N - np.arange(H)) % N
+    ar, ai = re[:H], im[:H]
+    br, bi = re[j], -im[j]
+    return (ar + br)/2, (ai + bi)/2, (ai - bi)/2, (br - ar)/2
+
+def irfft(re, im, plan=None):
+    """Compute real inverse DFT from bins k = 0..N/2 of a Hermitian spectrum
+
+    Uses one complex FFT of length N/2: the even- and odd-indexed outputs
+    have DFTs E_k = (X_k + conj(X_{N/2-k}))/2 and
+    O_k = (X_k - conj(X_{N/2-k}))exp(2*pi*i*k/N)/2, so the inverse DFT
+    of E + iO holds them in its real and imaginary parts.
+
+    Args:
+    re, im -- buffers of length N/2 + 1
+    plan -- plan for length N (the output length)
+
+    Return: array('d') of length N
+    Note: assumes N is a power of 2
+    """
+
+    H = len(re) - 1
+    N = 2*H
+    if plan is None:
+        plan = getPlan(N)
+    cosTable, sinTable = plan.cosTable, plan.sinTable
+
+    z_re, z_im = array('d', bytes(8*H)), array('d', bytes(8*H))
+    for k in range(H):
+        ar, ai = re[k], im[k]
+        br, bi = re[H-k], -im[H-k]
+        dr, di = (ar - br)/2, (ai - bi)/2
+        wr, wi = cosTable[k], sinTable[k]
+        z_re[k] = (ar + br)/2 - (dr*wi + di*wr)
+        z_im[k] = (ai + bi)/2 + (dr*wr - di*wi)
+    ifft(z_re, z_im)
+
+    x = array('d', bytes(8*N))
+    x[0::2] = z_re
+    x[1::2] = z_im
+    return x
+
+def irfftArrays(re, im, plan=None):
+    """Vectorized irfft: bins k = 0..N/2 as NumPy arrays, transform by fftArrays
+
+    Return: float64 array of length N
+    Note: assumes N is a power of 2
+    """
+
+    H = len(re) - 1
+    N = 2*H
+    if plan is None:
+        plan = getPlan(N)
+    cosTable = np.frombuffer(plan.cosTable)
+    sinTable = np.frombuffer(plan.sinTable)
+
+    k = np.arange(H)
+    ar, ai = re[:H], im[:H]
+    br, bi = re[H-k], -im[H-k]
+    dr, di = (ar - br)/2, (ai - bi)/2
+    wr, wi = cosTable[:H], sinTable[:H]
+    z_re = (ar + br)/2 - (dr*wi + di*wr)
+    z_im = (ai + bi)/2 + (dr*wr - di*wi)
+    fftArrays(z_re, z_im, inverse=True)
+
+    x = np.empty(N)
+    x[0::2] = z_re/H
+    x[1::2] = z_im/H
+    return x
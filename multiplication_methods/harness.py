@@ -0,0 +1,178 @@
+"""
+Randomized correctness harness for multiplication methods
+
+Every case is generated from its own integer seed, so a failure is
+reproduced exactly by replayCase(method, seed, ...). Seeds are split into
+shards that run in a pool of processes, and the shard outcomes are
+combined into one TestResults whose failCases are (seed, description)
+pairs.
+
+Products are checked against the decimal module in an exact context:
+its numbers are stored in decimal, so parsing and formatting are linear,
+and its large multiplications are subquadratic, keeping the check cheap
+at production sizes.
+
+Usage:
+    python harness.py --method fft --cases 5000 --max-digits 100000
+"""
+
+
+import argparse
+import decimal
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+try:
+    from .customnumbers import stringFromDigits
+    from .dft import DFTmultiply
+    from .dispatch import (
+        fftMultiply, gridMultiply, karatsubaMultiply, multiply, toomMultiply,
+    )
+    from .ntt import NTTmultiply
+    from .testresults import TestResults
+except ImportError:
+    from customnumbers import stringFromDigits
+    from dft import DFTmultiply
+    from dispatch import (
+        fftMultiply, gridMultiply, karatsubaMultiply, multiply, toomMultiply,
+    )
+    from ntt import NTTmultiply
+    from testresults import TestResults
+
+
+"""Seeds per shard; each shard is one task for the process pool"""
+SHARD_SIZE = 50
+
+"""Context in which decimal multiplication of integers is exact"""
+EXACT = decimal.Context(prec=decimal.MAX_PREC, Emax=decimal.MAX_EMAX)
+
+
+def pythonFFTMultiply(x, y):
+    return DFTmultiply(x, y, backend='python') or '0'
+
+def nttMultiply(x, y):
+    return NTTmultiply(x, y) or '0'
+
+"""Multipliers by name; each maps decimal strings x, y to the string x*y"""
+MULTIPLIERS = {
+    'grid': gridMultiply,
+    'karatsuba': karatsubaMultiply,
+    'toom3': toomMultiply,
+    'fft': fftMultiply,
+    'fft-python': pythonFFTMultiply,
+    'ntt': nttMultiply,
+    'multiply': multiply,
+}
+
+
+def generateCase(seed, minDigits, maxDigits):
+    """Return operands (x, y) generated from seed
+    
+    Lengths are uniform in [minDigits, maxDigits]. One case in ten has
+    operands of all 9s and one in ten is a power of 10, to exercise long
+    carries and zero runs; the rest have uniformly random digits.
+    """
+    
+    rng = np.random.default_rng(seed)
+    operands = []
+    for _ in range(2):
+        n = int(rng.integers(minDigits, maxDigits + 1))
+        kind = rng.random()
+        if kind < 0.1:
+            operands.append('9'*n)
+        elif kind < 0.2:
+            operands.append('1' + '0'*(n-1))
+        else:
+            digits = rng.integers(0, 10, n)
+            digits[0] = rng.integers(1, 10)
+            operands.append(stringFromDigits(digits))
+    return tuple(operands)
+
+def checkCase(method, seed, minDigits, maxDigits):
+    """Return None if method multiplies the case for seed correctly, else a description"""
+    
+    x, y = generateCase(seed, minDigits, maxDigits)
+    try:
+        product = method(x, y)
+    except Exception as e:
+        return '{}: {}'.format(type(e).__name__, e)
+    expected = str(EXACT.multiply(decimal.Decimal(x), decimal.Decimal(y)))
+    if product != expected:
+        return 'Wrong product for {} x {} digits'.format(len(x), len(y))
+    return None
+
+def runShard(methodName, seeds, minDigits, maxDigits):
+    """Check the cases for seeds; return TestResults of (seed, description) failures"""
+    
+    method = MULTIPLIERS[methodName] if isinstance(methodName, str) else methodName
+    failCases = []
+    for seed in seeds:
+        failure = checkCase(method, seed, minDigits, maxDigits)
+        if failure is not None:
+            failCases.append((seed, failure))
+    return TestResults(
+        str(methodName), len(seeds) - len(failCases), len(failCases), failCases
+    )
+
+def runHarness(
+    method, nCases=1000, minDigits=1, maxDigits=1000, baseSeed=0,
+    processes=None, shardSize=SHARD_SIZE
+):
+    """Check nCases random products of method across a process pool
+    
+    Args:
+    method -- name in MULTIPLIERS, or a picklable (module-level) function
+    nCases -- cases to check, with seeds baseSeed, ..., baseSeed + nCases - 1
+    minDigits, maxDigits -- range of operand lengths
+    processes -- pool size (default os.cpu_count()); 1 runs in this process
+    shardSize -- seeds per pool task
+    
+    Return: TestResults; failCases holds (seed, description), sorted by seed
+    """
+    
+    name = method if isinstance(method, str) else method.__name__
+    if isinstance(method, str) and method not in MULTIPLIERS:
+        raise ValueError('Unknown method: {}'.format(method))
+    seeds = range(baseSeed, baseSeed + nCases)
+    shards = [seeds[i:i+shardSize] for i in range(0, nCases, shardSize)]
+    args = [(method, list(shard), minDigits, maxDigits) for shard in shards]
+    
+    processes = processes or os.cpu_count() or 1
+    if processes > 1 and len(shards) > 1:
+        with ProcessPoolExecutor(processes) as pool:
+            shardResults = list(pool.map(runShard, *zip(*args)))
+    else:
+        shardResults = [runShard(*a) for a in args]
+    
+    results = TestResults.combine(name, shardResults)
+    results.failCases.sort()
+    return results
+
+def replayCase(method, seed, minDigits=1, maxDigits=1000):
+    """Regenerate the case for seed; return (x, y, product returned by method)"""
+    
+    method = MULTIPLIERS[method] if isinstance(method, str) else method
+    x, y = generateCase(seed, minDigits, maxDigits)
+    return x, y, method(x, y)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Randomized multiplication checks')
+    parser.add_argument('--method', choices=sorted(MULTIPLIERS), default='multiply')
+    parser.add_argument('--cases', type=int, default=1000)
+    parser.add_argument('--min-digits', type=int, default=1)
+    parser.add_argument('--max-digits', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=0, help='first case seed')
+    parser.add_argument('--processes', type=int)
+    args = parser.parse_args(argv)
+    
+    results = runHarness(
+        args.method, args.cases, args.min_digits, args.max_digits, args.seed,
+        args.processes
+    )
+    results.report()
+    return 1 if results.failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
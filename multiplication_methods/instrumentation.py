@@ -0,0 +1,229 @@
+"""
+Opt-in operation counters for customnumbers arithmetic
+
+Inside a `with Instrumentation() as profile:` block, the arithmetic
+primitives of Number, LimbNumber and Rational, the schoolbook kernel and
+the recursive Karatsuba and Toom-3 steps are replaced by wrappers that
+record, for each operation and recursion depth, the number of calls,
+the digits of their operands, the number objects allocated and the wall
+time. The original methods are restored on exit, so nothing is recorded
+(and nothing costs anything) outside such a block.
+
+Allocations and times are inclusive: an operation is charged for the
+operations it calls (totals over depths count each call only outside
+any call of the same operation). An allocation is a call of a number
+class constructor. The recursion depth is the number of Karatsuba or
+Toom-3 steps in progress when an operation is called.
+"""
+
+
+import time
+from functools import wraps
+try:
+    from . import karatsuba
+    from .customnumbers import Number, LimbNumber, Rational
+    from .karatsuba import Karatsuba
+    from .toom import ToomCook3
+except ImportError:
+    import karatsuba
+    from customnumbers import Number, LimbNumber, Rational
+    from karatsuba import Karatsuba
+    from toom import ToomCook3
+
+
+"""Operations recorded by default, as (class or module, attribute name)"""
+OPERATIONS = [
+    (Number, '__add__'),
+    (Number, '__sub__'),
+    (Number, 'addOne'),
+    (Number, 'subtractTenPower'),
+    (Number, 'ninesComplement'),
+    (Number, 'decimalDecompose'),
+    (Number, 'multiplyTenPower'),
+    (Number, 'exactDivide'),
+    (Number, 'multiplySingleDigits'),
+    (LimbNumber, '__add__'),
+    (LimbNumber, '__sub__'),
+    (LimbNumber, 'decimalDecompose'),
+    (LimbNumber, 'multiplyTenPower'),
+    (LimbNumber, 'exactDivide'),
+    (Rational, '__mul__'),
+    (karatsuba, 'schoolbookMultiply'),
+]
+
+"""Recursive steps; each call in progress adds one to the recursion depth"""
+RECURSIVE_OPERATIONS = [
+    (Karatsuba, '_multiply'),
+    (ToomCook3, '_multiply'),
+]
+
+"""Constructors of number objects, counted as allocations"""
+CONSTRUCTORS = [
+    (Number, '__init__'),
+    (LimbNumber, '__init__'),
+    (LimbNumber, 'fromLimbs'),
+    (Rational, '__init__'),
+    (Rational, 'fromDigitArray'),
+]
+
+
+class OperationStats:
+    
+    __slots__ = ('calls', 'digits', 'allocations', 'seconds')
+    
+    def __init__(self):
+        self.calls = 0
+        self.digits = 0
+        self.allocations = 0
+        self.seconds = 0.0
+    
+    def __repr__(self):
+        return '<OperationStats: {} calls, {} digits, {} allocations, {:.6f}s>'.format(
+            self.calls, self.digits, self.allocations, self.seconds
+        )
+
+
+def digitCount(arg):
+    """Number of digits of a number or decimal string argument (0 for others)"""
+    
+    if isinstance(arg, (Number, LimbNumber, str)):
+        return len(arg)
+    if isinstance(arg, Rational):
+        return len(arg._digitArray)
+    return 0
+
+def operationName(owner, name):
+    return '{}.{}'.format(owner.__name__.rsplit('.', 1)[-1], name)
+
+
+class Instrumentation:
+    """
+    Context manager collecting OperationStats while active
+    
+    stats maps (operation name, recursion depth) to OperationStats.
+    """
+    
+    _active = False
+    
+    def __init__(self, operations=None, recursiveOperations=None):
+        """
+        Args:
+        -- operations, recursiveOperations: (class or module, attribute name)
+           pairs to record; default OPERATIONS and RECURSIVE_OPERATIONS
+        """
+        
+        self.operations = OPERATIONS if operations is None else operations
+        self.recursiveOperations = (
+            RECURSIVE_OPERATIONS if recursiveOperations is None else recursiveOperations
+        )
+        self.stats = {}
+        self._outermost = {}
+        self._running = {}
+        self._depth = 0
+        self._allocations = 0
+        self._saved = []
+    
+    def __enter__(self):
+        if Instrumentation._active:
+            raise RuntimeError('Instrumentation is already active')
+        Instrumentation._active = True
+        for owner, name in self.operations:
+            self._install(owner, name, recursive=False)
+        for owner, name in self.recursiveOperations:
+            self._install(owner, name, recursive=True)
+        for owner, name in CONSTRUCTORS:
+            self._install(owner, name, recursive=False, counter=True)
+        return self
+    
+    def __exit__(self, *exc):
+        for owner, name, original in reversed(self._saved):
+            setattr(owner, name, original)
+        self._saved = []
+        Instrumentation._active = False
+        return False
+    
+    def _install(self, owner, name, recursive, counter=False):
+        """Replace owner.name by a recording wrapper, saving the original"""
+        
+        original = vars(owner)[name]
+        self._saved.append((owner, name, original))
+        if isinstance(original, (staticmethod, classmethod)):
+            fn = original.__func__
+        else:
+            fn = original
+        if counter:
+            wrapper = self._wrapConstructor(fn)
+        else:
+            wrapper = self._wrap(fn, operationName(owner, name), recursive)
+        if isinstance(original, staticmethod):
+            wrapper = staticmethod(wrapper)
+        elif isinstance(original, classmethod):
+            wrapper = classmethod(wrapper)
+        setattr(owner, name, wrapper)
+    
+    def _wrapConstructor(self, fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            self._allocations += 1
+            return fn(*args, **kwargs)
+        return wrapper
+    
+    def _wrap(self, fn, name, recursive):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            depth = self._depth
+            allocations = self._allocations
+            if recursive:
+                self._depth += 1
+            self._running[name] = self._running.get(name, 0) + 1
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                seconds = time.perf_counter() - start
+                allocations = self._allocations - allocations
+                if recursive:
+                    self._depth -= 1
+                self._running[name] -= 1
+                stats = self.stats.get((name, depth))
+                if stats is None:
+                    stats = self.stats[(name, depth)] = OperationStats()
+                stats.calls += 1
+                stats.digits += sum(digitCount(a) for a in args)
+                stats.allocations += allocations
+                stats.seconds += seconds
+                if not self._running[name]:
+                    outermost = self._outermost.setdefault(name, OperationStats())
+                    outermost.allocations += allocations
+                    outermost.seconds += seconds
+        return wrapper
+    
+    def totals(self):
+        """Return dict of operation name -> OperationStats summed over depths"""
+        
+        totals = {}
+        for (name, _), stats in self.stats.items():
+            total = totals.setdefault(name, OperationStats())
+            total.calls += stats.calls
+            total.digits += stats.digits
+        for name, outermost in self._outermost.items():
+            totals[name].allocations = outermost.allocations
+            totals[name].seconds = outermost.seconds
+        return totals
+    
+    def report(self, byDepth=False):
+        """Return a table of stats, slowest operations first"""
+        
+        if byDepth:
+            rows = [(name, depth, s) for (name, depth), s in self.stats.items()]
+        else:
+            rows = [(name, '', s) for name, s in self.totals().items()]
+        rows.sort(key=lambda row: -row[2].seconds)
+        lines = ['{:<32} {:>5} {:>10} {:>12} {:>12} {:>10}'.format(
+            'operation', 'depth', 'calls', 'digits', 'allocations', 'seconds'
+        )]
+        for name, depth, s in rows:
+            lines.append('{:<32} {:>5} {:>10} {:>12} {:>12} {:>10.6f}'.format(
+                name, depth, s.calls, s.digits, s.allocations, s.seconds
+            ))
+        return '\n'.join(lines)
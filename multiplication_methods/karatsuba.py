@@ -0,0 +1,141 @@
+"""
+Karatsuba multiplication of decimal strings
+
+Recursion stops at a configurable threshold (in decimal digits), below
+which operands are multiplied by an O(n**2) schoolbook kernel on native
+ints. The threshold can be measured on the current machine with
+tuneThreshold, which persists it via the tuning module.
+"""
+
+
+import random
+from array import array
+from math import ceil
+try:
+    from .customnumbers import Number, LimbNumber, digitsFromString, stringFromDigits
+    from .tuning import bestTime, getTuning, saveTuning
+except ImportError:
+    from customnumbers import Number, LimbNumber, digitsFromString, stringFromDigits
+    from tuning import bestTime, getTuning, saveTuning
+
+
+DEFAULT_THRESHOLD = 64
+THRESHOLD_CANDIDATES = (4, 8, 16, 32, 64, 128, 256, 512, 1024)
+
+
+def schoolbook(a, b, base):
+    """Multiply little-endian digit lists a, b in the given base, O(len(a)*len(b))"""
+    
+    r = [0]*(len(a) + len(b))
+    for i, ai in enumerate(a):
+        if ai == 0:
+            continue
+        carry = 0
+        k = i
+        for bj in b:
+            t = r[k] + ai*bj + carry
+            carry = t // base
+            r[k] = t - carry*base
+            k += 1
+        while carry:
+            t = r[k] + carry
+            carry = t // base
+            r[k] = t - carry*base
+            k += 1
+    return r
+
+def schoolbookMultiply(x, y):
+    """Multiply two Numbers, or two LimbNumbers, by the schoolbook kernel"""
+    
+    isNegative = (x.isNegative != y.isNegative)
+    if isinstance(x, LimbNumber):
+        limbs = schoolbook(x.limbs, y.limbs, LimbNumber.BASE)
+        return LimbNumber.fromLimbs(array('I', limbs), isNegative)
+    digits = schoolbook(
+        digitsFromString(x.string).tolist(), digitsFromString(y.string).tolist(), 10
+    )
+    return Number(stringFromDigits(digits), isNegative=isNegative, preReversed=True)
+
+
+class Karatsuba():
+    
+    def __init__(self, threshold=None, numberClass=Number, tuningPath=None):
+        """
+        Args:
+        -- threshold: operands with at most this many digits are multiplied by
+           the schoolbook kernel; defaults to the tuned value for numberClass
+        -- numberClass: Number or LimbNumber, the integer representation used
+        -- tuningPath: tuning file read for the default threshold (default
+           tuning.TUNING_FILE)
+        """
+        
+        if threshold is None:
+            threshold = getTuning(tuningKey(numberClass), DEFAULT_THRESHOLD, tuningPath)
+        self.threshold = threshold
+        self.numberClass = numberClass
+    
+    def multiply(self, xString, yString):
+        """
+        Multiply decimal strings by Karatsuba multiplication
+        
+        Args: 
+        -- xString, yString: decimal strings (in usual order) of positive integers to multiply
+        
+        Returns: decimal string (in usual order) of the product
+        """
+        
+        x = self.numberClass(xString)
+        y = self.numberClass(yString)
+        return str(self._multiply(x, y))
+    
+    def _multiply(self, x, y):
+        """Recursively multiply Numbers x, y (implement Karatsuba algorithm)"""
+        
+        Lx, Ly = len(x), len(y)
+        
+        # Base of induction; small operands go to the schoolbook kernel
+        if min(Lx, Ly) <= self.threshold:
+            return schoolbookMultiply(x, y)
+        
+        # Split off 10**m where m = ceil( max(len(x),len(y)) / 2 )
+        m = ceil(max(Lx, Ly)/2)
+        x0, x1 = x.decimalDecompose(m)
+        y0, y1 = y.decimalDecompose(m)
+        
+        # Recursively compute three coeffs
+        z1 = self._multiply(x1, y1)
+        z3 = self._multiply(x0, y0)
+        z2 = self._multiply(x0 - x1, y1 - y0) + z1 + z3
+        
+        # Use decimal string addition/ten multiplication to compute and return xy
+        z1.multiplyTenPower(2*m)
+        z2.multiplyTenPower(m)
+        return z1 + z2 + z3
+
+
+def tuningKey(numberClass):
+    return 'karatsuba_threshold_' + numberClass.__name__
+
+def tuneThreshold(
+    numberClass=Number, nDigits=2000, candidates=THRESHOLD_CANDIDATES,
+    repeats=3, save=True, path=None
+):
+    """Measure the fastest Karatsuba threshold on this machine
+    
+    Times products of two random nDigits-digit numbers for each candidate
+    threshold and, if save, persists the best one for numberClass
+    (to path, default tuning.TUNING_FILE).
+    
+    Returns: (best threshold, dict of threshold -> best time in seconds)
+    """
+    
+    x = ''.join(random.choice('0123456789') for _ in range(nDigits))
+    y = ''.join(random.choice('0123456789') for _ in range(nDigits))
+    times = {
+        t: bestTime(Karatsuba(t, numberClass).multiply, x, y, repeats=repeats)
+        for t in candidates
+    }
+    best = min(times, key=times.get)
+    if save:
+        saveTuning(tuningKey(numberClass), best, path)
+    return best, times
@@ -0,0 +1,194 @@
+"""
+Exact multiplication by number-theoretic transform (NTT)
+
+The NTT is the DFT over the integers mod a prime p = c*2**e + 1, using a
+2**e-th root of unity mod p in place of exp(-2*pi*i/N). All arithmetic
+is exact, so the product coefficients are recovered without rounding.
+When they may exceed one prime, transforms mod several primes are
+recombined by the Chinese remainder theorem.
+"""
+
+
+import math
+from functools import lru_cache
+import numpy as np
+try:
+    from .dft import (
+        carryDigits, digitArray, digitString, packDigitArray, paddedLength,
+        unpackDigitArray,
+    )
+except ImportError:
+    from dft import (
+        carryDigits, digitArray, digitString, packDigitArray, paddedLength,
+        unpackDigitArray,
+    )
+
+
+"""NTT-friendly primes p < 2**31 as (p, primitive root)
+
+Transform lengths up to 2**27, 2**26, 2**25 and 2**24 respectively.
+Below 2**31, products of two residues fit in int64.
+"""
+PRIMES = [
+    (15*2**27 + 1, 31),
+    (7*2**26 + 1, 3),
+    (5*2**25 + 1, 3),
+    (45*2**24 + 1, 11),
+]
+
+DIGITS_PER_POINT = 4
+
+
+@lru_cache(maxsize=32)
+def rootTable(p, g, N, inverse=False):
+    """Return int64 array of w**j mod p, j < N/2, for w a primitive N-th root of unity"""
+
+    w = pow(g, (p-1)//N, p)
+    if inverse:
+        w = pow(w, p-2, p)
+    table = np.ones(max(1, N//2), dtype=np.int64)
+    L = 1
+    while L < N//2:
+        table[L:2*L] = table[:L]*pow(w, L, p) % p
+        L *= 2
+    return table
+
+@lru_cache(maxsize=32)
+def bitReversalIndex(N):
+    """Return int64 array whose i-th entry is i with its log2(N) bits reversed"""
+
+    index = np.zeros(1, dtype=np.int64)
+    while len(index) < N:
+        index = np.concatenate([2*index, 2*index + 1])
+    return index
+
+def NTT(a, p, g, inverse=False):
+    """Compute the NTT of sequence a mod p (vectorized radix-2 Cooley-Tukey)
+
+    Args:
+    a -- integer sequence with entries in [0, p)
+    p, g -- prime and primitive root, as in PRIMES
+    inverse -- compute the inverse transform (including division by N)
+
+    Return: int64 array
+    Note: assumes len(a) is a power of 2 dividing p-1
+    """
+
+    N = len(a)
+    if N & (N-1) or (p-1) % N:
+        raise ValueError('Length {} is not a power of 2 dividing p-1'.format(N))
+    a = np.asarray(a, dtype=np.int64)[bitReversalIndex(N)]
+    roots = rootTable(p, g, N, inverse)
+
+    size = 2
+    while size <= N:
+        half = size//2
+        blocks = a.reshape(-1, size)
+        u = blocks[:, :half].copy()
+        v = blocks[:, half:]*roots[::N//size] % p
+        blocks[:, :half] = (u + v) % p
+        blocks[:, half:] = (u - v) % p
+        size *= 2
+
+    if inverse:
+        a = a*pow(N, p-2, p) % p
+    return a
+
+def INTT(A, p, g):
+    """Compute inverse NTT of A mod p"""
+
+    return NTT(A, p, g, inverse=True)
+
+def choosePrimes(N, largestCoefficient):
+    """Fewest PRIMES supporting length N whose product exceeds largestCoefficient"""
+
+    usable = [t for t in PRIMES if (t[0]-1) % N == 0]
+    chosen = []
+    modulus = 1
+    for t in usable:
+        chosen.append(t)
+        modulus *= t[0]
+        if modulus > largestCoefficient:
+            return chosen
+    raise ValueError(
+        'Product too large for available primes (N={}, coefficients up to {})'
+        .format(N, largestCoefficient)
+    )
+
+def NTTconvolve(x_seq, y_seq, largestCoefficient):
+    """Exact cyclic convolution of two equal-length nonnegative integer sequences
+
+    Args:
+    x_seq, y_seq -- int64 arrays of power-of-2 length
+    largestCoefficient -- upper bound on entries of the convolution
+
+    Return: int64 array if the moduli allow, else object array of ints
+    """
+
+    N = len(x_seq)
+    primes = choosePrimes(N, largestCoefficient)
+    residues = []
+    for p, g in primes:
+        X = NTT(x_seq % p, p, g)
+        Y = NTT(y_seq % p, p, g)
+        residues.append(INTT(X*Y % p, p, g))
+    return CRT(residues, [p for p, _ in primes])
+
+def CRT(residues, moduli):
+    """Recombine residue arrays by Garner's algorithm
+
+    Mixed-radix digits v_i < moduli[i] are computed in int64, then
+    c = v_0 + v_1*m_0 + v_2*m_0*m_1 + ... (in int64 when the product of
+    moduli leaves headroom for carrying).
+    """
+
+    mixed = []
+    for i, (r, m) in enumerate(zip(residues, moduli)):
+        v = r.copy()
+        for j in range(i):
+            v = (v - mixed[j]) % m * pow(moduli[j], m-2, m) % m
+        mixed.append(v)
+
+    dtype = np.int64 if math.prod(moduli) < 2**62 else object
+    c = np.zeros(len(residues[0]), dtype=dtype)
+    radix = 1
+    for v, m in zip(mixed, moduli):
+        c = c + v.astype(dtype)*radix
+        radix *= m
+    return c
+
+def NTTmultiply(x, y, stringsReversed=False, digitsPerPoint=DIGITS_PER_POINT):
+    """Compute exact product of two numbers using NTT
+
+    Args:
+    x, y -- decimal strings
+    stringsReversed -- bool indicating if x, y are reversed (i.e. in ascending order)
+    digitsPerPoint -- decimal digits k packed into each transform point
+
+    Return: decimal string of x*y in usual order (i.e. in descending order),
+    matching DFTmultiply
+    """
+
+    k = digitsPerPoint
+    x_seq = packDigitArray(digitArray(x, stringsReversed), k).astype(np.int64)
+    y_seq = packDigitArray(digitArray(y, stringsReversed), k).astype(np.int64)
+    L_1, L_2 = len(x_seq), len(y_seq)
+    N = paddedLength(L_1, L_2)
+    x_seq = np.concatenate([x_seq, np.zeros(N - L_1, dtype=np.int64)])
+    y_seq = np.concatenate([y_seq, np.zeros(N - L_2, dtype=np.int64)])
+
+    c = NTTconvolve(x_seq, y_seq, min(L_1, L_2)*(10**k - 1)**2)
+    if c.dtype == object:
+        c = carryObjects(c, 10**k)
+    else:
+        c = carryDigits(c, base=10**k)
+    return digitString(unpackDigitArray(c, k))
+
+def carryObjects(c, base):
+    """Carry an object array of Python ints into int64 digits in the given base"""
+
+    carry = 0
+    digits = np.zeros(len(c), dtype=np.int64)
+    for i, coefficient in enumerate(c):
+        carry, digits[i] = divmod(int(coefficient) + carry, base)
+    return digits
@@ -0,0 +1,137 @@
+"""
+Quarter square multiplication
+
+By the identity ab = ((a+b)**2 - (a-b)**2)/4, and since (a+b) and (a-b)
+have the same parity, ab = floor((a+b)**2/4) - floor((a-b)**2/4): a
+product is two lookups in a table of quarter squares and a subtraction.
+The table is built on first use. Operands whose sum does not fit the
+table are split into limbs small enough that sums of two limbs do, and
+the limb products are looked up and summed by powers of the limb base.
+"""
+
+
+from functools import lru_cache
+import numpy as np
+try:
+    from .customnumbers import (
+        carryDigits, intFromLimbs, limbsFromString, stringFromLimbs,
+    )
+except ImportError:
+    from customnumbers import (
+        carryDigits, intFromLimbs, limbsFromString, stringFromLimbs,
+    )
+
+
+"""Table entries: sums of two operands up to DEFAULT_TABLE_SIZE - 1 are looked up"""
+DEFAULT_TABLE_SIZE = 200000
+
+"""Widest limbs used when splitting operands
+
+Limb products stay below 10**10, so at most 2048 of them (the longest
+diagonal of a scratch block) sum exactly in float64, and any realistic
+number of them sums in int64.
+"""
+MAX_LIMB_DIGITS = 5
+
+"""Upper bound on entries of the limb product scratch array"""
+MAX_SCRATCH_ENTRIES = 2**22
+
+
+@lru_cache(maxsize=4)
+def quarterSquareTable(size):
+    """Return int64 array of floor(n**2/4) for n < size"""
+    
+    n = np.arange(size, dtype=np.int64)
+    return n*n // 4
+
+
+class QSMultiplier():
+    """Multiply by lookups in a table of tableSize quarter squares"""
+    
+    def __init__(self, tableSize=DEFAULT_TABLE_SIZE):
+        """
+        Args:
+        -- tableSize: number of quarter squares in the table (at least 19,
+           so that sums of two single digits fit)
+        """
+        
+        if tableSize < 19:
+            raise ValueError('tableSize must be at least 19; received {}'.format(tableSize))
+        self.tableSize = tableSize
+        
+        # Widest limbs whose sum fits the table: 2*(10**d - 1) < tableSize
+        self.limbDigits = 1
+        while (
+            self.limbDigits < MAX_LIMB_DIGITS and
+            2*(10**(self.limbDigits + 1) - 1) < tableSize
+        ):
+            self.limbDigits += 1
+    
+    @property
+    def table(self):
+        return quarterSquareTable(self.tableSize)
+    
+    def multiply(self, x, y):
+        """
+        Multiply integers by quarter squares
+        
+        Operands whose magnitudes sum past the table are multiplied in
+        limbs (see multiplyStrings); they are converted with str, so are
+        subject to the int/str conversion limit.
+        """
+        
+        isNegative = (x < 0) != (y < 0)
+        x, y = abs(x), abs(y)
+        if x + y < self.tableSize:
+            product = int(self.table[x + y] - self.table[abs(x - y)])
+        else:
+            product = intFromLimbs(
+                self.multiplyLimbs(
+                    limbsFromString(str(x), self.limbDigits),
+                    limbsFromString(str(y), self.limbDigits)
+                ),
+                self.limbDigits
+            )
+        return -product if isNegative else product
+    
+    def multiplyStrings(self, xString, yString):
+        """
+        Multiply decimal strings by quarter squares of limbs
+        
+        Args:
+        -- xString, yString: decimal strings (in usual order) of nonnegative integers
+        
+        Returns: decimal string (in usual order) of the product
+        """
+        
+        D = self.limbDigits
+        limbs = self.multiplyLimbs(limbsFromString(xString, D), limbsFromString(yString, D))
+        return stringFromLimbs(limbs, D)
+    
+    def multiplyLimbs(self, a, b):
+        """
+        Multiply limb arrays (base 10**limbDigits, least significant first)
+        
+        Limb products are looked up for blocks of rows of the a x b grid,
+        bounded by MAX_SCRATCH_ENTRIES, and added into the coefficient of
+        their power of the base; the coefficients are then carried.
+        
+        Returns: int64 array of limbs, least significant first
+        """
+        
+        a = np.asarray(a, dtype=np.int64)
+        b = np.asarray(b, dtype=np.int64)
+        if not len(a) or not len(b):
+            return np.zeros(0, dtype=np.int64)
+        table = self.table
+        c = np.zeros(len(a) + len(b), dtype=np.int64)
+        rows = max(1, MAX_SCRATCH_ENTRIES // len(b))
+        j = np.arange(len(b))
+        for start in range(0, len(a), rows):
+            block = a[start:start+rows, None]
+            products = table[block + b] - table[np.abs(block - b)]
+            powers = np.arange(start, start + len(block))[:, None] + j
+            c += np.bincount(
+                powers.ravel(), weights=products.ravel(), minlength=len(c)
+            ).astype(np.int64)
+        return carryDigits(c, base=10**self.limbDigits)
@@ -0,0 +1,148 @@
+"""
+Multiplication of decimal operands stored in files, with bounded memory
+
+Operands are memory-mapped decimal text and split into blocks of
+blockDigits digits. The product is a blocked convolution: output block
+k collects the block products x_i*y_j with i + j = k, each of which
+spills its upper half into block k+1 (overlap-add). Block products are
+summed as spectra so each output block needs one inverse FFT. Output
+blocks are carried and written to the output file as they complete,
+so memory use depends on blockDigits, not on the operand lengths.
+"""
+
+
+import os
+import numpy as np
+try:
+    from .customnumbers import carryDigits
+    from .dft import ROUNDING_TOLERANCE
+except ImportError:
+    from customnumbers import carryDigits
+    from dft import ROUNDING_TOLERANCE
+
+
+BLOCK_DIGITS = 2**16
+COPY_CHUNK_BYTES = 2**20
+
+"""Digits past a block that its carried overflow can reach (int64 has at most 19)"""
+OVERFLOW_DIGITS = 20
+WHITESPACE = set(b' \t\r\n')
+
+
+class DigitFile:
+    """Memory-mapped decimal text file, read in ascending blocks of digits"""
+    
+    def __init__(self, path):
+        if not os.path.getsize(path):
+            raise ValueError('Empty operand file: {}'.format(path))
+        self.map = np.memmap(path, dtype=np.uint8, mode='r')
+        start, end = 0, len(self.map)
+        while start < end and self.map[start] in WHITESPACE:
+            start += 1
+        while end > start and self.map[end-1] in WHITESPACE:
+            end -= 1
+        if start == end:
+            raise ValueError('Empty operand file: {}'.format(path))
+        self.start = start
+        self.end = end
+        
+    def __len__(self):
+        return self.end - self.start
+    
+    def block(self, i, blockDigits):
+        """Return int64 array of digits i*blockDigits up to (i+1)*blockDigits, ascending"""
+        
+        stop = self.end - i*blockDigits
+        start = max(self.start, stop - blockDigits)
+        digits = self.map[start:stop][::-1].astype(np.int64) - ord('0')
+        if ((digits < 0) | (digits > 9)).any():
+            raise ValueError('Non-digit characters in operand')
+        return digits
+    
+
+def multiplyFiles(xPath, yPath, outPath, blockDigits=BLOCK_DIGITS):
+    """
+    Multiply decimal integers stored in files, streaming the product to a file
+    
+    Args:
+    -- xPath, yPath: files holding nonnegative decimal integers (in usual
+       order; surrounding whitespace is ignored)
+    -- outPath: file to write the decimal product to (in usual order)
+    -- blockDigits: digits per block; memory use is a small multiple of it
+    
+    Returns: number of digits in the product
+    """
+    
+    x, y = DigitFile(xPath), DigitFile(yPath)
+    B = blockDigits
+    nBlocks_x = -(-len(x)//B)
+    nBlocks_y = -(-len(y)//B)
+    L = len(x) + len(y)
+    
+    with open(outPath, 'wb+') as out:
+        out.truncate(L)
+        pending = np.zeros(B, dtype=np.int64)
+        carry = 0
+        for k in range(-(-L//B)):
+            # 1. Sum spectra of block products x_i*y_j with i + j = k
+            spectrum = np.zeros(B + 1, dtype=complex)
+            for i in range(max(0, k - nBlocks_y + 1), min(k, nBlocks_x - 1) + 1):
+                spectrum += (
+                    np.fft.rfft(x.block(i, B), 2*B) * np.fft.rfft(y.block(k - i, B), 2*B)
+                )
+            c = np.fft.irfft(spectrum, 2*B)
+            c_seq = np.rint(c)
+            if np.abs(c - c_seq).max() > ROUNDING_TOLERANCE:
+                raise ArithmeticError('Rounding unsafe; use a smaller blockDigits')
+            c = c_seq.astype(np.int64)
+            
+            # 2. Overlap-add: low half plus the high half of block k-1's products
+            block = c[:B] + pending
+            pending = c[B:]
+            
+            # 3. Carry, keeping the overflow past the block as the next carry
+            block[0] += carry
+            digits = carryDigits(
+                np.concatenate([block, np.zeros(OVERFLOW_DIGITS, dtype=np.int64)])
+            )
+            carry = sum(int(d)*10**i for i, d in enumerate(digits[B:]) if d)
+            
+            # 4. Write this block's digits into place (file is in descending order)
+            stop = L - k*B
+            start = max(0, stop - B)
+            out.seek(start)
+            out.write((digits[:stop - start][::-1] + ord('0')).astype(np.uint8).tobytes())
+        
+        return stripLeadingZeros(out, L)
+
+def stripLeadingZeros(f, L):
+    """Remove leading zeros from a length-L decimal file in place; return new length"""
+    
+    # Find first nonzero digit
+    offset = 0
+    while offset < L:
+        f.seek(offset)
+        chunk = f.read(min(COPY_CHUNK_BYTES, L - offset))
+        stripped = chunk.lstrip(b'0')
+        if stripped:
+            offset += len(chunk) - len(stripped)
+            break
+        offset += len(chunk)
+    if offset == L:
+        # Product is zero
+        f.seek(0)
+        f.write(b'0')
+        f.truncate(1)
+        return 1
+    
+    # Shift remaining digits to the start of the file
+    if offset:
+        position = 0
+        while position + offset < L:
+            f.seek(position + offset)
+            chunk = f.read(COPY_CHUNK_BYTES)
+            f.seek(position)
+            f.write(chunk)
+            position += len(chunk)
+        f.truncate(L - offset)
+    return L - offset
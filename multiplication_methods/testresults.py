@@ -0,0 +1,67 @@
+"""
+Summaries of test outcomes shared by the test scripts and harness
+"""
+
+
+import pprint
+
+
+SEP = '-'*8
+
+class TestResults:
+    def __init__(self, name, passed, failed, failCases):
+        self.name = name
+        self.passed = passed
+        self.failed = failed
+        self.total = passed + failed
+        self.failCases = failCases
+        
+    @classmethod
+    def fromCaseLists(cls, name, trueCases, testCases):
+        """Construct TestResults from lists of cases which whould be equal"""
+        
+        equal = 0
+        unequal = 0
+        unequalCases = []
+        for a, b in zip(trueCases, testCases):
+            if a == b:
+                equal += 1
+            else:
+                unequal += 1
+                unequalCases.append((a, b))
+                
+        return TestResults(name, equal, unequal, unequalCases)
+        
+    @classmethod
+    def combine(cls, name, results):
+        """Aggregate several TestResults (e.g. from shards) into one"""
+        
+        results = list(results)
+        return TestResults(
+            name,
+            sum(r.passed for r in results),
+            sum(r.failed for r in results),
+            [case for r in results for case in r.failCases]
+        )
+        
+    def __repr__(self):
+        return (
+            '<{0} test results: {1} passed out of {2}>'
+            .format(self.name, self.passed, self.total)
+        )
+        
+    def report(self):
+        if self.failCases:
+            failCaseText = (
+                'First 5 failed cases:\n' +
+                pprint.pformat(self.failCases[:5])
+            )
+        else:
+            failCaseText = 'No failed cases.'\
+            
+        print('\n'.join([
+            SEP,
+            '{0} test results:'.format(self.name),
+            'Passed {0} out of {1}'.format(self.passed, self.total),
+            failCaseText
+        ]))
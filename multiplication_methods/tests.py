@@ -4,59 +4,10 @@ Test the major components of Number class in numbers.py
 
 
 import numpy as np
-import pprint
 from customnumbers import Number, Complex
+from testresults import TestResults
 
 
-SEP = '-'*8
-
-class TestResults:
-    def __init__(self, name, passed, failed, failCases):
-        self.name = name
-        self.passed = passed
-        self.failed = failed
-        self.total = passed + failed
-        self.failCases = failCases
-        
-    @classmethod
-    def fromCaseLists(cls, name, trueCases, testCases):
-        """Construct TestResults from lists of cases which whould be equal"""
-        
-        equal = 0
-        unequal = 0
-        unequalCases = []
-        for a, b in zip(trueCases, testCases):
-            if a == b:
-                equal += 1
-            else:
-                unequal += 1
-                unequalCases.append((a, b))
-                
-        return TestResults(name, equal, unequal, unequalCases)
-        
-    def __repr__(self):
-        return (
-            '<{0} test results: {1} passed out of {2}>'
-            .format(self.name, self.passed, self.total)
-        )
-        
-    def report(self):
-        if self.failCases:
-            failCaseText = (
-                'First 5 failed cases:\n' +
-                pprint.pformat(self.failCases[:5])
-            )
-        else:
-            failCaseText = 'No failed cases.'\
-            
-        print('\n'.join([
-            SEP,
-            '{0} test results:'.format(self.name),
-            'Passed {0} out of {1}'.format(self.passed, self.total),
-            failCaseText
-        ]))
-        
-
 def baseTest():
     """Test Number construction, Number.__repr__, Number.asInt"""
     
@@ -0,0 +1,14 @@
+import sys
+import pytest
+
+
+@pytest.fixture
+def unlimitedIntDigits():
+    """Lift the int/str conversion digit limit for one test, then restore it"""
+    
+    limit = sys.get_int_max_str_digits()
+    sys.set_int_max_str_digits(0)
+    try:
+        yield
+    finally:
+        sys.set_int_max_str_digits(limit)
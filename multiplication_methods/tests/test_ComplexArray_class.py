@@ -0,0 +1,70 @@
+import pytest
+from ..customnumbers import *
+
+
+SEQS = [
+    [],
+    [Complex(1, 2)],
+    [Complex(1, 2), Complex(-3, 4), Complex(5, -6), Complex(7, 8)],
+]
+
+@pytest.mark.parametrize('x', SEQS)
+def test_ComplexArray_of_roundtrip(x):
+    z = ComplexArray.of(x)
+    assert len(z) == len(x)
+    assert list(z) == x
+    assert z == x
+    assert x == z
+    assert ComplexArray.of(z) is z
+
+def test_ComplexArray_indexing():
+    z = ComplexArray.of(SEQS[2])
+    assert isinstance(z[1], Complex)
+    assert z[1] == Complex(-3, 4)
+    assert z[-1] == Complex(7, 8)
+    assert z[1:3] == SEQS[2][1:3]
+    z[0] = Complex(0, -1)
+    assert z[0] == Complex(0, -1)
+
+@pytest.mark.parametrize('x,y', [
+    (SEQS[0], SEQS[0]),
+    (SEQS[1], SEQS[1]),
+    (SEQS[1], [Complex(-0.5, 3)]),
+    (SEQS[2], SEQS[2]),
+    (SEQS[2], SEQS[2][::-1]),
+])
+def test_ComplexArray_arithmetic(x, y):
+    a, b = ComplexArray.of(x), ComplexArray.of(y)
+    assert a + b == [s + t for s, t in zip(x, y)]
+    assert a - b == [s - t for s, t in zip(x, y)]
+    assert a*b == [s*t for s, t in zip(x, y)]
+    assert 2.5*a == [2.5*s for s in x]
+    assert a*Complex(0, 1) == [s*Complex(0, 1) for s in x]
+
+@pytest.mark.parametrize('x,y', [
+    (SEQS[0], SEQS[1]),
+    (SEQS[1], SEQS[2]),
+    (SEQS[2], SEQS[1]),
+])
+@pytest.mark.parametrize('op', ['__add__', '__sub__', '__mul__'])
+def test_ComplexArray_arithmetic_rejects_mismatched_lengths(x, y, op):
+    with pytest.raises(ValueError):
+        getattr(ComplexArray.of(x), op)(ComplexArray.of(y))
+
+def test_ComplexArray_swap_and_scale():
+    z = ComplexArray.of(SEQS[2])
+    assert z.swap() == [c.swap() for c in SEQS[2]]
+    copy = z.copy()
+    assert z.scale(0.5) is z
+    assert z == [0.5*c for c in SEQS[2]]
+    assert copy == SEQS[2]
+
+def test_ComplexArray_not_equal():
+    z = ComplexArray.of(SEQS[2])
+    assert z != SEQS[1]
+    assert z != [Complex(1, 2), Complex(-3, 4), Complex(5, -6), Complex(7, 9)]
+    assert z != 3
+
+def test_ComplexArray_rejects_mismatched_parts():
+    with pytest.raises(ValueError):
+        ComplexArray([1, 2], [3])
@@ -0,0 +1,56 @@
+import pytest
+from ..customnumbers import *
+
+
+INTS = [0, 1, 9, 10, 999999999, 1000000000, 123456789012345678901234567890, 10**45]
+
+@pytest.mark.parametrize('inputString,expected', [
+    ('0', '0'),
+    ('171712345', '171712345'),
+    ('000', '0'),
+    ('000001', '1'),
+    ('00000100', '100'),
+    ('1000000000', '1000000000'),
+    ('0001234567890123456789', '1234567890123456789'),
+])
+def test_LimbNumber_str(inputString, expected):
+    assert str(LimbNumber(inputString)) == expected
+    assert str(LimbNumber(inputString[::-1], preReversed=True)) == expected
+    assert LimbNumber(inputString).string == Number(inputString).string
+
+@pytest.mark.parametrize('n', INTS)
+def test_LimbNumber_len(n):
+    assert len(LimbNumber(str(n))) == len(Number(str(n)))
+
+@pytest.mark.parametrize('a', INTS + [-n for n in INTS])
+@pytest.mark.parametrize('b', INTS + [-n for n in INTS])
+def test_LimbNumber_arithmetic(a, b):
+    x = LimbNumber(str(abs(a)), isNegative=(a < 0))
+    y = LimbNumber(str(abs(b)), isNegative=(b < 0))
+    assert (x + y).asInt() == a + b
+    assert (x - y).asInt() == a - b
+    assert (x == y) == (a == b)
+    assert (x < y) == (a < b)
+
+@pytest.mark.parametrize('n', INTS)
+@pytest.mark.parametrize('power', [0, 1, 8, 9, 10, 17, 18, 19, 50])
+def test_LimbNumber_decimalDecompose(n, power):
+    x0, x1 = LimbNumber(str(n)).decimalDecompose(power)
+    assert [x0.asInt(), x1.asInt()] == [n % 10**power, n//10**power]
+
+@pytest.mark.parametrize('n', INTS)
+@pytest.mark.parametrize('power', [0, 1, 8, 9, 10, 17, 18, 19, 50])
+def test_LimbNumber_multiplyTenPower(n, power):
+    x = LimbNumber(str(n))
+    x.multiplyTenPower(power)
+    assert x.asInt() == n*10**power
+
+@pytest.mark.parametrize('a,b', [(0, 0), (3, 7), (9, 9), (-4, 6)])
+def test_LimbNumber_multiplySingleDigits(a, b):
+    x = LimbNumber(str(abs(a)), isNegative=(a < 0))
+    y = LimbNumber(str(abs(b)), isNegative=(b < 0))
+    assert x.multiplySingleDigits(y).asInt() == a*b
+
+def test_LimbNumber_multiplySingleDigits_ValueError():
+    with pytest.raises(ValueError):
+        LimbNumber('12').multiplySingleDigits(LimbNumber('3'))
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 from ..customnumbers import *
 
@@ -105,4 +106,45 @@ def test_Rational_digitPowers(inputString,expected):
     ('548293940872904862.456', '958382303898.39270023', 525475210267303666441036478793.74258956488),
 ])
 def test_Rational_multiplication(inputStringA,inputStringB,expected):
-    assert (Rational(inputStringA)*Rational(inputStringB)).asFloat() == expected
\ No newline at end of file
+    assert (Rational(inputStringA)*Rational(inputStringB)).asFloat() == expected
+
+@pytest.mark.parametrize('digits,highestPower,negative,expected', [
+    ([1,2,3], -3, False, '.00123'),
+    ([1,2,3], 0, True, '-1.23'),
+    ([1,2,3], 2, False, '123'),
+    ([1,2,3], 5, False, '123000'),
+    ([0,0,1,2,0,0], 3, False, '12'),
+    ([0,0,1,2,0,0], 1, False, '.12'),
+    ([0,0,0], 1, False, '0'),
+    ([], 1, False, '0'),
+])
+def test_Rational_fromDigitArray(digits,highestPower,negative,expected):
+    r = Rational.fromDigitArray(digits, highestPower, negative)
+    assert str(r) == expected
+    s = Rational(expected)
+    assert (r.digits, r.highestPower, r.dotIndex) == (s.digits, s.highestPower, s.dotIndex)
+
+@pytest.mark.parametrize('inputStringA,inputStringB,expected', [
+    ('.1', '.1', '.01'),
+    ('-2.5', '.4', '-1'),
+    ('999.999', '999.999', '999998.000001'),
+    ('9'*500, '9'*400, str((10**500 - 1)*(10**400 - 1))),
+    ('1' + '0'*300 + '.5', '.0002', '2' + '0'*296 + '.0001'),
+])
+def test_Rational_multiplication_exact(inputStringA,inputStringB,expected):
+    assert str(Rational(inputStringA)*Rational(inputStringB)) == expected
+
+@pytest.mark.parametrize('digits,highestPower,expected', [
+    (np.array([1,2,3], dtype=np.int8), -2, '.0123'),
+    (np.array([0,4,5,0], dtype=np.int64), 2, '45'),
+    (['1','2','3'], 0, '1.23'),
+])
+def test_Rational_fromDigits_arrays(digits,highestPower,expected):
+    assert str(Rational.fromDigits(digits, highestPower)) == expected
+
+def test_Rational_compact_cached_views():
+    r = Rational('-120.034')
+    assert not hasattr(r, '__dict__')
+    assert r._digitArray.dtype == np.int8
+    assert r.digits == ['1', '2', '0', '0', '3', '4']
+    assert r.digitPowers is r.digitPowers
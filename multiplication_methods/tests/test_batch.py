@@ -0,0 +1,33 @@
+import pytest
+from .. import multiplyMany
+from .. import batch
+from ..batch import fftSize
+
+
+PAIRS = [
+    (0, 0), (0, 12), (-1, 1), (-7, -8), (43376, 12158), (12158, 43376),
+    (-10**50, 10**49 + 1), (3**300, 7**250), (2**1000 - 1, 12345),
+    (7**500, 11**400), (10**999 - 1, 10**1001 - 1), (5, 5),
+]
+
+def test_multiplyMany():
+    products = multiplyMany([(str(a), str(b)) for a, b in PAIRS])
+    assert products == [str(a*b) for a, b in PAIRS]
+
+def test_multiplyMany_chunked(monkeypatch):
+    monkeypatch.setattr(batch, 'MAX_SCRATCH_ENTRIES', 1)
+    products = multiplyMany([(str(a), str(b)) for a, b in PAIRS])
+    assert products == [str(a*b) for a, b in PAIRS]
+
+def test_multiplyMany_processes():
+    products = multiplyMany([(str(a), str(b)) for a, b in PAIRS], processes=2)
+    assert products == [str(a*b) for a, b in PAIRS]
+
+def test_multiplyMany_empty():
+    assert multiplyMany([]) == []
+
+@pytest.mark.parametrize('x,y,expected', [
+    ('1', '1', (2, 4)), ('12345', '678', (4, 4)), ('1'*1000, '1'*1000, (512, 4)),
+])
+def test_fftSize(x, y, expected):
+    assert fftSize(x, y) == expected
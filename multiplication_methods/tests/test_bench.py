@@ -0,0 +1,59 @@
+import pytest
+from ..bench import *
+
+
+@pytest.mark.parametrize('x,y', [
+    ('0', '7'), ('1', '1'), ('999', '999'), ('1000', '1001'),
+    ('123456789012345678901234567890', '98765432109876543210'),
+])
+def test_benchmarked_methods_agree(x, y):
+    for name, fn, _ in METHODS:
+        assert fn(x, y) == str(int(x)*int(y)), name
+
+def test_runBenchmarks_respects_limits():
+    results = runBenchmarks(
+        sizes=[10, 2000], methods=['direct-dft', 'cooley-tukey'], repeats=2, warmup=0
+    )
+    measured = {(r['method'], r['digits']) for r in results}
+    assert ('direct-dft', 10) in measured
+    assert ('direct-dft', 2000) not in measured
+    assert ('cooley-tukey', 2000) in measured
+    for r in results:
+        assert set(r) == set(FIELDS)
+        assert r['min'] <= r['median'] and r['peakBytes'] > 0
+
+def test_runBenchmarks_rejects_unknown_method():
+    with pytest.raises(ValueError):
+        runBenchmarks(sizes=[10], methods=['abacus'])
+
+def test_results_files_roundtrip(tmp_path):
+    results = runBenchmarks(sizes=[10], methods=['grid', 'karatsuba'], repeats=2)
+    writeJSON(results, str(tmp_path / 'results.json'))
+    assert readJSON(str(tmp_path / 'results.json')) == results
+    writeCSV(results, str(tmp_path / 'results.csv'))
+    lines = (tmp_path / 'results.csv').read_text().splitlines()
+    assert lines[0] == ','.join(FIELDS)
+    assert len(lines) == 3
+
+def test_compareResults_flags_regressions():
+    baseline = [
+        {'method': 'grid', 'digits': 10, 'median': 1.0},
+        {'method': 'karatsuba', 'digits': 10, 'median': 1.0},
+    ]
+    results = [
+        {'method': 'grid', 'digits': 10, 'median': 1.1},
+        {'method': 'karatsuba', 'digits': 10, 'median': 2.0},
+        {'method': 'karatsuba', 'digits': 100, 'median': 5.0},
+    ]
+    comparisons = compareResults(results, baseline, tolerance=0.25)
+    assert [c['regression'] for c in comparisons] == [False, True]
+
+def test_main_exit_status(tmp_path):
+    path = str(tmp_path / 'baseline.json')
+    args = ['--sizes', '10', '--methods', 'grid', '--repeats', '2']
+    assert main(args + ['--json', path]) == 0
+    assert main(args + ['--compare', path, '--tolerance', '1e6']) == 0
+    baseline = readJSON(path)
+    baseline[0]['median'] = 1e-12
+    writeJSON(baseline, path)
+    assert main(args + ['--compare', path]) == 1
@@ -0,0 +1,43 @@
+import random
+import numpy as np
+import pytest
+from ..customnumbers import *
+
+
+STRINGS = ['', '0', '7', '000123', '999999999', '1000000000', '1234567890123456789']
+
+@pytest.mark.parametrize('s', STRINGS)
+def test_digits_roundtrip(s):
+    digits = digitsFromString(s)
+    assert digits.dtype == np.int8
+    assert digits.tolist() == [int(d) for d in s]
+    assert stringFromDigits(digits) == s
+    assert stringFromDigits(digitsFromString(s.encode('ascii'))) == s
+    assert stringFromDigits(digitsFromString(memoryview(s.encode('ascii')))) == s
+
+@pytest.mark.parametrize('s', ['12a4', '-1', '1.5', ' 1'])
+def test_digitsFromString_rejects_non_digits(s):
+    with pytest.raises(ValueError):
+        digitsFromString(s)
+
+@pytest.mark.parametrize('s', STRINGS)
+@pytest.mark.parametrize('limbDigits', [1, 4, 9])
+def test_limbs_roundtrip(s, limbDigits):
+    limbs = limbsFromString(s, limbDigits)
+    value = int(s) if s else 0
+    assert intFromLimbs(limbs, limbDigits) == value
+    assert stringFromLimbs(limbs, limbDigits) == str(value)
+
+@pytest.mark.parametrize('seed', range(5))
+def test_large_conversions(seed, unlimitedIntDigits):
+    rng = random.Random(seed)
+    n = rng.randrange(10**5)
+    s = str(rng.randrange(10**n))
+    value = int(s)
+    assert intFromLimbs(limbsFromString(s)) == value
+    assert stringFromLimbs(limbsFromString(s)) == s
+    assert Number(s).asInt() == value
+    assert Number(s, isNegative=True).asInt() == -value
+    assert LimbNumber(s).asInt() == value
+    assert str(LimbNumber(s)) == s
+    assert str(Rational(s[:n//2] + '.' + s[n//2:] + '1')) == s[:n//2] + '.' + s[n//2:] + '1'
@@ -0,0 +1,71 @@
+import json
+import pytest
+from .. import dispatch, multiply
+from ..dispatch import *
+from ..tuning import loadTuning
+
+
+CROSSOVERS = {'karatsuba': 10, 'toom3': 100, 'fft': 1000}
+
+@pytest.mark.parametrize('Lx,Ly,crossovers,expected', [
+    (1, 1, CROSSOVERS, 'grid'),
+    (9, 5000, CROSSOVERS, 'grid'),
+    (10, 10, CROSSOVERS, 'karatsuba'),
+    (5000, 99, CROSSOVERS, 'karatsuba'),
+    (100, 100, CROSSOVERS, 'toom3'),
+    (1000, 1000, CROSSOVERS, 'fft'),
+    (1000, 1000, {'karatsuba': 10, 'toom3': None, 'fft': 1000}, 'fft'),
+    (500, 500, {'karatsuba': 10, 'toom3': None, 'fft': 1000}, 'karatsuba'),
+    (500, 500, {'karatsuba': 10, 'toom3': 100, 'fft': 100}, 'fft'),
+])
+def test_chooseMethod(Lx, Ly, crossovers, expected):
+    assert chooseMethod(Lx, Ly, crossovers)[0] == expected
+
+@pytest.mark.parametrize('crossovers', [
+    None,
+    {'karatsuba': 1, 'toom3': None, 'fft': None},
+    {'karatsuba': 1, 'toom3': 1, 'fft': None},
+    {'karatsuba': 1, 'toom3': 1, 'fft': 1},
+    {'karatsuba': None, 'toom3': None, 'fft': None},
+])
+@pytest.mark.parametrize('a,b', [
+    (0, 0), (0, 12), (-1, 1), (-7, -8), (43376, 12158), (-10**50, 10**49 + 1),
+    (3**300, 7**250), (2**1000 - 1, 12345),
+])
+def test_multiply(a, b, crossovers):
+    assert multiply(str(a), str(b), crossovers) == str(a*b)
+
+def test_calibrate(tmp_path):
+    path = str(tmp_path/'tuning.json')
+    crossovers, times = calibrate(sizes=(4, 16), repeats=1, path=path)
+    assert set(crossovers) == {'karatsuba', 'toom3', 'fft'}
+    assert set(times) == {4, 16}
+    assert loadTuning(path) == {TUNING_KEY: crossovers}
+    assert loadCrossovers(path) == crossovers
+    try:
+        n = max((c for c in crossovers.values() if c is not None), default=1)
+        assert chooseMethod(n, n) == chooseMethod(n, n, crossovers)
+    finally:
+        reloadTuning()
+
+def test_tuning_loaded_on_first_use(monkeypatch):
+    for name in ('_crossovers', '_karatsuba', '_toom'):
+        monkeypatch.setattr(dispatch, name, None)
+    assert multiply('12', '34') == '408'
+    assert dispatch._crossovers is not None
+
+def test_reloadTuning_reads_thresholds_from_path(tmp_path, monkeypatch):
+    path = str(tmp_path/'tuning.json')
+    with open(path, 'w') as f:
+        json.dump({
+            TUNING_KEY: {'karatsuba': 3, 'toom3': 5, 'fft': 7},
+            'karatsuba_threshold_LimbNumber': 11,
+            'toom3_threshold_LimbNumber': 13,
+        }, f)
+    for name in ('_crossovers', '_karatsuba', '_toom'):
+        monkeypatch.setattr(dispatch, name, None)
+    reloadTuning(path)
+    assert dispatch._crossovers == {'karatsuba': 3, 'toom3': 5, 'fft': 7}
+    assert dispatch._karatsuba.threshold == 11
+    assert dispatch._toom.threshold == 13
+    assert dispatch._toom.baseMultiplier.threshold == 11
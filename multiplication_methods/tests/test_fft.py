@@ -0,0 +1,201 @@
+import numpy as np
+import pytest
+from ..customnumbers import Complex, ComplexArray
+from ..dft import (
+    DFTct, DFTdirect, DFTmultiply, DFTrealPair, IDFTdirect, IDFTreal, IDFTshortcut,
+    carryDigits, chooseDigitsPerPoint, digitArray, digitString,
+    packDigitArray, unpackDigitArray,
+)
+from .. import fft as fft_module
+from ..fft import *
+
+
+@pytest.mark.parametrize('n,expected', [
+    (0, False), (1, True), (2, True), (3, False), (1024, True), (1025, False),
+])
+def test_isPowerOfTwo(n, expected):
+    assert isPowerOfTwo(n) == expected
+
+@pytest.mark.parametrize('x', [
+    [Complex(1, 0), Complex(0, 0)],
+    [Complex(1, 2), Complex(-3, 4), Complex(5, -6), Complex(7, 8)],
+    [Complex(d, 0) for d in [3, 1, 4, 1, 5, 9, 2, 6]],
+    [Complex(k % 7 - 3, (k*k) % 5) for k in range(64)],
+])
+def test_DFTct_matches_DFTdirect(x):
+    assert DFTct(x) == DFTdirect(x)
+
+@pytest.mark.parametrize('x', [
+    [Complex(1, 2), Complex(-3, 4), Complex(5, -6), Complex(7, 8)],
+    [Complex(k % 7 - 3, (k*k) % 5) for k in range(256)],
+])
+def test_IDFTshortcut_inverts_DFTct(x):
+    assert IDFTshortcut(DFTct(x)) == x
+    assert IDFTshortcut(x) == IDFTdirect(x)
+
+@pytest.mark.parametrize('n', [3, 6, 100])
+def test_fft_ValueError(n):
+    with pytest.raises(ValueError):
+        fft([0.0]*n, [0.0]*n)
+
+@pytest.mark.parametrize('a,b', [
+    (1, 1), (9, 9), (10, 10), (99, 1), (12345, 6789),
+    (43376, 12158), (2**64, 3**40),
+    (7**500, 11**400), (10**999 - 1, 10**1001 - 1),
+])
+def test_DFTmultiply(a, b):
+    assert DFTmultiply(str(a), str(b)) == str(a*b)
+    assert DFTmultiply(str(a)[::-1], str(b)[::-1], stringsReversed=True) == str(a*b)
+
+@pytest.mark.parametrize('a,b', [
+    (12345, 6789), (2**64, 3**40),
+])
+def test_DFTmultiply_direct(a, b):
+    assert DFTmultiply(str(a), str(b), DFTdirect, IDFTdirect) == str(a*b)
+
+def test_getPlan_cached():
+    clearPlanCache()
+    assert getPlan(64) is getPlan(64)
+    assert getPlan(64) is not getPlan(128)
+
+def test_getPlan_evicts_least_recently_used(monkeypatch):
+    clearPlanCache()
+    bound = FFTPlan(256).nbytes + FFTPlan(1024).nbytes
+    monkeypatch.setattr(fft_module, 'MAX_CACHED_PLAN_BYTES', bound)
+    p256 = getPlan(256)
+    getPlan(512)
+    getPlan(256)
+    getPlan(1024)
+    assert getPlan(256) is p256
+    assert 512 not in fft_module._planCache
+    clearPlanCache()
+
+@pytest.mark.parametrize('N', [2, 8, 1024])
+def test_bitReversalSwaps(N):
+    bits = N.bit_length() - 1
+    swaps = bitReversalSwaps(N)
+    pairs = {(swaps[s], swaps[s+1]) for s in range(0, len(swaps), 2)}
+    expected = {
+        (i, int(format(i, '0{}b'.format(bits))[::-1], 2)) for i in range(N)
+    }
+    assert pairs == {(i, j) for i, j in expected if i < j}
+
+def test_fft_plan_length_ValueError():
+    with pytest.raises(ValueError):
+        fft([0.0]*8, [0.0]*8, plan=getPlan(16))
+
+@pytest.mark.parametrize('a,b', [
+    ('1', '1'), ('0', '5'), ('000', '123'), ('9', '9'), ('10', '10'),
+    ('12345', '6789'), ('9'*300, '9'*250), ('1' + '0'*500, '9'*77),
+    (str(7**500), str(11**400)),
+])
+def test_DFTmultiply_numpy_matches_python(a, b):
+    for stringsReversed in (False, True):
+        assert (
+            DFTmultiply(a, b, stringsReversed=stringsReversed, backend='numpy') ==
+            DFTmultiply(a, b, stringsReversed=stringsReversed)
+        )
+
+def test_DFTmultiply_backend_ValueError():
+    with pytest.raises(ValueError):
+        DFTmultiply('1', '2', backend='fortran')
+
+@pytest.mark.parametrize('coeffs', [
+    [0, 0], [9, 9, 9, 1, 0], [10, 9, 9, 9, 0], [123, 45, 6789, 0, 0, 0, 0],
+    [99, 99, 99, 99, 0, 0],
+])
+def test_carryDigits(coeffs):
+    c = carryDigits(np.array(coeffs, dtype=np.int64))
+    value = sum(d*10**i for i, d in enumerate(coeffs))
+    assert ''.join(str(d) for d in c[::-1]).lstrip('0') == (str(value) if value else '')
+    assert ((0 <= c) & (c <= 9)).all()
+
+@pytest.mark.parametrize('s', ['7', '123', '9081726354'])
+def test_digitArray_digitString_roundtrip(s):
+    assert digitString(digitArray(s)) == s
+    assert list(digitArray(s, stringsReversed=True)) == [int(d) for d in s]
+
+@pytest.mark.parametrize('digitsPerPoint', [1, 2, 3, 4])
+@pytest.mark.parametrize('backend', ['python', 'numpy'])
+@pytest.mark.parametrize('a,b', [
+    (1, 1), (9, 9), (12345, 6789), (10**40, 10**3 + 1),
+    (7**500, 11**400), (10**999 - 1, 10**1001 - 1),
+])
+def test_DFTmultiply_digitsPerPoint(a, b, digitsPerPoint, backend):
+    assert DFTmultiply(
+        str(a), str(b), backend=backend, digitsPerPoint=digitsPerPoint
+    ) == str(a*b)
+
+@pytest.mark.parametrize('backend', ['python', 'numpy'])
+def test_DFTmultiply_falls_back_to_smaller_base(backend):
+    a = 10**2000 - 1
+    assert DFTmultiply(str(a), str(a), backend=backend, digitsPerPoint=8) == str(a*a)
+
+@pytest.mark.parametrize('N_1,N_2,expected', [
+    (1, 1, 4), (10**4, 10**4, 4), (10**6, 10**6, 3), (10**6, 10, 4),
+])
+def test_chooseDigitsPerPoint(N_1, N_2, expected):
+    assert chooseDigitsPerPoint(N_1, N_2) == expected
+
+@pytest.mark.parametrize('k', [1, 2, 3, 4])
+def test_packDigitArray_roundtrip(k):
+    digits = np.array([3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5])
+    packed = packDigitArray(digits, k)
+    assert sum(int(c)*10**(k*i) for i, c in enumerate(packed)) == 53562951413
+    assert list(unpackDigitArray(packed.astype(np.int64), k)[:len(digits)]) == list(digits)
+
+@pytest.mark.parametrize('x,y', [
+    ([1, 2], [3, 4]),
+    ([3, 1, 4, 1, 5, 9, 2, 6], [2, 7, 1, 8, 2, 8, 1, 8]),
+    ([k % 7 - 3 for k in range(64)], [(k*k) % 5 for k in range(64)]),
+])
+def test_DFTrealPair(x, y):
+    X, Y = DFTrealPair(x, y)
+    assert X == DFTdirect([Complex(d, 0) for d in x])
+    assert Y == DFTdirect([Complex(d, 0) for d in y])
+
+@pytest.mark.parametrize('x', [
+    [1, 2],
+    [3, 1, 4, 1, 5, 9, 2, 6],
+    [k % 7 - 3 for k in range(64)],
+])
+def test_IDFTreal(x):
+    X = DFTct([Complex(d, 0) for d in x])
+    assert [Complex(d, 0) for d in IDFTreal(X)] == [Complex(d, 0) for d in x]
+
+@pytest.mark.parametrize('N', [1, 2, 8, 256])
+@pytest.mark.parametrize('inverse', [False, True])
+def test_fftArrays_matches_fft(N, inverse):
+    rng = np.random.default_rng(N)
+    re, im = rng.uniform(-1, 1, N), rng.uniform(-1, 1, N)
+    expected_re, expected_im = list(re), list(im)
+    fft(expected_re, expected_im, inverse=inverse)
+    fftArrays(re, im, inverse=inverse)
+    assert np.allclose(re, expected_re) and np.allclose(im, expected_im)
+
+def test_DFTct_returns_ComplexArray():
+    x = [Complex(d, 0) for d in [3, 1, 4, 1, 5, 9, 2, 6]]
+    X = DFTct(x)
+    assert isinstance(X, ComplexArray)
+    assert DFTct(ComplexArray.of(x)) == X
+    assert IDFTshortcut(X) == x
+
+@pytest.mark.parametrize('N', [2, 8, 256])
+def test_real_pair_arrays_match_buffers(N):
+    rng = np.random.default_rng(N)
+    x, y = rng.integers(0, 10, N), rng.integers(0, 10, N)
+    spectra = fftRealPairArrays(x, y)
+    for actual, expected in zip(spectra, fftRealPair(list(x), list(y))):
+        assert np.allclose(actual, expected)
+    assert np.allclose(irfftArrays(spectra[0], spectra[1]), irfft(*fftRealPair(list(x), list(y))[:2]))
+
+def test_DFTmultiply_python_backend_uses_fftArrays(monkeypatch):
+    calls = []
+    original = fft_module.fftArrays
+    def countingFFT(*args, **kwargs):
+        calls.append(len(args[0]))
+        return original(*args, **kwargs)
+    monkeypatch.setattr(fft_module, 'fftArrays', countingFFT)
+    a, b = 3**500, 7**300
+    assert DFTmultiply(str(a), str(b)) == str(a*b)
+    assert calls
@@ -0,0 +1,59 @@
+import pytest
+from .. import testresults
+from ..harness import (
+    MULTIPLIERS, checkCase, generateCase, replayCase, runHarness,
+)
+
+
+def buggyMultiply(x, y):
+    """Correct except when both operands end in 7"""
+    
+    product = str(int(x)*int(y))
+    if x.endswith('7') and y.endswith('7'):
+        return product[:-1] + '0'
+    return product
+
+def test_generateCase_is_reproducible():
+    assert generateCase(12, 1, 500) == generateCase(12, 1, 500)
+    assert generateCase(12, 1, 500) != generateCase(13, 1, 500)
+    for seed in range(50):
+        for operand in generateCase(seed, 5, 20):
+            assert 5 <= len(operand) <= 20 and operand[0] != '0'
+
+@pytest.mark.parametrize('method', sorted(MULTIPLIERS))
+def test_runHarness_passes_methods(method):
+    results = runHarness(method, nCases=40, maxDigits=300, processes=1)
+    assert (results.passed, results.failed) == (40, 0)
+
+@pytest.mark.parametrize('processes', [1, 2])
+def test_runHarness_reports_failing_seeds(processes):
+    results = runHarness(
+        buggyMultiply, nCases=300, maxDigits=30, processes=processes, shardSize=40
+    )
+    seeds = [seed for seed, _ in results.failCases]
+    expected = [
+        seed for seed in range(300)
+        if all(s.endswith('7') for s in generateCase(seed, 1, 30))
+    ]
+    assert seeds == expected and expected
+    assert results.total == 300 and results.failed == len(expected)
+    x, y, product = replayCase(buggyMultiply, seeds[0], 1, 30)
+    assert product != str(int(x)*int(y))
+
+def test_checkCase_reports_exceptions():
+    def failing(x, y):
+        raise ArithmeticError('unsafe rounding')
+    assert checkCase(failing, 0, 1, 10) == 'ArithmeticError: unsafe rounding'
+
+def test_runHarness_rejects_unknown_method():
+    with pytest.raises(ValueError):
+        runHarness('abacus')
+
+def test_TestResults_combine():
+    parts = [
+        testresults.TestResults('a', 3, 1, [(4, 'x')]),
+        testresults.TestResults('b', 5, 2, [(9, 'y'), (11, 'z')]),
+    ]
+    combined = testresults.TestResults.combine('all', parts)
+    assert (combined.passed, combined.failed, combined.total) == (8, 3, 11)
+    assert combined.failCases == [(4, 'x'), (9, 'y'), (11, 'z')]
@@ -0,0 +1,83 @@
+import pytest
+from ..customnumbers import Number, LimbNumber, Rational
+from ..karatsuba import Karatsuba
+from ..toom import ToomCook3
+from ..instrumentation import *
+
+
+X = '31415926535897932384626433832795028841971693993751'
+Y = '27182818284590452353602874713526624977572470936999'
+
+def test_methods_restored_after_exit():
+    originals = {
+        (owner, name): vars(owner)[name]
+        for owner, name in OPERATIONS + RECURSIVE_OPERATIONS + CONSTRUCTORS
+    }
+    with Instrumentation():
+        assert vars(Number)['__add__'] is not originals[(Number, '__add__')]
+    for (owner, name), original in originals.items():
+        assert vars(owner)[name] is original
+
+def test_nothing_recorded_outside_block():
+    with Instrumentation() as profile:
+        pass
+    Karatsuba(threshold=4).multiply(X, Y)
+    assert profile.stats == {}
+
+@pytest.mark.parametrize('numberClass', [Number, LimbNumber])
+def test_results_unchanged(numberClass):
+    with Instrumentation():
+        product = Karatsuba(threshold=4, numberClass=numberClass).multiply(X, Y)
+    assert product == str(int(X)*int(Y))
+
+def test_karatsuba_counts_by_depth():
+    with Instrumentation() as profile:
+        Karatsuba(threshold=4).multiply(X, Y)
+    # 50 digits split to 25, 13, 7, 4: three products per step until depth 4
+    for depth in range(5):
+        assert profile.stats[('Karatsuba._multiply', depth)].calls == 3**depth
+    top = profile.stats[('Karatsuba._multiply', 0)]
+    assert top.digits == len(X) + len(Y)
+    totals = profile.totals()
+    assert totals['Karatsuba._multiply'].calls == sum(3**d for d in range(5))
+    assert totals['Karatsuba._multiply'].seconds == top.seconds
+    assert totals['Karatsuba._multiply'].allocations == top.allocations
+    assert totals['karatsuba.schoolbookMultiply'].calls == 3**4
+    assert totals['Number.__add__'].calls > 0
+    assert totals['Number.ninesComplement'].calls > 0
+
+def test_allocations_counted():
+    with Instrumentation() as profile:
+        Number('123') + Number('456')
+        Rational('1.5')*Rational('2.5')
+    assert profile.totals()['Number.__add__'].allocations == 1
+    assert profile.totals()['Rational.__mul__'].allocations == 1
+
+def test_static_methods_recorded():
+    with Instrumentation() as profile:
+        assert Number.addOne('129', isReversed=False) == '130'
+        assert Number.ninesComplement('123') == '876'
+    assert profile.stats[('Number.addOne', 0)].digits == 3
+    assert profile.stats[('Number.ninesComplement', 0)].calls == 1
+
+def test_toom_depth_includes_karatsuba():
+    with Instrumentation() as profile:
+        ToomCook3(threshold=20, numberClass=LimbNumber).multiply(X, Y)
+    depths = {depth for name, depth in profile.stats if name == 'Karatsuba._multiply'}
+    assert min(depths) == 2
+
+def test_not_reentrant():
+    with Instrumentation():
+        with pytest.raises(RuntimeError):
+            with Instrumentation():
+                pass
+
+def test_report():
+    with Instrumentation() as profile:
+        Karatsuba(threshold=4).multiply(X, Y)
+    lines = profile.report().splitlines()
+    assert lines[0].split() == [
+        'operation', 'depth', 'calls', 'digits', 'allocations', 'seconds'
+    ]
+    assert lines[1].startswith('Karatsuba._multiply')
+    assert len(profile.report(byDepth=True).splitlines()) == len(profile.stats) + 1
@@ -0,0 +1,37 @@
+import pytest
+from ..customnumbers import Number, LimbNumber
+from ..karatsuba import *
+from ..tuning import loadTuning
+
+
+@pytest.mark.parametrize('a,b,base', [
+    ([], [1], 10), ([0], [0], 10), ([9], [9], 10), ([9, 9, 9], [9, 9], 10),
+    ([3, 2, 1], [6, 5, 4], 10), ([999999999, 5], [999999999], 10**9),
+])
+def test_schoolbook(a, b, base):
+    value = lambda digits: sum(d*base**i for i, d in enumerate(digits))
+    assert value(schoolbook(a, b, base)) == value(a)*value(b)
+
+@pytest.mark.parametrize('numberClass', [Number, LimbNumber])
+@pytest.mark.parametrize('a,b', [(0, 5), (7, -8), (-123, -4567), (10**30, 99)])
+def test_schoolbookMultiply(numberClass, a, b):
+    x = numberClass(str(abs(a)), isNegative=(a < 0))
+    y = numberClass(str(abs(b)), isNegative=(b < 0))
+    assert schoolbookMultiply(x, y).asInt() == a*b
+
+@pytest.mark.parametrize('numberClass', [Number, LimbNumber])
+@pytest.mark.parametrize('threshold', [1, 4, 64])
+@pytest.mark.parametrize('a,b', [
+    (0, 0), (1, 1), (43376, 12158), (41687, 58554), (19, 37334),
+    (10**50, 10**49 + 1), (3**300, 7**250), (2**1000 - 1, 12345),
+])
+def test_Karatsuba_multiply(numberClass, threshold, a, b):
+    assert Karatsuba(threshold, numberClass).multiply(str(a), str(b)) == str(a*b)
+
+def test_tuneThreshold(tmp_path):
+    path = str(tmp_path/'tuning.json')
+    best, times = tuneThreshold(
+        LimbNumber, nDigits=200, candidates=(8, 64), repeats=1, path=path
+    )
+    assert best in (8, 64) and set(times) == {8, 64}
+    assert loadTuning(path) == {tuningKey(LimbNumber): best}
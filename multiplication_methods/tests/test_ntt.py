@@ -0,0 +1,59 @@
+import math
+import numpy as np
+import pytest
+from ..ntt import *
+
+
+@pytest.mark.parametrize('p,g', PRIMES)
+def test_PRIMES_primitive_roots(p, g):
+    # p-1 = c*2**e with c in {5, 7, 15, 45}: check g**((p-1)/q) != 1 for q | p-1
+    for q in (2, 3, 5, 7):
+        if (p-1) % q == 0:
+            assert pow(g, (p-1)//q, p) != 1
+
+@pytest.mark.parametrize('N', [1, 2, 8, 256])
+@pytest.mark.parametrize('p,g', PRIMES[:2])
+def test_NTT_matches_definition_and_inverts(N, p, g):
+    a = np.arange(N, dtype=np.int64)*7919 % p
+    w = pow(g, (p-1)//N, p)
+    expected = [
+        sum(int(a[n])*pow(w, k*n, p) for n in range(N)) % p for k in range(N)
+    ] if N <= 8 else None
+    A = NTT(a, p, g)
+    if expected is not None:
+        assert list(A) == expected
+    assert list(INTT(A, p, g)) == list(a)
+
+def test_NTT_ValueError():
+    with pytest.raises(ValueError):
+        NTT([0]*6, *PRIMES[0])
+
+@pytest.mark.parametrize('N,largestCoefficient,nPrimes', [
+    (8, 10, 1), (8, PRIMES[0][0], 2), (2**25, 10, 1), (2**25, 2**40, 2), (2**16, 10**30, 4),
+])
+def test_choosePrimes(N, largestCoefficient, nPrimes):
+    assert len(choosePrimes(N, largestCoefficient)) == nPrimes
+
+def test_choosePrimes_ValueError():
+    with pytest.raises(ValueError):
+        choosePrimes(2**28, 10)
+
+@pytest.mark.parametrize('moduli', [PRIMES[:1], PRIMES[:2], PRIMES[:3]])
+def test_CRT(moduli):
+    moduli = [p for p, _ in moduli]
+    values = [0, 1, 12345678901234567, math.prod(moduli) - 1]
+    values = [v % math.prod(moduli) for v in values]
+    residues = [np.array([v % m for v in values], dtype=np.int64) for m in moduli]
+    assert [int(c) for c in CRT(residues, moduli)] == values
+
+@pytest.mark.parametrize('digitsPerPoint', [1, 4, 6, 9])
+@pytest.mark.parametrize('a,b', [
+    (1, 1), (0, 5), (9, 9), (12345, 6789), (10**40, 10**3 + 1),
+    (7**500, 11**400), (10**1999 - 1, 10**2001 - 1),
+])
+def test_NTTmultiply(a, b, digitsPerPoint):
+    expected = str(a*b) if a*b else ''
+    assert NTTmultiply(str(a), str(b), digitsPerPoint=digitsPerPoint) == expected
+    assert NTTmultiply(
+        str(a)[::-1], str(b)[::-1], stringsReversed=True, digitsPerPoint=digitsPerPoint
+    ) == expected
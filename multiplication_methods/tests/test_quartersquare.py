@@ -0,0 +1,48 @@
+import random
+import pytest
+from .. import quartersquare
+from ..quartersquare import *
+
+
+@pytest.mark.parametrize('a,b', [
+    (43376, 12158), (41687, 58554), (55303, 342), (6207, 63819),
+    (29420, 39481), (19, 37334), (0, 5), (99999, 100000),
+    (-7, 8), (-7, -8), (123456789, 987654321), (10**30 + 7, 3**40),
+])
+def test_QSMultiplier_multiply(a, b):
+    assert QSMultiplier().multiply(a, b) == a*b
+
+@pytest.mark.parametrize('tableSize,limbDigits', [
+    (19, 1), (198, 1), (199, 2), (2000, 3), (DEFAULT_TABLE_SIZE, 5), (10**7, 5),
+])
+def test_QSMultiplier_limbDigits(tableSize, limbDigits):
+    assert QSMultiplier(tableSize).limbDigits == limbDigits
+
+def test_QSMultiplier_rejects_small_table():
+    with pytest.raises(ValueError):
+        QSMultiplier(18)
+
+def test_table_is_built_lazily():
+    quarterSquareTable.cache_clear()
+    q = QSMultiplier(1234)
+    assert quarterSquareTable.cache_info().currsize == 0
+    assert q.multiply(3, 4) == 12
+    assert list(q.table[:6]) == [0, 0, 1, 2, 4, 6]
+    assert len(q.table) == 1234
+
+@pytest.mark.parametrize('tableSize', [19, 500, DEFAULT_TABLE_SIZE])
+@pytest.mark.parametrize('seed', range(5))
+def test_QSMultiplier_multiplyStrings(tableSize, seed, unlimitedIntDigits):
+    rng = random.Random(seed)
+    x = str(rng.randrange(10**rng.randrange(1, 3000)))
+    y = str(rng.randrange(10**rng.randrange(1, 3000)))
+    assert QSMultiplier(tableSize).multiplyStrings(x, y) == str(int(x)*int(y))
+
+@pytest.mark.parametrize('x,y', [('0', '0'), ('9'*50, '9'*70), ('1' + '0'*40, '7')])
+def test_QSMultiplier_multiplyStrings_edge_cases(x, y):
+    assert QSMultiplier(199).multiplyStrings(x, y) == str(int(x)*int(y))
+
+def test_multiplyLimbs_in_several_blocks(monkeypatch):
+    monkeypatch.setattr(quartersquare, 'MAX_SCRATCH_ENTRIES', 64)
+    x, y = '9'*400, '8'*300
+    assert QSMultiplier().multiplyStrings(x, y) == str(int(x)*int(y))
@@ -0,0 +1,62 @@
+import pytest
+from .. import streaming
+from ..streaming import *
+
+
+def writeOperand(tmp_path, name, text):
+    path = tmp_path/name
+    path.write_bytes(text.encode('ascii'))
+    return str(path)
+
+@pytest.mark.parametrize('blockDigits', [3, 16, 256])
+@pytest.mark.parametrize('a,b', [
+    (0, 0), (0, 12345), (1, 1), (9, 9), (43376, 12158), (10**40, 10**3 + 1),
+    (7**200, 11**150), (10**999 - 1, 10**301 - 1),
+])
+def test_multiplyFiles(tmp_path, a, b, blockDigits):
+    x = writeOperand(tmp_path, 'x.txt', str(a))
+    y = writeOperand(tmp_path, 'y.txt', str(b))
+    out = str(tmp_path/'out.txt')
+    n = multiplyFiles(x, y, out, blockDigits=blockDigits)
+    product = (tmp_path/'out.txt').read_text()
+    assert product == str(a*b)
+    assert n == len(product)
+
+def test_multiplyFiles_whitespace_and_leading_zeros(tmp_path):
+    x = writeOperand(tmp_path, 'x.txt', '  000123\n')
+    y = writeOperand(tmp_path, 'y.txt', '0456\r\n')
+    out = str(tmp_path/'out.txt')
+    multiplyFiles(x, y, out, blockDigits=2)
+    assert (tmp_path/'out.txt').read_text() == str(123*456)
+
+def test_multiplyFiles_strips_many_leading_zeros(tmp_path, monkeypatch):
+    monkeypatch.setattr(streaming, 'COPY_CHUNK_BYTES', 3)
+    x = writeOperand(tmp_path, 'x.txt', '0'*50 + '7')
+    y = writeOperand(tmp_path, 'y.txt', '0'*20 + '98765')
+    out = str(tmp_path/'out.txt')
+    assert streaming.multiplyFiles(x, y, out, blockDigits=4) == 6
+    assert (tmp_path/'out.txt').read_text() == str(7*98765)
+
+@pytest.mark.parametrize('blockDigits', [1, 2, 3])
+def test_multiplyFiles_multidigit_carry(tmp_path, monkeypatch, blockDigits):
+    # All-9 operands make each block overflow by several digits
+    overflows = []
+    def recordingCarry(c):
+        digits = carryDigits(c)
+        overflows.append(int(''.join(map(str, digits[blockDigits:][::-1]))))
+        return digits
+    monkeypatch.setattr(streaming, 'carryDigits', recordingCarry)
+    a, b = 10**60 - 1, 10**45 - 1
+    x = writeOperand(tmp_path, 'x.txt', str(a))
+    y = writeOperand(tmp_path, 'y.txt', str(b))
+    out = str(tmp_path/'out.txt')
+    streaming.multiplyFiles(x, y, out, blockDigits=blockDigits)
+    assert (tmp_path/'out.txt').read_text() == str(a*b)
+    assert max(overflows) >= 10
+
+@pytest.mark.parametrize('text', ['', '  \n', '12a4', '-12'])
+def test_multiplyFiles_ValueError(tmp_path, text):
+    x = writeOperand(tmp_path, 'x.txt', text)
+    y = writeOperand(tmp_path, 'y.txt', '12')
+    with pytest.raises(ValueError):
+        multiplyFiles(x, y, str(tmp_path/'out.txt'))
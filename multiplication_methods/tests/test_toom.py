@@ -0,0 +1,25 @@
+import pytest
+from ..customnumbers import Number, LimbNumber
+from ..toom import *
+
+
+@pytest.mark.parametrize('numberClass', [Number, LimbNumber])
+@pytest.mark.parametrize('a,d', [(0, 3), (6, 2), (-6, 3), (10**30, 2), (3*(10**40 + 7), 3)])
+def test_exactDivide(numberClass, a, d):
+    x = numberClass(str(abs(a)), isNegative=(a < 0))
+    assert x.exactDivide(d).asInt() == a//d
+
+@pytest.mark.parametrize('numberClass', [Number, LimbNumber])
+def test_exactDivide_ValueError(numberClass):
+    with pytest.raises(ValueError):
+        numberClass('7').exactDivide(2)
+
+@pytest.mark.parametrize('numberClass', [Number, LimbNumber])
+@pytest.mark.parametrize('threshold', [3, 10, 300])
+@pytest.mark.parametrize('a,b', [
+    (0, 0), (1, 1), (43376, 12158), (19, 37334),
+    (10**50, 10**49 + 1), (3**300, 7**250), (2**1000 - 1, 12345),
+    (10**120 - 1, 10**119 - 1),
+])
+def test_ToomCook3_multiply(numberClass, threshold, a, b):
+    assert ToomCook3(threshold, numberClass).multiply(str(a), str(b)) == str(a*b)
@@ -0,0 +1,110 @@
+"""
+Toom-Cook 3-way multiplication of decimal strings
+
+Each operand is split into three parts, x = x2*B**2 + x1*B + x0 with
+B = 10**m, and viewed as a quadratic polynomial in B. The product
+polynomial (degree 4) is found from its values at 0, 1, -1, -2 and
+infinity, which takes five recursive products instead of the nine of
+the grid method. Interpolation follows Bodrato's sequence, which needs
+only exact division by 2 and 3.
+"""
+
+
+from math import ceil
+try:
+    from .customnumbers import Number
+    from .karatsuba import Karatsuba
+    from .tuning import getTuning
+except ImportError:
+    from customnumbers import Number
+    from karatsuba import Karatsuba
+    from tuning import getTuning
+
+
+DEFAULT_THRESHOLD = 300
+
+
+class ToomCook3():
+    
+    def __init__(self, threshold=None, numberClass=Number, tuningPath=None):
+        """
+        Args:
+        -- threshold: operands with at most this many digits are multiplied
+           by Karatsuba; defaults to the tuned value for numberClass
+        -- numberClass: Number or LimbNumber, the integer representation used
+        -- tuningPath: tuning file read for default thresholds (default
+           tuning.TUNING_FILE)
+        """
+        
+        if threshold is None:
+            threshold = getTuning(
+                'toom3_threshold_' + numberClass.__name__, DEFAULT_THRESHOLD,
+                tuningPath
+            )
+        self.threshold = threshold
+        self.numberClass = numberClass
+        self.baseMultiplier = Karatsuba(numberClass=numberClass, tuningPath=tuningPath)
+    
+    def multiply(self, xString, yString):
+        """
+        Multiply decimal strings by Toom-Cook 3-way multiplication
+        
+        Args: 
+        -- xString, yString: decimal strings (in usual order) of positive integers to multiply
+        
+        Returns: decimal string (in usual order) of the product
+        """
+        
+        x = self.numberClass(xString)
+        y = self.numberClass(yString)
+        return str(self._multiply(x, y))
+    
+    def _multiply(self, x, y):
+        """Recursively multiply Numbers x, y (implement Toom-3 algorithm)"""
+        
+        Lx, Ly = len(x), len(y)
+        
+        # Base of induction; small operands go to Karatsuba
+        if min(Lx, Ly) <= self.threshold:
+            return self.baseMultiplier._multiply(x, y)
+        
+        # Split into three parts of m = ceil( max(len(x),len(y)) / 3 ) digits
+        m = ceil(max(Lx, Ly)/3)
+        x0, x12 = x.decimalDecompose(m)
+        x1, x2 = x12.decimalDecompose(m)
+        y0, y12 = y.decimalDecompose(m)
+        y1, y2 = y12.decimalDecompose(m)
+        
+        # Evaluate at 0, 1, -1, -2, infinity and recursively multiply values
+        r0 = self._multiply(x0, y0)
+        r1, rm1, rm2 = [
+            self._multiply(a, b)
+            for a, b in zip(self._evaluate(x0, x1, x2), self._evaluate(y0, y1, y2))
+        ]
+        rinf = self._multiply(x2, y2)
+        
+        # Interpolate coefficients of the product polynomial
+        c3 = (rm2 - r1).exactDivide(3)
+        c1 = (r1 - rm1).exactDivide(2)
+        c2 = rm1 - r0
+        c3 = (c2 - c3).exactDivide(2) + rinf + rinf
+        c2 = c2 + c1 - rinf
+        c1 = c1 - c3
+        
+        # Recombine with powers of 10**m
+        c1.multiplyTenPower(m)
+        c2.multiplyTenPower(2*m)
+        c3.multiplyTenPower(3*m)
+        rinf.multiplyTenPower(4*m)
+        return r0 + c1 + c2 + c3 + rinf
+    
+    @staticmethod
+    def _evaluate(p0, p1, p2):
+        """Return values at 1, -1, -2 of polynomial p2*t**2 + p1*t + p0"""
+        
+        s = p0 + p2
+        at1 = s + p1
+        atm1 = s - p1
+        t = atm1 + p2
+        atm2 = t + t - p0
+        return at1, atm1, atm2
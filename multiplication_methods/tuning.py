@@ -0,0 +1,55 @@
+"""
+Persisted, machine-specific tuning parameters for multiplication methods
+
+Values measured by the tuning routines are stored as JSON in TUNING_FILE
+(overridable with the MULTIPLICATION_TUNING_FILE environment variable)
+so later sessions on the same machine can reuse them.
+"""
+
+
+import json
+import os
+import time
+
+
+TUNING_FILE = os.environ.get(
+    'MULTIPLICATION_TUNING_FILE',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tuning.json')
+)
+
+
+def loadTuning(path=None):
+    """Return dict of persisted tuning values (empty if none saved)"""
+    
+    path = path or TUNING_FILE
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+    
+def getTuning(key, default, path=None):
+    """Return persisted value for key, or default if not tuned"""
+    
+    return loadTuning(path).get(key, default)
+    
+def saveTuning(key, value, path=None):
+    """Persist value under key, keeping other saved values"""
+    
+    path = path or TUNING_FILE
+    values = loadTuning(path)
+    values[key] = value
+    tmpPath = path + '.tmp'
+    with open(tmpPath, 'w') as f:
+        json.dump(values, f, indent=2, sort_keys=True)
+    os.replace(tmpPath, path)
+    
+def bestTime(fn, *args, repeats=3):
+    """Return the shortest wall time in seconds of repeats calls fn(*args)"""
+    
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(*args)
+        times.append(time.perf_counter() - start)
+    return min(times)